@@ -2,6 +2,7 @@ from hexital.analysis import movement, patterns  # noqa F401
 from hexital.core.candle import Candle  # noqa F401
 from hexital.core.hexital import Hexital, HexitalCol  # noqa F401
 from hexital.core.indicator_collection import IndicatorCollection  # noqa F401
+from hexital.core.universe import HexitalUniverse  # noqa F401
 from hexital.indicators import *  # noqa F401
 from hexital.utils import TimeFrame  # noqa F401
 from hexital.core.indicator import Indicator  # noqa F401
@@ -18,6 +18,8 @@ def _retrieve_candles(
     if isinstance(obj, list):
         return obj
     elif isinstance(obj, Indicator):
+        if obj._stale:
+            obj._refresh()
         return obj.candles
     elif isinstance(obj, Hexital) and not indicator and not indicator_cmp:
         return obj.candles(DEFAULT_CANDLES)
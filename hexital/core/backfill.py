@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
+
+from hexital.core import Reading
+from hexital.core.candle import Candle
+from hexital.core.candle_manager import CandleManager
+from hexital.core.candle_store import CandleStore
+from hexital.core.hexital import Hexital
+from hexital.core.indicator import Indicator, IndicatorMode
+from hexital.utils.vectorized import CANDLE_FIELDS
+
+# Default amount of Candles calculated by each chunk
+BACKFILL_CHUNK = 50000
+
+# Fields controlled by the parent's Candle Manager, chunks are calculated on it's Candles as is
+_MANAGER_SETTINGS = (
+    "candles",
+    "timeframe",
+    "timeframe_fill",
+    "candle_life",
+    "max_candles",
+    "candlestick",
+)
+
+ChunkReadings = Tuple[Dict[str, List[Reading]], Dict[str, List[Reading]]]
+
+
+def group_warmup(indicators: List[Indicator]) -> Optional[int]:
+    """Warmup of Indicators sharing Candles, the sum of their warmups when any Indicator reads
+    another's readings, otherwise the largest. None if any is unbounded or has an unknown source,
+    a single such Indicator leaves the whole group to the sequential calculation"""
+    warmups = []
+    chained = False
+
+    for indicator in indicators:
+        source = getattr(indicator, "source", "close")
+        if not isinstance(source, str):
+            return None
+        chained = chained or source not in CANDLE_FIELDS
+
+        warmup = indicator.warmup()
+        if warmup is None:
+            return None
+        warmups.append(warmup)
+
+    return sum(warmups) if chained else max(warmups, default=0)
+
+
+def chunk_ranges(start: int, end: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """Splits start -> end into consecutive ranges of at most chunk_size"""
+    return [(index, min(index + chunk_size, end)) for index in range(start, end, chunk_size)]
+
+
+def calculate_chunk(settings: dict, rows: List[list], warmup: int) -> ChunkReadings:
+    """Calculates the Indicators on the chunk's Candles, returning every reading after the warmup
+    rows as columns of indicators and sub indicators"""
+    hexital = Hexital(**settings, candles=Candle.from_lists(rows))
+    hexital.calculate()
+
+    indicators: Dict[str, List[Reading]] = {}
+    sub_indicators: Dict[str, List[Reading]] = {}
+
+    for root in hexital.indicators.values():
+        for indicator in root.tree():
+            column = indicators if indicator._mode == IndicatorMode.SOLO else sub_indicators
+            column[indicator.name] = indicator.readings()[warmup:]
+
+    return indicators, sub_indicators
+
+
+def _chunk_settings(indicator: Indicator) -> dict:
+    settings = {"indicator": type(indicator).__name__}
+    for field_ in fields(indicator):
+        if field_.init and field_.name not in _MANAGER_SETTINGS:
+            settings[field_.name] = getattr(indicator, field_.name)
+    return settings
+
+
+def _write_readings(candles: List[Candle], readings: ChunkReadings, start: int):
+    for sub, column in enumerate(readings):
+        for name, values in column.items():
+            if isinstance(candles, CandleStore):
+                candles.set_readings(name, values, start, bool(sub))
+                continue
+
+            for candle, reading in zip(candles[start : start + len(values)], values):
+                if sub:
+                    candle.sub_indicators[name] = reading
+                else:
+                    candle.indicators[name] = reading
+
+
+def backfill(hexital: Hexital, workers: Optional[int] = None, chunk_size: int = BACKFILL_CHUNK):
+    """Calculates the missing readings of a `Hexital` in parallel chunks of Candles.
+
+    Indicators are grouped by their Candles, each chunk of a group is calculated in a worker
+    process, starting it's warmup worth of Candles early so the readings converge, before they're
+    stitched back. Groups without a known warmup, candlestick Candles or only a single chunk of
+    Candles are left to the sequential calculation, which also picks up any remaining readings.
+    A group has no known warmup if any one of it's Indicators doesn't, E.G OBV.
+
+    Args:
+        hexital: The `Hexital` to backfill
+        workers: Amount of worker processes, defaults to the CPU count, 0 to run in process
+        chunk_size: Amount of Candles calculated by each chunk
+    """
+    groups: Dict[int, Tuple[CandleManager, List[Indicator]]] = {}
+    for indicator in hexital.indicators.values():
+        manager = indicator.candle_manager
+        groups.setdefault(id(manager), (manager, []))[1].append(indicator)
+
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    executor = ProcessPoolExecutor(workers) if workers else None
+
+    try:
+        for manager, indicators in groups.values():
+            warmup = group_warmup(indicators)
+            candles = manager.candles
+            if warmup is None or manager.candlestick is not None:
+                continue
+
+            for indicator in indicators:
+                indicator.check_initialised()
+            start = min(indicator._find_calc_index() for indicator in indicators)
+
+            chunks = chunk_ranges(start, len(candles), chunk_size)
+            if len(chunks) < 2:
+                continue
+
+            chunk_settings = {
+                "name": hexital.name,
+                "columnar": hexital.columnar,
+                "indicators": [_chunk_settings(indicator) for indicator in indicators],
+            }
+            warmups = [min(warmup, index) for index, _ in chunks]
+            rows = [
+                [candle.as_list() for candle in candles[index - warmup_ : end]]
+                for (index, end), warmup_ in zip(chunks, warmups)
+            ]
+
+            mapper = executor.map if executor else map
+            results = mapper(calculate_chunk, repeat(chunk_settings), rows, warmups)
+            for (index, _), readings in zip(chunks, results):
+                _write_readings(candles, readings, index)
+
+            for indicator in indicators:
+                indicator._set_bulk_active_index(len(candles) - 1)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    hexital.calculate()
@@ -11,22 +11,48 @@ from hexital.utils.timeframe import (
     convert_timeframe_to_timedelta,
 )
 
+TIME_KEYS = frozenset(["timestamp", "Timestamp", "time", "Time", "date", "Date"])
+
+
+def _dict_value(candle: Dict[str, Any], key: str, alt_key: str, default: Any) -> Any:
+    if key in candle:
+        return candle[key]
+    return candle.get(alt_key, default)
+
 
 class Candle:
+    __slots__ = (
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "timestamp",
+        "timeframe",
+        "aggregation_factor",
+        "tag",
+        "_indicators",
+        "_sub_indicators",
+        "_refs",
+        "_start_timestamp",
+        "_end_timestamp",
+        "__weakref__",
+    )
+
     open: float
     high: float
     low: float
     close: float
     volume: int
     timestamp: Optional[datetime]
-    indicators: Dict[str, Reading]
-    sub_indicators: Dict[str, Reading]
     timeframe: Optional[timedelta]
     aggregation_factor: int
-    tag: Optional[str] = None
-    refs: Dict[str, Sequence | None]
-    _start_timestamp: Optional[datetime] = None
-    _end_timestamp: Optional[datetime] = None
+    tag: Optional[str]
+    _indicators: Optional[Dict[str, Reading]]
+    _sub_indicators: Optional[Dict[str, Reading]]
+    _refs: Optional[Dict[str, Sequence | None]]
+    _start_timestamp: Optional[datetime]
+    _end_timestamp: Optional[datetime]
 
     def __init__(
         self,
@@ -57,27 +83,87 @@ class Candle:
         else:
             self.timestamp = None
 
-        self.refs = {}
-        self.indicators = indicators if indicators else {}
-        self.sub_indicators = sub_indicators if sub_indicators else {}
+        self._refs = None
+        self._indicators = indicators if indicators else None
+        self._sub_indicators = sub_indicators if sub_indicators else None
+        self._start_timestamp = None
+        self._end_timestamp = None
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Candle):
             return False
-        for key in set().union(self.__dict__.keys(), other.__dict__.keys()):
-            if key in ["_start_timestamp", "_end_timestamp", "timeframe"]:
-                local = getattr(self, key)
-                remote = getattr(other, key)
-                if remote is not None and local is not None and remote != local:
-                    return False
-            elif key.startswith("_"):
-                continue
-            elif getattr(self, key) != getattr(other, key):
+        for key in ["_start_timestamp", "_end_timestamp", "timeframe"]:
+            local = getattr(self, key)
+            remote = getattr(other, key)
+            if remote is not None and local is not None and remote != local:
+                return False
+        for key in [
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+            "timestamp",
+            "tag",
+            "aggregation_factor",
+        ]:
+            if getattr(self, key) != getattr(other, key):
+                return False
+        for key in ["_indicators", "_sub_indicators", "_refs"]:
+            if (getattr(self, key) or {}) != (getattr(other, key) or {}):
                 return False
         return True
 
     def __repr__(self) -> str:
-        return str({name: value for name, value in vars(self).items() if not name.startswith("_")})
+        return str(
+            {
+                "open": self.open,
+                "high": self.high,
+                "low": self.low,
+                "close": self.close,
+                "volume": self.volume,
+                "timeframe": self.timeframe,
+                "tag": self.tag,
+                "aggregation_factor": self.aggregation_factor,
+                "timestamp": self.timestamp,
+                "refs": self._refs or {},
+                "indicators": self._indicators or {},
+                "sub_indicators": self._sub_indicators or {},
+            }
+        )
+
+    @property
+    def indicators(self) -> Dict[str, Reading]:
+        """Indicator readings of the Candle, the dict is only allocated once used"""
+        if self._indicators is None:
+            self._indicators = {}
+        return self._indicators
+
+    @indicators.setter
+    def indicators(self, indicators: Optional[Dict[str, Reading]]):
+        self._indicators = indicators if indicators else None
+
+    @property
+    def sub_indicators(self) -> Dict[str, Reading]:
+        """Sub Indicator readings of the Candle, the dict is only allocated once used"""
+        if self._sub_indicators is None:
+            self._sub_indicators = {}
+        return self._sub_indicators
+
+    @sub_indicators.setter
+    def sub_indicators(self, sub_indicators: Optional[Dict[str, Reading]]):
+        self._sub_indicators = sub_indicators if sub_indicators else None
+
+    @property
+    def refs(self) -> Dict[str, Sequence | None]:
+        """References to derived Candles, the dict is only allocated once used"""
+        if self._refs is None:
+            self._refs = {}
+        return self._refs
+
+    @refs.setter
+    def refs(self, refs: Optional[Dict[str, Sequence | None]]):
+        self._refs = refs if refs else None
 
     @property
     def positive(self) -> bool:
@@ -181,21 +267,18 @@ class Candle:
         Returns:
             Candle: A `Candle` object initialized with the provided dictionary data.
         """
-        time = [
-            v
-            for k, v in candle.items()
-            if k in ["timestamp", "Timestamp", "time", "Time", "date", "Date"]
-        ]
+        timestamp = next((v for k, v in candle.items() if k in TIME_KEYS), None)
+
         return cls(
-            candle.get("open", candle.get("Open", 0.0)),
-            candle.get("high", candle.get("High", 0.0)),
-            candle.get("low", candle.get("Low", 0.0)),
-            candle.get("close", candle.get("Close", 0.0)),
-            candle.get("volume", candle.get("Volume", 0)),
-            indicators=candle.get("indicators", {}),
-            sub_indicators=candle.get("sub_indicators", {}),
-            timestamp=time[0] if time else None,
-            timeframe=candle.get("timeframe", candle.get("Timeframe")),
+            _dict_value(candle, "open", "Open", 0.0),
+            _dict_value(candle, "high", "High", 0.0),
+            _dict_value(candle, "low", "Low", 0.0),
+            _dict_value(candle, "close", "Close", 0.0),
+            _dict_value(candle, "volume", "Volume", 0),
+            indicators=candle.get("indicators"),
+            sub_indicators=candle.get("sub_indicators"),
+            timestamp=timestamp,
+            timeframe=_dict_value(candle, "timeframe", "Timeframe", None),
         )
 
     @classmethod
@@ -242,27 +325,32 @@ class Candle:
         """
         timestamp = None
         timeframe = None
-        indicators = {}
-        sub_indicators = {}
-
-        if len(candle) > 5 and (isinstance(candle[0], (str, datetime)) or candle[0] is None):
-            timestamp = candle.pop(0)
-        if len(candle) > 5 and isinstance(candle[-1], (str, int, TimeFrame, timedelta)):
-            timeframe = candle.pop(-1)
-        if len(candle) > 5 and isinstance(candle[-1], dict):
-            sub_indicators = candle.pop(-1)
-            indicators = candle.pop(-1)
+        indicators = None
+        sub_indicators = None
+
+        start = 0
+        end = len(candle)
+
+        if end > 5 and (candle[0] is None or isinstance(candle[0], (str, datetime))):
+            timestamp = candle[0]
+            start = 1
+        if end - start > 5 and isinstance(candle[end - 1], (str, int, TimeFrame, timedelta)):
+            timeframe = candle[end - 1]
+            end -= 1
+        if end - start > 5 and isinstance(candle[end - 1], dict):
+            sub_indicators = candle[end - 1]
+            indicators = candle[end - 2]
 
         return cls(
-            open=candle[0],
-            high=candle[1],
-            low=candle[2],
-            close=candle[3],
-            volume=candle[4],
-            indicators=indicators,
-            sub_indicators=sub_indicators,
+            candle[start],
+            candle[start + 1],
+            candle[start + 2],
+            candle[start + 3],
+            candle[start + 4],
             timestamp=timestamp,
             timeframe=timeframe,
+            indicators=indicators,
+            sub_indicators=sub_indicators,
         )
 
     @classmethod
@@ -288,7 +376,15 @@ class Candle:
         return [cls.from_list(candle) for candle in candles]
 
     def clean_copy(self) -> Candle:
-        candle = Candle.from_list(self.as_list())
+        candle = Candle(
+            self.open,
+            self.high,
+            self.low,
+            self.close,
+            self.volume,
+            timestamp=self.timestamp,
+            timeframe=self.timeframe,
+        )
         candle.aggregation_factor = self.aggregation_factor
         return candle
 
@@ -298,9 +394,9 @@ class Candle:
         self.timestamp = timestamp
 
     def reset_candle(self):
-        self.indicators = {}
-        self.sub_indicators = {}
-        self.refs = {}
+        self._indicators = None
+        self._sub_indicators = None
+        self._refs = None
         self.tag = None
 
     def merge(self, candle: Candle):
@@ -360,7 +456,7 @@ class Candle:
         elif (
             self._start_timestamp
             and self._end_timestamp
-            and self._start_timestamp > candle.timestamp > self._end_timestamp
+            and self._start_timestamp < candle.timestamp < self._end_timestamp
         ):
             pass
         else:
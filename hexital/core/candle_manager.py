@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, tzinfo
 from functools import cmp_to_key
-from typing import List, Optional, Set, TypeAlias
+from operator import attrgetter
+from typing import List, Optional, Sequence, Set, Tuple, TypeAlias
 
 from hexital.core.candle import Candle
+from hexital.core.candle_store import CandleStore, micro_to_timestamp
 from hexital.core.candlestick_type import CandlestickType
-from hexital.exceptions import InvalidCandleOrder
+from hexital.core.trade_bucket import TradeBucket
+from hexital.exceptions import BufferHeld, InvalidCandleOrder, InvalidConfiguration
 from hexital.utils.candles import reading_by_candle
 from hexital.utils.common import CalcMode
 from hexital.utils.timeframe import (
     on_timeframe,
     round_down_timestamp,
     timedelta_to_str,
+    timeframe_end,
     trim_timestamp,
 )
 
@@ -20,14 +26,29 @@ Candles: TypeAlias = Candle | List[Candle] | dict | List[dict] | list | List[lis
 
 DEFAULT_CANDLES = "default"
 
+# Extra Candles kept beyond the lookback of the Indicators, with automatic retention
+RETENTION_MARGIN = 10
+
 
 class CandleManager:
     _name: Optional[str] = None
-    _candles: List[Candle]
+    _candles: List[Candle] | CandleStore
     candle_life: Optional[timedelta]
+    max_candles: Optional[int] = None
+    retention: Optional[int] = None
     timeframe: Optional[timedelta] = None
     timeframe_fill: bool = False
     candlestick: Optional[CandlestickType] = None
+    columnar: bool = False
+    trade_refresh: Optional[timedelta] = None
+
+    _trades: Optional[TradeBucket] = None
+    _source: Optional[CandleManager] = None
+    _revision: int = 0
+    _trimmed: int = 0
+    _synced: Optional[Tuple[int, int]] = None
+    _settled: int = 0
+    _settled_values: Optional[list] = None
 
     def __init__(
         self,
@@ -36,11 +57,21 @@ class CandleManager:
         timeframe: Optional[timedelta] = None,
         timeframe_fill: bool = False,
         candlestick: Optional[CandlestickType] = None,
+        columnar: bool = False,
+        max_candles: Optional[int] = None,
+        trade_refresh: Optional[timedelta] = None,
     ):
         self.candle_life = candle_life
+        self.max_candles = max_candles
+        self.trade_refresh = trade_refresh
         self.timeframe = timeframe
         self.timeframe_fill = timeframe_fill
-        self._candles = candles if candles else []
+        self.columnar = columnar
+
+        if columnar:
+            self._candles = CandleStore(candles)
+        else:
+            self._candles = candles if candles else []
 
         if candlestick:
             self.candlestick = candlestick
@@ -53,7 +84,15 @@ class CandleManager:
         if not isinstance(other, CandleManager):
             return False
 
-        for key in ["candle_life", "timeframe", "timeframe_fill", "candlestick"]:
+        for key in [
+            "candle_life",
+            "max_candles",
+            "timeframe",
+            "timeframe_fill",
+            "candlestick",
+            "columnar",
+            "trade_refresh",
+        ]:
             if getattr(self, key) != getattr(other, key):
                 return False
 
@@ -85,15 +124,162 @@ class CandleManager:
     @candles.setter
     def candles(self, candles: List[Candle]):
         """Set the Candles in Candlestick manager and reset transformed Candles"""
+        if self.columnar and not isinstance(candles, CandleStore):
+            candles = CandleStore(candles)
         self._candles = candles
+        self._revision += 1
         if self.candlestick:
             self.candlestick.derived_candles.reset()
 
+    @property
+    def source(self) -> Optional[CandleManager]:
+        """The lower timeframe manager these Candles are derived from, if any"""
+        return self._source
+
+    def derivable_from(self, manager: CandleManager) -> bool:
+        """Whether these timeframe Candles can be derived by merging the manager's Candles,
+        it's timeframe must be lower and evenly divide this timeframe"""
+        if (
+            manager is self
+            or not self.timeframe
+            or self.timeframe >= timedelta(days=1)
+            or self.timeframe_fill
+            or manager.timeframe_fill
+        ):
+            return False
+        if not manager.timeframe:
+            return True
+        return manager.timeframe <= self.timeframe and not self.timeframe % manager.timeframe
+
+    def derive_from(self, manager: CandleManager):
+        """Derives these Candles from the given lower timeframe manager, in a single pass.
+        Afterwards `sync` merges in only the latest of it's Candles"""
+        self._source = manager
+        self.sync()
+
+    def sync(self):
+        """Merges the source manager's latest Candles into these Candles.
+
+        Source Candles before it's latest are settled, as appending only changes the latest.
+        The settled Candles within the latest timeframe are kept merged, so each source Candle
+        is merged once. After a prepend or insert, the latest Candle is re-built instead"""
+        self.check_buffers()
+        if self._source is None or not self._source._candles:
+            return
+
+        source = self._source._candles
+        revisions = (self._source._revision, self._revision)
+        latest = self._candles[-1].timestamp if self._candles else None
+
+        start = self._settled - self._source._trimmed
+        if self._synced == revisions and 0 <= start < len(source):
+            merged = [list(self._settled_values)] if self._settled_values else []
+        else:
+            start = len(source)
+            if latest is not None:
+                lower = latest - self.timeframe
+                while start > 0 and source[start - 1].timestamp > lower:
+                    start -= 1
+            else:
+                start = 0
+            merged = []
+            if start >= len(source):
+                return
+
+        for index in range(start, len(source) - 1):
+            self._merge_candle(merged, source[index], latest)
+
+        count = len(merged)
+        settled = list(merged[-1]) if merged else None
+        self._merge_candle(merged, source[-1], latest)
+
+        self._settled_values = settled if len(merged) == count else None
+        self._settled = self._source._trimmed + len(source) - 1
+        self._synced = revisions
+
+        if not merged:
+            return
+
+        index = len(self._candles) - 1 if len(self._candles) > 0 else 0
+
+        if self._candles and merged[0][5] == latest:
+            self._write_candle(self._candles[-1], merged.pop(0))
+        for values in merged:
+            candle = Candle(*values[:5], timestamp=values[5], timeframe=self.timeframe)
+            self._write_candle(candle, values)
+            self._candles.append(candle)
+
+        self.candlestick_conversion(CalcMode.APPEND, index)
+        self.trim_candles()
+
+    def _merge_candle(self, merged: List[list], candle: Candle, latest: Optional[datetime]):
+        """Merges a source Candle into the values of the last merged timeframe Candle, or starts
+        a new one. Values are; open, high, low, close, volume, timestamp, aggregation_factor,
+        first and last timestamp. `latest` is the end of these latest Candle, if any"""
+        if self.timeframe and candle.timeframe and candle.timeframe > self.timeframe:
+            return
+
+        first = candle._start_timestamp or candle.timestamp
+        last = candle._end_timestamp or first
+
+        if merged and candle.timestamp <= merged[-1][5]:
+            values = merged[-1]
+            values[1] = max(values[1], candle.high)
+            values[2] = min(values[2], candle.low)
+            values[3] = candle.close
+            values[4] += candle.volume
+            values[6] += candle.aggregation_factor
+            values[8] = last
+            return
+
+        if (
+            not merged
+            and latest is not None
+            and latest - self.timeframe < candle.timestamp <= latest
+        ):
+            end = latest
+        else:
+            end = timeframe_end(candle.timestamp, self.timeframe)
+
+        merged.append(
+            [
+                candle.open,
+                candle.high,
+                candle.low,
+                candle.close,
+                candle.volume,
+                end,
+                candle.aggregation_factor,
+                first,
+                last,
+            ]
+        )
+
+    @staticmethod
+    def _write_candle(candle: Candle, values: Sequence):
+        """Writes merged values into the Candle, wiping it's readings"""
+        (
+            candle.open,
+            candle.high,
+            candle.low,
+            candle.close,
+            candle.volume,
+            candle.timestamp,
+            candle.aggregation_factor,
+            first,
+            last,
+        ) = values
+        candle._start_timestamp = first if first != candle.timestamp else None
+        candle._end_timestamp = last if candle._start_timestamp and last != first else None
+        candle.reset_candle()
+
     def _candle_tasks(
         self,
         mode: CalcMode = CalcMode.INSERT,
         index: Optional[int] = None,
     ):
+        if mode != CalcMode.APPEND or self._source is not None:
+            self._revision += 1
         self.resample_candles(mode, index)
         self.candlestick_conversion(mode, index)
         self.trim_candles()
@@ -127,16 +313,19 @@ class CandleManager:
         return candles_
 
     def prepend(self, candles: Candles):
+        self.check_buffers()
         candles_ = self._parse_candles(candles)
 
-        for candle in reversed(candles_):
-            if self.timeframe and candle.timeframe and candle.timeframe > self.timeframe:
-                continue
-            self._candles.insert(0, candle.clean_copy())
+        self._candles[0:0] = [
+            candle.clean_copy()
+            for candle in candles_
+            if not (self.timeframe and candle.timeframe and candle.timeframe > self.timeframe)
+        ]
 
         self._candle_tasks(CalcMode.PREPEND)
 
     def append(self, candles: Candles):
+        self.check_buffers()
         candles_ = self._parse_candles(candles)
         index = len(self._candles) - 1 if len(self._candles) > 0 else 0
 
@@ -148,21 +337,186 @@ class CandleManager:
 
         self._candle_tasks(CalcMode.APPEND, index)
 
-    def insert(self, candles: Candles):
-        candles_ = self._parse_candles(candles)
+    def append_ohlcv(
+        self,
+        timestamp: Optional[datetime | str],
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ):
+        """Appends a single Candle from it's values, skipping parsing and copying"""
+        self.check_buffers()
+        index = len(self._candles) - 1 if len(self._candles) > 0 else 0
+
+        if isinstance(self._candles, CandleStore):
+            self._candles.append_ohlcv(timestamp, open, high, low, close, volume)
+        else:
+            self._candles.append(Candle(open, high, low, close, volume, timestamp))
+
+        self._candle_tasks(CalcMode.APPEND, index)
+
+    def extend_ohlcv(
+        self,
+        timestamps: array,
+        open: array,
+        high: array,
+        low: array,
+        close: array,
+        volume: array,
+        tz: Optional[tzinfo] = None,
+    ):
+        """Appends Candles in bulk from columns of values, timestamps as microseconds since epoch.
+        Columnar Candles are extended column by column, otherwise each `Candle` is built directly"""
+        self.check_buffers()
+        index = len(self._candles) - 1 if len(self._candles) > 0 else 0
+
+        if isinstance(self._candles, CandleStore):
+            self._candles.extend_ohlcv(timestamps, open, high, low, close, volume, tz)
+        else:
+            self._candles.extend(
+                Candle(open_, high_, low_, close_, volume_, micro_to_timestamp(timestamp, tz))
+                for timestamp, open_, high_, low_, close_, volume_ in zip(
+                    timestamps, open, high, low, close, volume
+                )
+            )
+
+        self._candle_tasks(CalcMode.APPEND, index)
+
+    def append_trade(self, timestamp: datetime, price: float, size: float) -> bool:
+        """Aggregates a single trade into the open timeframe Candle, updating it in place.
+        The Candle is only added to the Candles once it's timeframe closes, or while open every
+        `trade_refresh` of trade time.
+
+        Returns:
+            bool: Whether the Candles changed and readings need calculating
+
+        Raises:
+            InvalidConfiguration: Without a timeframe to aggregate trades into
+        """
+        if not self.timeframe:
+            raise InvalidConfiguration(
+                "Trades can only be aggregated into Candles with a timeframe"
+            )
+
+        if self._trades is None:
+            self._trades = TradeBucket(self.timeframe)
+        trades = self._trades
+
+        if trades.within(timestamp):
+            trades.add(timestamp, price, size)
+            if self.trade_refresh is None or (
+                trades.refreshed and timestamp - trades.refreshed < self.trade_refresh
+            ):
+                return False
+            self._publish_trades()
+            return True
+
+        if trades.before(timestamp):
+            raise InvalidCandleOrder(
+                f"Trade [{timestamp}] is before the open Candle ending [{trades.end}]"
+            )
+
+        changed = trades.pending
+        if changed:
+            self._publish_trades()
+
+        trades.start(timestamp, price, size)
+        if self.trade_refresh is not None:
+            self._publish_trades()
+            changed = True
+
+        return changed
+
+    def _publish_trades(self):
+        """Writes the open trade Candle into the Candles, replacing it if already added"""
+        self.check_buffers()
+        trades = self._trades
+        index = len(self._candles) - 1 if len(self._candles) > 0 else 0
+
+        if trades.published and self._candles and self._candles[-1].timestamp == trades.end:
+            trades.write(self._candles[-1])
+        else:
+            self._candles.append(trades.candle())
+
+        self._candle_tasks(CalcMode.APPEND, index)
 
-        self.sort_candles(candles_)
+    def insert(self, candles: Candles) -> Optional[Tuple[int, int]]:
+        """Inserts Candles in any order or placement. Each Candle is placed by a binary search of
+        the timestamps, with a timeframe only the Candle it falls within is re-sampled. Without
+        timestamps, with a candlestick type or `timeframe_fill`, all Candles are sorted and
+        re-sampled instead.
+
+        Returns:
+            Optional[Tuple[int, int]]: Index of the earliest and latest Candle changed, the
+            readings from the earliest on need re-calculating. None if no Candles were inserted
+        """
+        self.check_buffers()
+        candles_ = [
+            candle.clean_copy()
+            for candle in self._parse_candles(candles)
+            if not (self.timeframe and candle.timeframe and candle.timeframe > self.timeframe)
+        ]
+        if not candles_:
+            return None
+
+        if (
+            self.candlestick
+            or self.timeframe_fill
+            or any(candle.timestamp is None for candle in candles_)
+            or (self._candles and self._candles[-1].timestamp is None)
+        ):
+            self._insert_sorted(candles_)
+            return 0, len(self._candles) - 1
+
+        # In order of timestamp, each Candle is placed at or after the previous
+        candles_.sort(key=attrgetter("timestamp"))
+        rows = []
+        for candle in candles_:
+            if self.timeframe:
+                rows.append(self._insert_timeframe(candle))
+            else:
+                row = bisect_right(self._candles, candle.timestamp, key=attrgetter("timestamp"))
+                self._candles.insert(row, candle)
+                rows.append(row)
+
+        self._revision += 1
+        trimmed = self._trimmed
+        self.trim_candles()
+        trimmed = self._trimmed - trimmed
+        return max(rows[0] - trimmed, 0), max(rows[-1] - trimmed, 0)
+
+    def _insert_timeframe(self, candle: Candle) -> int:
+        """Merges the Candle into the timeframe Candle it falls within, or inserts it as a new
+        timeframe Candle. Returns the index of the timeframe Candle"""
+        end = timeframe_end(candle.timestamp, self.timeframe)
+        index = bisect_left(self._candles, end, key=attrgetter("timestamp"))
+
+        candle.timestamp = trim_timestamp(candle.timestamp)
+        if index < len(self._candles) and self._candles[index].timestamp == end:
+            existing = self._candles.pop(index)
+            existing.merge(candle)
+            self._candles.insert(index, existing)
+            return index
+
+        candle.timeframe = self.timeframe
+        if candle.timestamp != end:
+            candle.set_resampled_timestamp(end)
+        self._candles.insert(index, candle)
+        return index
+
+    def _insert_sorted(self, candles: List[Candle]):
+        """Appends the Candles then sorts and re-samples all Candles"""
+        self.sort_candles(candles)
 
         to_sort = False
         last_timestamp = self._candles[-1].timestamp if self._candles else None
 
-        for candle in candles_:
-            if self.timeframe and candle.timeframe and candle.timeframe > self.timeframe:
-                continue
-            elif last_timestamp and candle.timestamp < last_timestamp:
+        for candle in candles:
+            if last_timestamp and candle.timestamp < last_timestamp:
                 to_sort = True
-
-            self._candles.append(candle.clean_copy())
+            self._candles.append(candle)
 
         if to_sort:
             self.sort_candles()
@@ -205,15 +559,53 @@ class CandleManager:
         return int(time_one - time_two)
 
     def trim_candles(self):
-        if self.candle_life is None or not self._candles:
+        """Removes the oldest Candles outside of `candle_life` and beyond `max_candles`,
+        in a single removal from the front"""
+        if not self._candles:
             return
 
-        while (
-            self._candles[0].timestamp
-            and self._candles[-1].timestamp
-            and self._candles[0].timestamp < self._candles[-1].timestamp - self.candle_life
-        ):
-            self._candles.pop(0)
+        expired = 0
+        latest = self._candles[-1].timestamp
+        if self.candle_life is not None and latest:
+            oldest = latest - self.candle_life
+            try:
+                expired = bisect_left(self._candles, oldest, key=attrgetter("timestamp"))
+            except TypeError:
+                while expired < len(self._candles):
+                    timestamp = self._candles[expired].timestamp
+                    if not timestamp or timestamp >= oldest:
+                        break
+                    expired += 1
+
+        if self.max_candles is not None:
+            expired = max(expired, len(self._candles) - self.max_candles)
+
+        self._trim_front(expired)
+
+    def check_buffers(self):
+        """Raises `BufferHeld` if a view given by the columnar Candles `buffer` is still held,
+        checked before changing the Candles so they're never left partly changed"""
+        if isinstance(self._candles, CandleStore) and self._candles.held():
+            raise BufferHeld(
+                f"A buffer of the '{self.name}' Candles is still held, release it before "
+                "changing the Candles, E.G with `with window.buffer() as view:`"
+            )
+
+    def retain(self):
+        """Removes the oldest Candles beyond `retention`, the Candles still required by the
+        Indicators. Unlike `trim_candles`, only called once the Indicators are calculated"""
+        if self.retention is None:
+            return
+
+        self._trim_front(len(self._candles) - self.retention)
+
+    def _trim_front(self, expired: int):
+        """Removes the given amount of oldest Candles, `CandleStore` only moves it's front"""
+        if expired <= 0:
+            return
+
+        del self._candles[:expired]
+        self._trimmed += expired
 
     def resample_candles(
         self,
@@ -378,7 +770,13 @@ class CandleManager:
         if isinstance(indicator, str):
             indicator = {indicator}
 
+        if isinstance(self.candles, CandleStore):
+            self.candles.purge(indicator)
+            return
+
         for candle in self.candles:
             for name in indicator:
-                candle.indicators.pop(name, None)
-                candle.sub_indicators.pop(name, None)
+                if candle._indicators:
+                    candle._indicators.pop(name, None)
+                if candle._sub_indicators:
+                    candle._sub_indicators.pop(name, None)
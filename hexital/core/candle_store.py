@@ -0,0 +1,892 @@
+from __future__ import annotations
+
+from array import array
+from copy import deepcopy
+from collections.abc import Iterable, MutableMapping, Sequence
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Callable, Dict, Iterator, List, Optional, overload
+from weakref import ref
+
+from hexital.core import Reading
+from hexital.core.candle import Candle
+from hexital.core.reading_series import (
+    FRONT_RESERVE,
+    ReadingSeries,
+    clear_slots,
+    reserve_front,
+)
+
+NO_TIME = -(2**63)
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def timestamp_to_micro(timestamp: Optional[datetime]) -> int:
+    """Converts a timestamp into microseconds since epoch, `NO_TIME` if no timestamp"""
+    if timestamp is None:
+        return NO_TIME
+    if timestamp.tzinfo is None:
+        return (timestamp - _EPOCH) // _MICROSECOND
+    return (timestamp - _EPOCH_UTC) // _MICROSECOND
+
+
+def _held(view: Optional[object]) -> bool:
+    if view is None:
+        return False
+    if isinstance(view, memoryview):
+        try:
+            view.nbytes
+        except ValueError:
+            return False
+    return True
+
+
+def micro_to_timestamp(value: int, tz: Optional[tzinfo] = None) -> Optional[datetime]:
+    """Converts microseconds since epoch back into a timestamp, using the given timezone"""
+    if value == NO_TIME:
+        return None
+    if tz is None:
+        return _EPOCH + timedelta(microseconds=value)
+    return (_EPOCH_UTC + timedelta(microseconds=value)).astimezone(tz)
+
+
+_CANDLE_COLUMNS = {
+    "open": "_open",
+    "high": "_high",
+    "low": "_low",
+    "close": "_close",
+    "volume": "_volume",
+}
+
+
+class RowReadings(MutableMapping):
+    """Mapping view of a single row across a `CandleStore`'s `ReadingSeries`.
+    Reads never allocate, a series is only created on first write of that name"""
+
+    __slots__ = ("_store", "_series", "_row")
+
+    def __init__(self, store: CandleStore, series: Dict[str, ReadingSeries], row: int):
+        self._store = store
+        self._series = series
+        self._row = row
+
+    def __getitem__(self, name: str) -> Reading:
+        series = self._series.get(name)
+        if series is None or not series.has(self._row):
+            raise KeyError(name)
+        return series.get(self._row)
+
+    def __setitem__(self, name: str, reading: Reading):
+        series = self._series.get(name)
+        if series is None:
+            series = self._series[name] = ReadingSeries(len(self._store))
+        series.set(self._row, reading)
+
+    def __delitem__(self, name: str):
+        series = self._series.get(name)
+        if series is None or not series.has(self._row):
+            raise KeyError(name)
+        series.discard(self._row)
+
+    def __contains__(self, name: object) -> bool:
+        series = self._series.get(name)  # type: ignore
+        return series is not None and series.has(self._row)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([name for name, series in self._series.items() if series.has(self._row)])
+
+    def __len__(self) -> int:
+        return sum(1 for series in self._series.values() if series.has(self._row))
+
+    def get(self, name: str, default: Optional[Reading] = None) -> Reading:
+        series = self._series.get(name)
+        if series is None or not series.has(self._row):
+            return default
+        return series.get(self._row)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class RowDict(MutableMapping):
+    """Mapping view of a single row within a `CandleStore` column of dicts.
+    Reads never allocate, the row's dict is only created on first write"""
+
+    __slots__ = ("_column", "_row")
+
+    def __init__(self, column: List[Optional[dict]], row: int):
+        self._column = column
+        self._row = row
+
+    def __getitem__(self, name: str):
+        readings = self._column[self._row]
+        if readings is None:
+            raise KeyError(name)
+        return readings[name]
+
+    def __setitem__(self, name: str, value):
+        readings = self._column[self._row]
+        if readings is None:
+            self._column[self._row] = {name: value}
+        else:
+            readings[name] = value
+
+    def __delitem__(self, name: str):
+        readings = self._column[self._row]
+        if readings is None:
+            raise KeyError(name)
+        del readings[name]
+
+    def __contains__(self, name: object) -> bool:
+        readings = self._column[self._row]
+        return readings is not None and name in readings
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._column[self._row] or ())
+
+    def __len__(self) -> int:
+        readings = self._column[self._row]
+        return len(readings) if readings else 0
+
+    def get(self, name: str, default=None):
+        readings = self._column[self._row]
+        return readings.get(name, default) if readings else default
+
+    def __repr__(self) -> str:
+        return repr(self._column[self._row] or {})
+
+
+class CandleView(Candle):
+    """Lightweight `Candle` view onto a single row of a `CandleStore`.
+
+    Views are positional, they read and write directly to the store's columns, and stay
+    valid until the store is structurally changed before the row they point to."""
+
+    __slots__ = ("_store", "_row")
+
+    _store: CandleStore
+    _row: int
+
+    def __init__(self, store: CandleStore, row: int):
+        self._store = store
+        self._row = row
+
+    def __repr__(self) -> str:
+        return repr(self._store.candle(self._row))
+
+    @property
+    def open(self) -> float:
+        return self._store._open[self._store._head + self._row]
+
+    @open.setter
+    def open(self, value: float):
+        self._store._open[self._store._head + self._row] = value
+
+    @property
+    def high(self) -> float:
+        return self._store._high[self._store._head + self._row]
+
+    @high.setter
+    def high(self, value: float):
+        self._store._high[self._store._head + self._row] = value
+
+    @property
+    def low(self) -> float:
+        return self._store._low[self._store._head + self._row]
+
+    @low.setter
+    def low(self, value: float):
+        self._store._low[self._store._head + self._row] = value
+
+    @property
+    def close(self) -> float:
+        return self._store._close[self._store._head + self._row]
+
+    @close.setter
+    def close(self, value: float):
+        self._store._close[self._store._head + self._row] = value
+
+    @property
+    def volume(self) -> float:
+        return self._store._volume[self._store._head + self._row]
+
+    @volume.setter
+    def volume(self, value: float):
+        self._store._volume[self._store._head + self._row] = value
+
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        return micro_to_timestamp(
+            self._store._timestamp[self._store._head + self._row], self._store._tz
+        )
+
+    @timestamp.setter
+    def timestamp(self, value: Optional[datetime]):
+        self._store._timestamp[self._store._head + self._row] = self._store._to_micro(value)
+
+    @property
+    def timeframe(self) -> Optional[timedelta]:
+        value = self._store._timeframe[self._store._head + self._row]
+        return timedelta(microseconds=value) if value else None
+
+    @timeframe.setter
+    def timeframe(self, value: Optional[timedelta]):
+        self._store._timeframe[self._store._head + self._row] = (
+            value // _MICROSECOND if value else 0
+        )
+
+    @property
+    def aggregation_factor(self) -> int:
+        return self._store._aggregation[self._store._head + self._row]
+
+    @aggregation_factor.setter
+    def aggregation_factor(self, value: int):
+        self._store._aggregation[self._store._head + self._row] = value
+
+    @property
+    def tag(self) -> Optional[str]:
+        return self._store._tags[self._store._head + self._row]
+
+    @tag.setter
+    def tag(self, value: Optional[str]):
+        self._store._tags[self._store._head + self._row] = value
+
+    @property
+    def _start_timestamp(self) -> Optional[datetime]:
+        return micro_to_timestamp(
+            self._store._start[self._store._head + self._row], self._store._tz
+        )
+
+    @_start_timestamp.setter
+    def _start_timestamp(self, value: Optional[datetime]):
+        self._store._start[self._store._head + self._row] = self._store._to_micro(value)
+
+    @property
+    def _end_timestamp(self) -> Optional[datetime]:
+        return micro_to_timestamp(self._store._end[self._store._head + self._row], self._store._tz)
+
+    @_end_timestamp.setter
+    def _end_timestamp(self, value: Optional[datetime]):
+        self._store._end[self._store._head + self._row] = self._store._to_micro(value)
+
+    @property
+    def _indicators(self) -> Optional[RowReadings]:
+        readings = RowReadings(self._store, self._store._indicators, self._row)
+        return readings if readings else None
+
+    @_indicators.setter
+    def _indicators(self, value: Optional[Dict[str, Reading]]):
+        self._store._set_readings(self._store._indicators, self._row, value)
+
+    @property
+    def _sub_indicators(self) -> Optional[RowReadings]:
+        readings = RowReadings(self._store, self._store._sub_indicators, self._row)
+        return readings if readings else None
+
+    @_sub_indicators.setter
+    def _sub_indicators(self, value: Optional[Dict[str, Reading]]):
+        self._store._set_readings(self._store._sub_indicators, self._row, value)
+
+    @property
+    def _refs(self) -> Optional[dict]:
+        return self._store._refs[self._store._head + self._row]
+
+    @_refs.setter
+    def _refs(self, value: Optional[dict]):
+        self._store._refs[self._store._head + self._row] = value
+
+    @property
+    def indicators(self) -> RowReadings:
+        return RowReadings(self._store, self._store._indicators, self._row)
+
+    @indicators.setter
+    def indicators(self, value: Optional[Dict[str, Reading]]):
+        self._store._set_readings(self._store._indicators, self._row, value)
+
+    @property
+    def sub_indicators(self) -> RowReadings:
+        return RowReadings(self._store, self._store._sub_indicators, self._row)
+
+    @sub_indicators.setter
+    def sub_indicators(self, value: Optional[Dict[str, Reading]]):
+        self._store._set_readings(self._store._sub_indicators, self._row, value)
+
+    @property
+    def refs(self) -> RowDict:
+        return RowDict(self._store._refs, self._store._head + self._row)
+
+    @refs.setter
+    def refs(self, value: Optional[dict]):
+        self._store._refs[self._store._head + self._row] = dict(value) if value else None
+
+    def detach(self) -> Candle:
+        """Returns a standalone `Candle` copy of this row"""
+        return self._store.candle(self._row)
+
+
+class CandleStore(list):
+    """Columnar, array backed storage of Candles.
+
+    OHLCV and timestamps are held in contiguous `array` columns, instead of a `Candle` object
+    per row. `Candle`'s are only created when requested, as `CandleView`'s onto the row.
+    Readings are held per indicator as a `ReadingSeries` aligned to the rows, reference dicts
+    are only allocated for a row once written to.
+
+    Behaves as a list of Candles, so can be used anywhere a list of Candles is expected,
+    removed rows are returned as standalone `Candle`'s and inserted `Candle`'s are copied in.
+
+    Acts as a double ended buffer, the columns reserve a gap in front of the first row. So
+    prepending a row and removing rows from the front, E.G trimming, are amortized O(1).
+    """
+
+    _open: array
+    _high: array
+    _low: array
+    _close: array
+    _volume: array
+    _timestamp: array
+    _timeframe: array
+    _aggregation: array
+    _start: array
+    _end: array
+    _tags: List[Optional[str]]
+    _indicators: Dict[str, ReadingSeries]
+    _sub_indicators: Dict[str, ReadingSeries]
+    _refs: List[Optional[dict]]
+    _tz: Optional[tzinfo]
+    _head: int
+    _views: List[ref]
+
+    def __init__(self, candles: Optional[Iterable[Candle]] = None):
+        list.__init__(self)
+        self._open = array("d")
+        self._high = array("d")
+        self._low = array("d")
+        self._close = array("d")
+        self._volume = array("d")
+        self._timestamp = array("q")
+        self._timeframe = array("q")
+        self._aggregation = array("q")
+        self._start = array("q")
+        self._end = array("q")
+        self._tags = []
+        self._indicators = {}
+        self._sub_indicators = {}
+        self._refs = []
+        self._tz = None
+        self._head = 0
+        self._views = []
+        if candles:
+            self.extend(candles)
+
+    def clear(self):
+        """Removes every row, columns are emptied in place so bound accessors remain valid"""
+        for column in self._columns:
+            del column[:]
+        self._indicators.clear()
+        self._sub_indicators.clear()
+        self._tz = None
+        self._head = 0
+
+    @property
+    def _columns(self) -> tuple:
+        return (
+            self._open,
+            self._high,
+            self._low,
+            self._close,
+            self._volume,
+            self._timestamp,
+            self._timeframe,
+            self._aggregation,
+            self._start,
+            self._end,
+            self._tags,
+            self._refs,
+        )
+
+    @property
+    def _series(self) -> Iterator[ReadingSeries]:
+        """Every distinct series, a series shared by an alias is only given once"""
+        series = {id(series_): series_ for series_ in self._indicators.values()}
+        for series_ in self._sub_indicators.values():
+            series.setdefault(id(series_), series_)
+        return iter(series.values())
+
+    def _to_micro(self, timestamp: Optional[datetime]) -> int:
+        if timestamp is not None and timestamp.tzinfo is not None and self._tz is None:
+            self._tz = timestamp.tzinfo
+        return timestamp_to_micro(timestamp)
+
+    def _row_values(self, candle: Candle) -> tuple:
+        return (
+            candle.open,
+            candle.high,
+            candle.low,
+            candle.close,
+            candle.volume,
+            self._to_micro(candle.timestamp),
+            candle.timeframe // _MICROSECOND if candle.timeframe else 0,
+            candle.aggregation_factor,
+            self._to_micro(candle._start_timestamp),
+            self._to_micro(candle._end_timestamp),
+            candle.tag,
+            dict(candle._refs) if candle._refs else None,
+        )
+
+    def _row_readings(self, candle: Candle) -> tuple:
+        return (
+            dict(candle._indicators) if candle._indicators else None,
+            dict(candle._sub_indicators) if candle._sub_indicators else None,
+        )
+
+    def _set_readings(
+        self,
+        series: Dict[str, ReadingSeries],
+        row: int,
+        readings: Optional[Dict[str, Reading]],
+    ):
+        """Replaces all of the readings for the row"""
+        readings = dict(readings) if readings else {}
+        for name, series_ in series.items():
+            if name not in readings and series_.has(row):
+                series_.discard(row)
+
+        for name, reading in readings.items():
+            series_ = series.get(name)
+            if series_ is None:
+                series_ = series[name] = ReadingSeries(len(self))
+            series_.set(row, reading)
+
+    def _write_row(self, row: int, readings: tuple):
+        self._set_readings(self._indicators, row, readings[0])
+        self._set_readings(self._sub_indicators, row, readings[1])
+
+    def _row_dict(self, series: Dict[str, ReadingSeries], row: int) -> Optional[dict]:
+        readings = {name: series_.get(row) for name, series_ in series.items() if series_.has(row)}
+        return readings if readings else None
+
+    def _detached(self, candle: Candle) -> Candle:
+        if isinstance(candle, CandleView) and candle._store is self:
+            return candle.detach()
+        return candle
+
+    def candle(self, row: int) -> Candle:
+        """Materialise a standalone `Candle` from the given row"""
+        slot = self._head + row
+        timeframe = self._timeframe[slot]
+        candle = Candle(
+            self._open[slot],
+            self._high[slot],
+            self._low[slot],
+            self._close[slot],
+            self._volume[slot],
+            timestamp=micro_to_timestamp(self._timestamp[slot], self._tz),
+            timeframe=timedelta(microseconds=timeframe) if timeframe else None,
+            indicators=self._row_dict(self._indicators, row),
+            sub_indicators=self._row_dict(self._sub_indicators, row),
+        )
+        candle.aggregation_factor = self._aggregation[slot]
+        candle.tag = self._tags[slot]
+        candle._start_timestamp = micro_to_timestamp(self._start[slot], self._tz)
+        candle._end_timestamp = micro_to_timestamp(self._end[slot], self._tz)
+        if self._refs[slot]:
+            candle.refs = dict(self._refs[slot])
+        return candle
+
+    def candles(self) -> List[Candle]:
+        """Materialise all rows as standalone `Candle`'s"""
+        return [self.candle(row) for row in range(len(self))]
+
+    def _row(self, index: int) -> int:
+        length = len(self._open) - self._head
+        if not -length <= index < length:
+            raise IndexError("CandleStore index out of range")
+        return index + length if index < 0 else index
+
+    def __len__(self) -> int:
+        return len(self._open) - self._head
+
+    @overload
+    def __getitem__(self, index: int) -> Candle: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Candle]: ...
+
+    def __getitem__(self, index: int | slice) -> Candle | List[Candle]:
+        if isinstance(index, slice):
+            return [CandleView(self, row) for row in range(*index.indices(len(self)))]
+        return CandleView(self, self._row(index))
+
+    def __iter__(self) -> Iterator[Candle]:
+        for row in range(len(self)):
+            yield CandleView(self, row)
+
+    def __reversed__(self) -> Iterator[Candle]:
+        for row in range(len(self) - 1, -1, -1):
+            yield CandleView(self, row)
+
+    def __setitem__(self, index: int | slice, candle: Candle | Iterable[Candle]):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("CandleStore does not support extended slice assignment")
+            candles = [self._detached(candle_) for candle_ in candle]  # type: ignore
+            del self[start:stop]
+            for offset, candle_ in enumerate(candles):
+                self.insert(start + offset, candle_)
+            return
+
+        row = self._row(index)
+        readings = self._row_readings(candle)  # type: ignore
+        for column, value in zip(self._columns, self._row_values(candle)):  # type: ignore
+            column[self._head + row] = value
+        self._write_row(row, readings)
+
+    def _delete_front(self, count: int):
+        head = self._head
+        for column in self._columns:
+            clear_slots(column, head, head + count)
+        self._head += count
+
+        if self._head > FRONT_RESERVE and self._head > len(self):
+            for column in self._columns:
+                del column[: self._head]
+            self._head = 0
+
+    def __delitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                for row in sorted(range(start, stop, step), reverse=True):
+                    del self[row]
+                return
+        else:
+            start = self._row(index)
+            stop = start + 1
+
+        if stop <= start:
+            return
+        if start == 0:
+            self._delete_front(stop)
+        else:
+            for column in self._columns:
+                del column[self._head + start : self._head + stop]
+        for series in self._series:
+            del series[start:stop]
+
+    def insert(self, index: int, candle: Candle):
+        length = len(self)
+        if index < 0:
+            index = max(0, index + length)
+        index = min(index, length)
+
+        readings = self._row_readings(candle)
+        if index == 0:
+            if not self._head:
+                self._head = max(FRONT_RESERVE, length)
+                for column in self._columns:
+                    reserve_front(column, self._head)
+            self._head -= 1
+            for column, value in zip(self._columns, self._row_values(candle)):
+                column[self._head] = value
+        else:
+            for column, value in zip(self._columns, self._row_values(candle)):
+                column.insert(self._head + index, value)
+
+        for series in self._series:
+            series.insert(index)
+        self._write_row(index, readings)
+
+    def append(self, candle: Candle):
+        readings = self._row_readings(candle)
+        for column, value in zip(self._columns, self._row_values(candle)):
+            column.append(value)
+        for series in self._series:
+            series.append()
+        self._write_row(len(self) - 1, readings)
+
+    def append_ohlcv(
+        self,
+        timestamp: Optional[datetime | str],
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ):
+        """Appends a row straight from it's values, without creating a `Candle`. A `str`
+        timestamp is parsed as ISO format, same as `Candle`"""
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        self._open.append(open)
+        self._high.append(high)
+        self._low.append(low)
+        self._close.append(close)
+        self._volume.append(volume)
+        self._timestamp.append(self._to_micro(timestamp))
+        self._timeframe.append(0)
+        self._aggregation.append(1)
+        self._start.append(NO_TIME)
+        self._end.append(NO_TIME)
+        self._tags.append(None)
+        self._refs.append(None)
+        for series in self._series:
+            series.append()
+
+    def extend_ohlcv(
+        self,
+        timestamps: array,
+        open: array,
+        high: array,
+        low: array,
+        close: array,
+        volume: array,
+        tz: Optional[tzinfo] = None,
+    ):
+        """Appends rows straight from columns of values, timestamps as microseconds since epoch.
+        Each column is extended in bulk, without creating any per row objects"""
+        count = len(timestamps)
+        if tz is not None and self._tz is None:
+            self._tz = tz
+
+        self._open.extend(open)
+        self._high.extend(high)
+        self._low.extend(low)
+        self._close.extend(close)
+        self._volume.extend(volume)
+        self._timestamp.extend(timestamps)
+        self._timeframe.extend(array("q", [0]) * count)
+        self._aggregation.extend(array("q", [1]) * count)
+        self._start.extend(array("q", [NO_TIME]) * count)
+        self._end.extend(array("q", [NO_TIME]) * count)
+        self._tags.extend([None] * count)
+        self._refs.extend([None] * count)
+        for series in self._series:
+            series.extend(count)
+
+    def extend(self, candles: Iterable[Candle]):
+        for candle in candles:
+            self.append(candle)
+
+    def pop(self, index: int = -1) -> Candle:
+        row = self._row(index)
+        candle = self.candle(row)
+        del self[row]
+        return candle
+
+    def reverse(self):
+        candles = self.candles()
+        candles.reverse()
+        self.clear()
+        self.extend(candles)
+
+    def sort(self, key=None, reverse: bool = False):
+        candles = self.candles()
+        candles.sort(key=key, reverse=reverse)
+        self.clear()
+        self.extend(candles)
+
+    def purge(self, names: Iterable[str]):
+        """Remove the given reading names from every row"""
+        for name in names:
+            self._indicators.pop(name, None)
+            self._sub_indicators.pop(name, None)
+
+    def column(self, name: str) -> array:
+        """Copy of the given Candle field's column, E.G 'close', for every row"""
+        return getattr(self, _CANDLE_COLUMNS[name])[self._head :]
+
+    def series(self, name: str) -> Optional[ReadingSeries]:
+        """Returns the `ReadingSeries` of the given reading name, if it exists"""
+        series = self._indicators.get(name)
+        return series if series is not None else self._sub_indicators.get(name)
+
+    def alias(self, name: str, target: str) -> bool:
+        """Points the sub indicator readings of name at the series of target, sharing it rather
+        than copying the readings. False if target has no series yet"""
+        series = self.series(target)
+        if series is None:
+            return False
+        if self._sub_indicators.get(name) is not series:
+            self._sub_indicators[name] = series
+        return True
+
+    def unalias(self, name: str):
+        """Gives the sub indicator readings of name their own copy of a series it shares"""
+        series = self._sub_indicators.get(name)
+        if series is None:
+            return
+        for other, series_ in [*self._indicators.items(), *self._sub_indicators.items()]:
+            if series_ is series and other != name:
+                self._sub_indicators[name] = deepcopy(series)
+                return
+
+    def set_readings(
+        self, name: str, readings: Iterable[Reading], start: int = 0, sub: bool = False
+    ):
+        """Sets consecutive readings of the given name, from the start row"""
+        column = self._sub_indicators if sub else self._indicators
+        series = column.get(name)
+        if series is None:
+            series = column[name] = ReadingSeries(len(self))
+
+        for row, reading in enumerate(readings, start):
+            series.set(row, reading)
+
+    def valid_count(self, name: str, row: int) -> Optional[int]:
+        """Amount of consecutive not `None` readings of the given name, ending at the row.
+        Read from the series `Coverage`, `None` if the name isn't tracked, E.G nested names"""
+        if name in _CANDLE_COLUMNS:
+            return row + 1
+        series = self.series(name)
+        return series.coverage.count(row) if series is not None else None
+
+    def has_reading(self, name: str, row: int) -> bool:
+        """Checks if the row holds a reading for the given name, even if it's None"""
+        series = self.series(name)
+        return series is not None and series.has(row)
+
+    def reading(self, name: str, row: int) -> Reading:
+        """Reading of the given name at the row, Candle fields included.
+        Uses '.' to find nested reading, E.G 'MACD_12_26_9.MACD"""
+        if row < 0:
+            row += len(self)
+
+        column = _CANDLE_COLUMNS.get(name)
+        if column is not None:
+            return getattr(self, column)[self._head + row]
+
+        if "." in name:
+            name, nested_name = name.split(".")
+            series = self.series(name)
+            reading = series.get(row) if series is not None else None
+            return reading.get(nested_name) if isinstance(reading, dict) else reading
+
+        series = self.series(name)
+        if series is not None:
+            return series.get(row)
+        if hasattr(Candle, name):
+            return getattr(CandleView(self, row), name)
+        return None
+
+    def accessor(self, name: str) -> Callable[[int], Reading]:
+        """Pre-binds `reading` of the given name, a function of a positive row.
+        Candle fields read straight from their column, readings only look up their series"""
+        column_name = _CANDLE_COLUMNS.get(name)
+        if column_name is not None:
+            column = getattr(self, column_name)
+            return lambda row: column[self._head + row]
+
+        indicators = self._indicators
+        sub_indicators = self._sub_indicators
+
+        if "." in name:
+            main_name, nested_name = name.split(".")
+
+            def nested_reading(row: int) -> Reading:
+                series = indicators.get(main_name)
+                if series is None:
+                    series = sub_indicators.get(main_name)
+                    if series is None:
+                        return None
+                reading = series.get(row)
+                return reading.get(nested_name) if isinstance(reading, dict) else reading
+
+            return nested_reading
+
+        def reading(row: int) -> Reading:
+            series = indicators.get(name)
+            if series is None:
+                series = sub_indicators.get(name)
+                if series is None:
+                    return self.reading(name, row)
+            return series.get(row)
+
+        return reading
+
+    def readings(self, name: str, start: int = 0, stop: Optional[int] = None) -> List[Reading]:
+        """Readings of the given name for the rows within start and stop"""
+        column = _CANDLE_COLUMNS.get(name)
+        if column is not None:
+            start, stop, _ = slice(start, stop).indices(len(self))
+            return getattr(self, column)[
+                self._head + start : self._head + max(start, stop)
+            ].tolist()
+
+        series = self.series(name)
+        if series is None:
+            rows = range(*slice(start, stop).indices(len(self)))
+            return [self.reading(name, row) for row in rows]
+        return series.as_list(start, stop)
+
+    def buffer(self, name: str, start: int = 0, stop: Optional[int] = None) -> Optional[memoryview]:
+        """Memoryview of the Candle field column or float readings of the given name, for the
+        rows within start and stop, sharing storage. None if the name isn't a Candle field or
+        float `ReadingSeries`. Columns can't grow while the view is held, changing the Candles
+        through a `CandleManager` raises `BufferHeld` until it's released"""
+        column_name = _CANDLE_COLUMNS.get(name)
+        if column_name is None:
+            series = self.series(name)
+            view = series.buffer(start, stop) if series is not None else None
+        else:
+            start, stop, _ = slice(start, stop).indices(len(self))
+            with memoryview(getattr(self, column_name)) as column:
+                view = column[self._head + start : self._head + max(start, stop)]
+
+        if view is not None:
+            self.track(view)
+        return view
+
+    def track(self, view: object):
+        """Tracks a view sharing storage with the Candles, E.G a NumPy array of a `buffer`"""
+        self._views.append(ref(view))
+
+    def held(self) -> bool:
+        """If any tracked view is still held, while it's held the Candles can't grow"""
+        views = self._views
+        if views:
+            views[:] = [view for view in views if _held(view())]
+        return bool(views)
+
+    def remove(self, candle: Candle):
+        del self[self.index(candle)]
+
+    def index(self, candle: Candle, start: int = 0, stop: Optional[int] = None) -> int:
+        for row in range(*slice(start, stop).indices(len(self))):
+            if CandleView(self, row) == candle:
+                return row
+        raise ValueError("Candle is not in CandleStore")
+
+    def count(self, candle: Candle) -> int:
+        return sum(1 for candle_ in self if candle_ == candle)
+
+    def copy(self) -> CandleStore:
+        return CandleStore(self)
+
+    def __contains__(self, candle: object) -> bool:
+        return any(candle_ == candle for candle_ in self)
+
+    def __add__(self, other: Iterable[Candle]) -> CandleStore:
+        store = CandleStore(self)
+        store.extend(other)
+        return store
+
+    def __iadd__(self, other: Iterable[Candle]) -> CandleStore:
+        self.extend([self._detached(candle) for candle in other])
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or len(self) != len(other):
+            return False
+        return all(candle == other[row] for row, candle in enumerate(self))
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"CandleStore({self.candles()!r})"
@@ -87,11 +87,11 @@ class CandlestickType(ABC):
         """Optimisation method, to find where to start calculating the indicator from
         Searches from newest to oldest to find the first candle without the indicator
         """
-        if not self.candles or not self.candles[0].refs.get(self.acronym):
+        if not self.candles or not (self.candles[0]._refs or {}).get(self.acronym):
             return 0
 
         for index in range(len(self.candles) - 1, -1, -1):
-            if self.acronym in self.candles[index].refs:
+            if self.acronym in (self.candles[index]._refs or {}):
                 return index + 1
         return 0
 
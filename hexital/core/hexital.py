@@ -1,15 +1,40 @@
+from __future__ import annotations
+
+import asyncio
 from copy import copy
-from datetime import timedelta
+from datetime import datetime, timedelta
 from importlib import import_module
-from typing import Any, Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from hexital.core import Reading
 from hexital.core.candle import Candle
-from hexital.core.candle_manager import DEFAULT_CANDLES, CandleManager, Candles
+from hexital.core.candle_manager import (
+    DEFAULT_CANDLES,
+    RETENTION_MARGIN,
+    CandleManager,
+    Candles,
+)
+from hexital.core.candle_store import CandleView
 from hexital.core.candlestick_type import CandlestickType
 from hexital.core.indicator import Indicator, NestedSource, Source
 from hexital.core.indicator_collection import IndicatorCollection
-from hexital.exceptions import InvalidAnalysis, InvalidIndicator
+from hexital.core.ohlcv_file import OHLCVColumns
+from hexital.core.reading_window import ReadingWindow
+from hexital.exceptions import InvalidAnalysis, InvalidConfiguration, InvalidIndicator
 from hexital.indicators.amorph import Amorph
 from hexital.utils.candles import reading_by_candle, reading_by_index
 from hexital.utils.candlesticks import validate_candlesticktype
@@ -20,13 +45,29 @@ from hexital.utils.timeframe import (
     timeframe_validation,
 )
 
+# Amount of Candles appended or re-calculated between yielding to the event loop
+ASYNC_CHUNK = 1000
+
+
+def candle_chunks(candles: Candles, chunk_size: int) -> List[Candles]:
+    """Splits a list of Candle's into chunks of at most chunk_size, a single Candle in any format
+    is a single chunk"""
+    if isinstance(candles, list) and candles and isinstance(candles[0], (Candle, dict, list)):
+        return [candles[index : index + chunk_size] for index in range(0, len(candles), chunk_size)]
+    return [candles]
+
 
 class Hexital:
     name: str
     description: Optional[str] = None
     timeframe_fill: bool = False
     candle_life: Optional[timedelta] = None
+    max_candles: Optional[int] = None
+    trade_refresh: Optional[timedelta] = None
     candlestick: Optional[CandlestickType]
+    columnar: bool = False
+    auto_retention: bool = False
+    lazy: bool = False
 
     _candle_map: Dict[str, CandleManager]
     _indicators: Dict[str, Indicator]
@@ -43,6 +84,11 @@ class Hexital:
         timeframe_fill: bool = False,
         candle_life: Optional[timedelta] = None,
         candlestick: Optional[CandlestickType | str] = None,
+        columnar: bool = False,
+        max_candles: Optional[int] = None,
+        trade_refresh: Optional[timedelta] = None,
+        auto_retention: bool = False,
+        lazy: bool = False,
     ):
         self.name = name
         self.description = description
@@ -50,6 +96,11 @@ class Hexital:
         self._timeframe = convert_timeframe_to_timedelta(timeframe)
         self.timeframe_fill = timeframe_fill
         self.candle_life = candle_life
+        self.max_candles = max_candles
+        self.trade_refresh = trade_refresh
+        self.columnar = columnar
+        self.auto_retention = auto_retention
+        self.lazy = lazy
 
         self.candlestick = validate_candlesticktype(candlestick) if candlestick else None
 
@@ -59,6 +110,9 @@ class Hexital:
             timeframe=self._timeframe,
             timeframe_fill=self.timeframe_fill,
             candlestick=self.candlestick,
+            columnar=self.columnar,
+            max_candles=self.max_candles,
+            trade_refresh=self.trade_refresh,
         )
 
         self._default_name = manager.name
@@ -71,6 +125,10 @@ class Hexital:
         else:
             self._indicators = self._validate_indicators(indicators)
 
+        self._share_sub_indicators()
+        self._set_retention()
+        self._set_dependencies()
+
     @property
     def timeframe(self) -> str | None:
         return timedelta_to_str(self._timeframe) if self._timeframe else None
@@ -118,7 +176,7 @@ class Hexital:
         output = {}
 
         for name, value in self.__dict__.items():
-            if name in ["candles", "timeframe_fill"]:
+            if name in ["candles", "timeframe_fill", "columnar", "auto_retention", "lazy"]:
                 continue
             if name == "candlestick" and value:
                 output[name] = value.acronym if value.acronym else value.name
@@ -131,6 +189,15 @@ class Hexital:
             output["timeframe"] = self.timeframe
             output["timeframe_fill"] = self.timeframe_fill
 
+        if self.columnar:
+            output["columnar"] = self.columnar
+
+        if self.auto_retention:
+            output["auto_retention"] = self.auto_retention
+
+        if self.lazy:
+            output["lazy"] = self.lazy
+
         output["indicators"] = self.indicator_settings
 
         for indicator in output["indicators"]:
@@ -148,9 +215,7 @@ class Hexital:
         for indicator in self._indicators.values():
             conf = {}
             if isinstance(indicator, Indicator) and not isinstance(indicator, Amorph):
-                conf.update(
-                    {"indicator": indicator._name if indicator._name else type(indicator).__name__}
-                )
+                conf.update({"indicator": type(indicator).__name__})
             conf.update(indicator.settings)
             settings.append(conf)
 
@@ -167,6 +232,7 @@ class Hexital:
         return None
 
     def _find_reading(self, source: Source, index: int = -1) -> Reading:
+        self._refresh(source)
         if isinstance(source, (Indicator, NestedSource)):
             return source.reading(index=index)
         elif reading := reading_by_index(
@@ -182,6 +248,7 @@ class Hexital:
         return None
 
     def _find_readings(self, source: Source) -> List[Reading]:
+        self._refresh(source)
         if isinstance(source, (Indicator, NestedSource)):
             return source.readings()
 
@@ -204,6 +271,24 @@ class Hexital:
         """Returns a Dictionary of all the Indicators and there results in a list format."""
         return {name: indicator.readings() for name, indicator in self._indicators.items()}
 
+    def window(
+        self,
+        source: Source,
+        length: Optional[int] = None,
+        timeframe: Optional[TimeFramesSource] = None,
+    ) -> ReadingWindow:
+        """Live view of the latest `length` readings of an Indicator, or every reading, without
+        copying. Full Name of the indicator E.G `EMA_12` OR `MACD_12_26_9.MACD`, or a Candle
+        field E.G `close` of the given timeframe's Candles. See `ReadingWindow`"""
+        if indicator := self._find_indicator(source):
+            return indicator.window(length, source)
+
+        timeframe_name = self._parse_timeframe(timeframe)
+        manager = self._candle_map.get(timeframe_name or self._default_name)
+        if manager is None:
+            raise InvalidIndicator(f"No Candles found for timeframe '{timeframe}'")
+        return ReadingWindow(manager, source, length)
+
     def reading_as_list(self, source: Source) -> List[Reading]:
         """Find given indicator and returns the readings as a list
         Full Name of the indicator E.G `EMA_12` OR `MACD_12_26_9.MACD`"""
@@ -221,6 +306,10 @@ class Hexital:
         for name, valid_indicator in self._validate_indicators(indicators).items():
             self._indicators[name] = valid_indicator
 
+        self._share_sub_indicators()
+        self._set_retention()
+        self._set_dependencies()
+
     def remove_indicator(self, source: Source):
         """Removes an indicator from running within hexital"""
         indicator = self._find_indicator(source)
@@ -229,6 +318,9 @@ class Hexital:
 
         indicator.purge()
         self._indicators.pop(indicator.name)
+        self._share_sub_indicators()
+        self._set_retention()
+        self._set_dependencies()
 
     def prepend(
         self,
@@ -241,6 +333,7 @@ class Hexital:
             candles: The Candle or List of Candle's to prepend.
             timeframe: A specific timeframe to insert Candle's into
         """
+        self._check_buffers()
         timeframe_name = self._parse_timeframe(timeframe)
 
         if timeframe_name and self._candle_map.get(timeframe_name):
@@ -249,7 +342,7 @@ class Hexital:
             for candle_manager in self._candle_map.values():
                 candle_manager.prepend(candles)
 
-        self.calculate()
+        self._candles_changed()
 
     def append(
         self,
@@ -262,43 +355,410 @@ class Hexital:
             candles: The Candle or List of Candle's to prepend.
             timeframe: A specific timeframe to insert Candle's into
         """
+        self._check_buffers()
         timeframe_name = self._parse_timeframe(timeframe)
 
         if timeframe_name and self._candle_map.get(timeframe_name):
             self._candle_map[timeframe_name].append(candles)
         else:
             for candle_manager in self._candle_map.values():
-                candle_manager.append(candles)
+                if candle_manager.source:
+                    candle_manager.sync()
+                else:
+                    candle_manager.append(candles)
 
-        self.calculate()
+        self._candles_changed()
+
+    def append_ohlcv(
+        self,
+        timestamp: Optional[datetime | str],
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        timeframe: Optional[TimeFramesSource] = None,
+    ):
+        """Fast path of `append` for a single Candle given as it's values. Skips detecting the
+        Candle format and copying, each Candle manager builds it's Candle directly.
+
+        Args:
+            timestamp: The end timestamp of the Candle
+            open: Open value
+            high: High value
+            low: Low value
+            close: Close value
+            volume: Volume value
+            timeframe: A specific timeframe to append the Candle into
+        """
+        self._check_buffers()
+        timeframe_name = self._parse_timeframe(timeframe)
+
+        if timeframe_name and self._candle_map.get(timeframe_name):
+            self._candle_map[timeframe_name].append_ohlcv(timestamp, open, high, low, close, volume)
+        else:
+            for candle_manager in self._candle_map.values():
+                if candle_manager.source:
+                    candle_manager.sync()
+                else:
+                    candle_manager.append_ohlcv(timestamp, open, high, low, close, volume)
+
+        self._candles_changed()
+
+    def extend_ohlcv(self, columns: OHLCVColumns, timeframe: Optional[TimeFramesSource] = None):
+        """Bulk path of `append` for Candles given as columns, E.G each chunk from `read_ohlcv`
+        or `read_csv` of `hexital.core.ohlcv_file`. Columnar Candles are extended column by
+        column, without creating any `Candle` or dict per row.
+
+        Args:
+            columns: The Candles as `OHLCVColumns`
+            timeframe: A specific timeframe to append the Candles into
+        """
+        self._check_buffers()
+        timeframe_name = self._parse_timeframe(timeframe)
+
+        if timeframe_name and self._candle_map.get(timeframe_name):
+            self._candle_map[timeframe_name].extend_ohlcv(*columns)
+        else:
+            for candle_manager in self._candle_map.values():
+                if candle_manager.source:
+                    candle_manager.sync()
+                else:
+                    candle_manager.extend_ohlcv(*columns)
+
+        self._candles_changed()
+
+    def append_trade(
+        self,
+        timestamp: datetime,
+        price: float,
+        size: float,
+        timeframe: Optional[TimeFramesSource] = None,
+    ):
+        """Aggregates a single trade into each timeframe's open Candle. Readings are only
+        calculated once a Candle closes, or while open every `trade_refresh` of trade time.
+        Candles without a timeframe are skipped, they can't aggregate trades.
+
+        Args:
+            timestamp: The timestamp of the trade
+            price: The traded price
+            size: The traded size, added to the Candle's volume
+            timeframe: A specific timeframe to aggregate the trade into
+
+        Raises:
+            InvalidConfiguration: Without any timeframe Candles to aggregate trades into
+        """
+        self._check_buffers()
+        timeframe_name = self._parse_timeframe(timeframe)
+
+        if timeframe_name and self._candle_map.get(timeframe_name):
+            managers = [self._candle_map[timeframe_name]]
+        else:
+            managers = [manager for manager in self._candle_map.values() if manager.timeframe]
+
+        if not managers:
+            raise InvalidConfiguration(
+                f"Hexital {self.name} has no timeframe Candles to aggregate trades into"
+            )
+
+        changed = False
+        for candle_manager in managers:
+            changed |= candle_manager.append_trade(timestamp, price, size)
+
+        if changed:
+            self._candles_changed()
 
     def insert(
         self,
         candles: Candles,
         timeframe: Optional[TimeFramesSource] = None,
     ):
-        """insert a Candle or a list of Candle's to the Hexital Candles. This accepts any order or placement. This will sort, re-sample and re-calculate all Candles.
+        """insert a Candle or a list of Candle's to the Hexital Candles. This accepts any order or placement. Each indicator only re-calculates from the earliest inserted Candle, until it's readings converge.
 
         Args:
             candles: The Candle or List of Candle's to prepend.
             timeframe: A specific timeframe to insert Candle's into
         """
+        self._check_buffers()
+        inserted = self._insert_candles(candles, timeframe)
+
+        for indicator in self._indicators.values():
+            changed = inserted.get(indicator.candle_manager.name)
+            if changed is not None:
+                indicator.calculate_changed(*changed)
+
+    def _insert_candles(
+        self, candles: Candles, timeframe: Optional[TimeFramesSource] = None
+    ) -> Dict[str, Tuple[int, int]]:
+        """Inserts the Candles, returning the index of the earliest and latest changed Candle
+        by manager. With `lazy`, stale indicators are caught up first, so re-calculating the
+        changed readings never triggers a catch up part way through"""
+        for indicator in self._indicators.values():
+            if indicator._stale:
+                indicator._refresh()
+
         timeframe_name = self._parse_timeframe(timeframe)
 
         if timeframe_name and self._candle_map.get(timeframe_name):
-            self._candle_map[timeframe_name].insert(candles)
+            managers = [self._candle_map[timeframe_name]]
         else:
-            for candle_manager in self._candle_map.values():
-                candle_manager.insert(candles)
+            managers = list(self._candle_map.values())
+
+        inserted = {}
+        for candle_manager in managers:
+            changed = candle_manager.insert(candles)
+            if changed is not None:
+                inserted[candle_manager.name] = changed
+        return inserted
+
+    async def aappend(
+        self,
+        candles: Candles,
+        timeframe: Optional[TimeFramesSource] = None,
+        chunk_size: int = ASYNC_CHUNK,
+    ):
+        """Cooperative `append` for asyncio, appends and calculates the Candle's in chunks of
+        chunk_size, yielding to the event loop after each chunk.
 
-        self.calculate_index(index=0, end_index=-1)
+        Args:
+            candles: The Candle or List of Candle's to append.
+            timeframe: A specific timeframe to append Candle's into
+            chunk_size: Amount of Candles appended and calculated at a time
+        """
+        for chunk in candle_chunks(candles, chunk_size):
+            self.append(chunk, timeframe)
+            await asyncio.sleep(0)
+
+    async def ainsert(
+        self,
+        candles: Candles,
+        timeframe: Optional[TimeFramesSource] = None,
+        chunk_size: int = ASYNC_CHUNK,
+    ):
+        """Cooperative `insert` for asyncio, re-calculates each indicator in chunks of chunk_size
+        Candles, yielding to the event loop after each chunk.
+
+        Args:
+            candles: The Candle or List of Candle's to insert.
+            timeframe: A specific timeframe to insert Candle's into
+            chunk_size: Amount of Candles re-calculated at a time
+        """
+        self._check_buffers()
+        inserted = self._insert_candles(candles, timeframe)
+
+        for indicator in self._indicators.values():
+            changed = inserted.get(indicator.candle_manager.name)
+            if changed is None:
+                continue
+
+            first, last = indicator._recalculate_range(*changed)
+            for start in range(first, last + 1, chunk_size):
+                indicator.calculate_index(start, min(start + chunk_size - 1, last))
+                await asyncio.sleep(0)
+            indicator.calculate()
+
+    async def astream(
+        self,
+        source: AsyncIterable[Candles],
+        timeframe: Optional[TimeFramesSource] = None,
+        chunk_size: int = ASYNC_CHUNK,
+    ) -> AsyncIterator[Dict[str, Reading]]:
+        """Appends each Candle or List of Candle's from an async iterator with `aappend`,
+        yielding the latest reading of each indicator after each. The source is only read once
+        the readings are consumed, so a slow consumer applies backpressure to the source.
+
+        Args:
+            source: Async iterator of Candle's or List's of Candle's, E.G a live feed
+            timeframe: A specific timeframe to append Candle's into
+            chunk_size: Amount of Candles appended and calculated at a time
+
+        Yields:
+            Dict: Latest reading of each indicator
+        """
+        async for candles in source:
+            await self.aappend(candles, timeframe, chunk_size)
+            yield self._latest_readings()
+
+    def stream(
+        self,
+        candles: Iterable[Candles],
+        timeframe: Optional[TimeFramesSource] = None,
+        batch_size: int = 1,
+    ) -> Iterator[Tuple[Candle, Dict[str, Reading]]]:
+        """Generator pushing Candles through the `Hexital` as they're read, for backtests too
+        large to hold in memory. While streaming, each Candle manager only retains the lookback
+        of it's indicators as with `auto_retention`, evicting older Candles and their readings.
+        Candles with any indicator of unknown lookback are kept in full.
+
+        Args:
+            candles: Iterable of Candle's, E.G a generator reading a file
+            timeframe: A specific timeframe to append Candle's into
+            batch_size: Amount of Candles appended and calculated at a time
+
+        Yields:
+            Tuple: The latest Candle, with the latest reading of each indicator after each batch
+        """
+        self._set_retention(force=True)
+        try:
+            batch = []
+            for candle in candles:
+                batch.append(candle)
+                if len(batch) >= batch_size:
+                    yield self._stream_batch(batch, timeframe)
+                    batch = []
+
+            if batch:
+                yield self._stream_batch(batch, timeframe)
+        finally:
+            self._set_retention()
+
+    def _stream_batch(
+        self, candles: Candles, timeframe: Optional[TimeFramesSource]
+    ) -> Tuple[Candle, Dict[str, Reading]]:
+        self.append(candles, timeframe)
+
+        candle = self.candles(timeframe)[-1]
+        # Columnar views are positional, evicting Candles would move them
+        if isinstance(candle, CandleView):
+            candle = candle._store.candle(candle._row)
+        return candle, self._latest_readings()
+
+    def _latest_readings(self) -> Dict[str, Reading]:
+        return {name: self.reading(name) for name in self._indicators}
+
+    def _check_buffers(self):
+        """Raises `BufferHeld` before changing any Candles or readings, if a buffer of any of the
+        columnar Candles is still held"""
+        for manager in self._candle_map.values():
+            manager.check_buffers()
+
+    def _candles_changed(self):
+        """Calculates the new Candles, with `lazy` only marking every indicator stale. Lazily,
+        Candle managers are only retained while all of their indicators are caught up"""
+        if not self.lazy:
+            self.calculate()
+            return
+
+        stale = {
+            indicator.candle_manager.name
+            for indicator in self._indicators.values()
+            if indicator._stale
+        }
+        for name, manager in self._candle_map.items():
+            if name not in stale:
+                manager.retain()
+
+        for indicator in self._indicators.values():
+            indicator._stale = True
+
+    def _refresh(self, *sources: Optional[Source]):
+        """With `lazy`, catches up the stale indicators of the given sources before they're read.
+        Indicator and NestedSource sources catch up themselves, a name not belonging to an
+        indicator or Candle field catches up every stale indicator"""
+        if not self.lazy:
+            return
+
+        for source in sources:
+            if not source or not isinstance(source, str):
+                continue
+            if indicator := self._indicators.get(source.split(".")[0]):
+                if indicator._stale:
+                    indicator._refresh()
+            elif not hasattr(Candle, source):
+                for indicator in self._indicators.values():
+                    if indicator._stale:
+                        indicator._refresh()
+
+    def _set_dependencies(self):
+        """Indicators read by another indicator, as the source of it or any of it's sub and
+        managed indicators, or as an Amorph analysis argument. So a lazy catch up of an
+        indicator first catches up everything it reads"""
+        for indicator in self._indicators.values():
+            dependencies = []
+            for source in self._dependency_sources(indicator):
+                if isinstance(source, (Indicator, NestedSource)):
+                    source = source.name
+                if not isinstance(source, str):
+                    continue
+                dependency = self._indicators.get(source.split(".")[0])
+                if (
+                    dependency is not None
+                    and dependency is not indicator
+                    and dependency not in dependencies
+                ):
+                    dependencies.append(dependency)
+            indicator._dependencies = dependencies
+
+    @staticmethod
+    def _dependency_sources(indicator: Indicator) -> List[Any]:
+        sources = []
+        for member in indicator.tree():
+            sources.append(getattr(member, "source", None))
+            sources.extend(getattr(member, "_analysis_kwargs", {}).values())
+        return sources
 
     def calculate(self, name: Optional[str] = None):
         """Calculates all the missing indicator readings."""
+        self._check_buffers()
         for indicator_name, indicator in self._indicators.items():
             if name is None or indicator_name == name:
                 indicator.calculate()
 
+        if name is None:
+            for manager in self._candle_map.values():
+                manager.retain()
+
+    def backfill(self, workers: Optional[int] = None, chunk_size: Optional[int] = None):
+        """Calculates all the missing indicator readings, splitting the Candles into chunks
+        calculated in parallel worker processes. Readings match `calculate` within rounding.
+
+        Args:
+            workers: Amount of worker processes, defaults to the CPU count, 0 to run in process
+            chunk_size: Amount of Candles calculated by each chunk
+        """
+        from hexital.core.backfill import BACKFILL_CHUNK, backfill
+
+        backfill(self, workers, chunk_size or BACKFILL_CHUNK)
+
+    def save_snapshot(self, path: str):
+        """Writes the Candles, readings and settings into a versioned binary snapshot file,
+        restored with `Hexital.load_snapshot`. See `hexital.core.snapshot`"""
+        from hexital.core.snapshot import save_snapshot
+
+        save_snapshot(self, path)
+
+    @staticmethod
+    def load_snapshot(path: str) -> Hexital:
+        """Restores a `Hexital` from a snapshot file, without re-calculating any readings.
+        Snapshots contain pickled data, only load snapshots from trusted sources"""
+        from hexital.core.snapshot import load_snapshot
+
+        return load_snapshot(path)
+
+    def export_state(self) -> Dict[str, dict]:
+        """Minimal state of each Indicator supporting warm starts, to seed an identical `Hexital`
+        with `seed_state` from only the latest few Candles. See `Indicator.export_state`"""
+        return {
+            name: indicator.export_state()
+            for name, indicator in self._indicators.items()
+            if indicator.state_period() is not None
+        }
+
+    def seed_state(self, states: Dict[str, dict]):
+        """Warm starts each Indicator from it's state created by `export_state`, the Candles must
+        contain the Candles of each state. Indicators without a state are calculated as normal.
+
+        Args:
+            states: State of each Indicator by name
+        """
+        for name, state in states.items():
+            indicator = self._indicators.get(name)
+            if indicator is None:
+                raise InvalidIndicator(f"Indicator {name} does not exist in {self.name}")
+            indicator.seed_state(state)
+
+        self.calculate()
+
     def calculate_index(
         self, name: Optional[str] = None, index: int = -1, end_index: Optional[int] = None
     ):
@@ -374,14 +834,68 @@ class Hexital:
                     candlestick=indicator.candlestick
                     if indicator.candlestick
                     else self.candlestick,
+                    columnar=self.columnar,
+                    max_candles=self.max_candles,
+                    trade_refresh=self.trade_refresh,
                 )
 
-                manager.append(self._candle_map[self._default_name].candles)
+                if source := self._derive_source(manager):
+                    manager.derive_from(source)
+                else:
+                    manager.append(self._candle_map[self._default_name].candles)
                 self._candle_map[manager.name] = manager
                 indicator.candle_manager = manager
 
         return valid_indicators
 
+    def _share_sub_indicators(self):
+        """Builds the graph of all sub indicators keyed by their canonical settings, identical sub
+        indicators on the same Candles follow the first one in calculation order. Followers share
+        the readings rather than calculating them, keeping their own reading names."""
+        shared: Dict[tuple, Indicator] = {}
+
+        for indicator in self._indicators.values():
+            for node in indicator.tree():
+                node.unfollow()
+
+            leaders: Dict[tuple, Indicator] = {}
+            self._share_tree(indicator, shared, leaders)
+            # Only shared with later indicators, which are calculated after the leader
+            for key, leader in leaders.items():
+                shared.setdefault(key, leader)
+
+    def _share_tree(
+        self, indicator: Indicator, shared: Dict[tuple, Indicator], leaders: Dict[tuple, Indicator]
+    ):
+        for sub_indicator in indicator.sub_indicators.values():
+            key = sub_indicator.share_key()
+            if key is not None and key in shared and sub_indicator.follow(shared[key]):
+                continue
+            if key is not None:
+                leaders.setdefault(key, sub_indicator)
+            self._share_tree(sub_indicator, shared, leaders)
+
+    def _set_retention(self, force: bool = False):
+        """With `auto_retention` or forced, each Candle manager retains the largest lookback of
+        the indicators on it's Candles plus `RETENTION_MARGIN`. Candles are kept in full if any
+        indicator's lookback is unknown"""
+        lookbacks: Dict[str, List[Optional[int]]] = {name: [] for name in self._candle_map}
+        for indicator in self._indicators.values():
+            lookbacks[indicator.candle_manager.name].append(indicator.lookback())
+
+        for name, manager in self._candle_map.items():
+            if not (self.auto_retention or force) or None in lookbacks[name]:
+                manager.retention = None
+            else:
+                manager.retention = max(lookbacks[name], default=0) + RETENTION_MARGIN
+
+    def _derive_source(self, manager: CandleManager) -> CandleManager | None:
+        """Finds the highest timeframe manager the new manager's Candles can be derived from"""
+        sources = [source for source in self._candle_map.values() if manager.derivable_from(source)]
+        if not sources:
+            return None
+        return max(sources, key=lambda source: source.timeframe or timedelta(0))
+
     def _build_indicator(self, raw_indicator: dict) -> Indicator:
         indicator = copy(raw_indicator)
 
@@ -418,6 +932,7 @@ class Hexital:
     def find_candle_pairing(
         self, indicator: str, indicator_cmp: Optional[str] = None
     ) -> Tuple[List[Candle], List[Candle]]:
+        self._refresh(indicator, indicator_cmp)
         reverted = False
 
         if indicator and not indicator_cmp:
@@ -456,6 +971,11 @@ class HexitalCol(Generic[T], Hexital):
         timeframe_fill: bool = False,
         candle_life: Optional[timedelta] = None,
         candlestick: Optional[CandlestickType | str] = None,
+        columnar: bool = False,
+        max_candles: Optional[int] = None,
+        trade_refresh: Optional[timedelta] = None,
+        auto_retention: bool = False,
+        lazy: bool = False,
     ):
         self.collection = indicators
 
@@ -468,4 +988,9 @@ class HexitalCol(Generic[T], Hexital):
             timeframe_fill,
             candle_life,
             candlestick,
+            columnar,
+            max_candles,
+            trade_refresh,
+            auto_retention,
+            lazy,
         )
@@ -2,27 +2,41 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from copy import copy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import timedelta
 from enum import Enum, auto
-from typing import Dict, Generic, List, Optional, Tuple, TypeAlias, TypeVar
+from math import ceil, isclose, log
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeAlias,
+    TypeVar,
+)
 
 from hexital.core import Reading
 from hexital.core.candle import Candle
 from hexital.core.candle_manager import CandleManager, Candles
+from hexital.core.candle_store import CandleStore, CandleView
 from hexital.core.candlestick_type import CandlestickType
+from hexital.core.reading_window import ReadingWindow
+from hexital.exceptions import InvalidConfiguration
+from hexital.utils import vectorized
 from hexital.utils.candles import (
-    candles_average,
-    candles_sum,
     get_readings_period,
+    reading_accessor,
     reading_by_candle,
-    reading_by_index,
     reading_count,
     reading_period,
 )
 from hexital.utils.candlesticks import validate_candlesticktype
 from hexital.utils.common import round_values
-from hexital.utils.indexing import absindex, valid_index
+from hexital.utils.indexing import absindex
+from hexital.utils.rolling import RollingSum
 from hexital.utils.timeframe import (
     TimeFramesSource,
     convert_timeframe_to_timedelta,
@@ -32,6 +46,35 @@ from hexital.utils.timeframe import (
 T = TypeVar("T")
 V = TypeVar("V")
 
+# Settings which don't affect whether Indicators on the same Candles are identical
+_SHARE_IGNORED = (
+    "name",
+    "candles",
+    "timeframe",
+    "timeframe_fill",
+    "candle_life",
+    "max_candles",
+    "candlestick",
+)
+
+# Relative error a recursive reading's starting point must decay to, before it's considered warm
+CONVERGENCE = 1e-10
+
+
+def convergence(decay: float) -> int:
+    """Amount of steps for a recursive reading's starting point to decay within `CONVERGENCE`,
+    where each step multiplies it by decay, E.G EMA: 1 - alpha"""
+    if not 0 < decay < 1:
+        return 0
+    return ceil(log(CONVERGENCE) / log(decay))
+
+
+def converged(reading: Reading, existing: Reading, tolerance: float) -> bool:
+    """Whether a reading matches an existing reading, floats within the relative tolerance"""
+    if type(reading) is float and type(existing) is float:
+        return isclose(reading, existing, rel_tol=tolerance)
+    return reading == existing
+
 
 class IndicatorMode(Enum):
     SOLO = auto()
@@ -46,6 +89,7 @@ class Indicator(Generic[V], ABC):
     timeframe: Optional[TimeFramesSource] = None
     timeframe_fill: bool = False
     candle_life: Optional[timedelta] = None
+    max_candles: Optional[int] = None
     candlestick: Optional[CandlestickType | str] = None
     rounding: Optional[int] = 4
 
@@ -61,6 +105,23 @@ class Indicator(Generic[V], ABC):
     _candle_mngr: CandleManager = field(init=False)
 
     _initialised: bool = field(init=False, default=False)
+    _rolling_sums: Dict[Tuple[str, int, bool], RollingSum] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+    _accessors: Tuple[Optional[List[Candle]], Dict[str, Callable]] = field(
+        init=False, default=(None, None), repr=False, compare=False
+    )
+    _nested_sources: Dict[str, NestedSource] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+    _leader: Optional[Indicator] = field(init=False, default=None, repr=False, compare=False)
+    _follow_pairs: List[Tuple[Indicator, Indicator]] = field(
+        init=False, default_factory=list, repr=False, compare=False
+    )
+    _stale: bool = field(init=False, default=False, repr=False, compare=False)
+    _dependencies: List[Indicator] = field(
+        init=False, default_factory=list, repr=False, compare=False
+    )
 
     def __post_init__(self):
         self._validate_fields()
@@ -77,6 +138,7 @@ class Indicator(Generic[V], ABC):
             self._timeframe,
             self.timeframe_fill,
             self.candlestick,
+            max_candles=self.max_candles,
         )
 
         self.candles = self._candle_mngr.candles
@@ -121,6 +183,7 @@ class Indicator(Generic[V], ABC):
         self._timeframe = manager.timeframe
         self.timeframe_fill = manager.timeframe_fill
         self.candle_life = manager.candle_life
+        self.max_candles = manager.max_candles
         self.candlestick = manager.candlestick
 
     @property
@@ -146,6 +209,8 @@ class Indicator(Generic[V], ABC):
         for name, value in self.__dict__.items():
             if name in ["candles", "managed_indicators", "sub_indicators"]:
                 continue
+            if name not in self.__dataclass_fields__:
+                continue
             if name == "timeframe_fill" and self._timeframe is None:
                 continue
 
@@ -178,6 +243,28 @@ class Indicator(Generic[V], ABC):
         """
         return self._find_readings(name)
 
+    def window(self, length: Optional[int] = None, name: Optional[Source] = None) -> ReadingWindow:
+        """
+        Live view of the latest readings within the candles, without copying.
+
+        Unlike `readings`, no list is built, each access reads straight from the candles and
+        the window moves along as candles are appended. `ReadingWindow.buffer` and
+        `ReadingWindow.numpy` export it as floats sharing storage with columnar candles.
+
+        Args:
+            length (Optional[int]): Amount of latest readings, every reading if not provided.
+            name (Optional[str]): The name of the indicator or candle field to view.
+                                  Defaults to `self.name` if not provided.
+
+        Returns:
+            ReadingWindow: A sequence of the latest readings.
+        """
+        if isinstance(name, NestedSource):
+            return ReadingWindow(name.indicator._candle_mngr, name.name, length, name.indicator)
+        if isinstance(name, Indicator):
+            return ReadingWindow(name._candle_mngr, name.name, length, name)
+        return ReadingWindow(self._candle_mngr, name or self.name, length, self)
+
     def prepend(self, candles: Candles):
         """Prepends a Candle or a chronological ordered list of Candle's to the front of the Indicator Candle's. This will only re-sample and re-calculate the new Candles, with minor overlap.
 
@@ -198,13 +285,14 @@ class Indicator(Generic[V], ABC):
         self.calculate()
 
     def insert(self, candles: Candles):
-        """insert a Candle or a list of Candle's to the Indicator Candles. This accepts any order or placement. This will sort, re-sample and re-calculate all Candles.
+        """insert a Candle or a list of Candle's to the Indicator Candles. This accepts any order or placement. Only re-calculates from the earliest inserted Candle, until it's readings converge.
 
         Args:
             candles: The Candle or List of Candle's to prepend.
         """
-        self._candle_mngr.insert(candles)
-        self.calculate_index(0, -1)
+        changed = self._candle_mngr.insert(candles)
+        if changed is not None:
+            self.calculate_changed(*changed)
 
     @property
     def prior_calc(self) -> bool:
@@ -215,6 +303,101 @@ class Indicator(Generic[V], ABC):
     @abstractmethod
     def _calculate_reading(self, index: int) -> V: ...
 
+    def warmup(self) -> Optional[int]:
+        """Amount of prior Candles a reading depends on, calculated from only that many Candles
+        a reading matches one calculated from the first Candle within rounding.
+        None if unbounded or unknown, E.G cumulative Indicators"""
+        return None
+
+    def horizon(self) -> Optional[int]:
+        """Amount of Candles a Candle influences the readings of, from that Candle on. When
+        re-calculating existing readings, E.G after a prepend, re-calculation stops once past
+        the horizon of the new Candles. The `warmup` when reading a Candle field, None if
+        unbounded or when reading another Indicator's readings"""
+        source = getattr(self, "source", "close")
+        if not isinstance(source, str) or source not in vectorized.CANDLE_FIELDS:
+            return None
+        return self.warmup()
+
+    def tolerance(self) -> float:
+        """Relative difference within which a re-calculated reading has converged onto the
+        existing reading, stopping re-calculation"""
+        return CONVERGENCE
+
+    def lookback(self) -> Optional[int]:
+        """Amount of latest Candles the readings depend on, including the latest Candle. Enough
+        for the first reading, and for each reading after, as prior readings are kept on the
+        Candles. Covers all of it's sub and managed Indicators, where an Indicator reads
+        another's readings over a window their windows add up. None if unbounded or unknown"""
+        return None
+
+    def state_period(self) -> Optional[int]:
+        """Amount of prior Candles the next reading depends on, through the readings of this
+        Indicator and all of it's sub and managed Indicators. Those readings along with their
+        Candles are enough to carry on calculating, see `export_state`. None if not supported"""
+        return None
+
+    def export_state(self) -> dict:
+        """Minimal state to warm start an identical Indicator with `seed_state`, the readings of
+        this Indicator and all of it's sub and managed Indicators over the latest
+        `state_period` + 1 Candles, the extra Candle allowing the latest to be re-calculated.
+
+        Returns:
+            dict: The state's Candle timestamps and readings of each Indicator by name
+        """
+        period = self.state_period()
+        if period is None:
+            raise InvalidConfiguration(f"Indicator {self.name} does not support warm starts")
+
+        end = len(self.candles)
+        start = max(end - period - 1, 0)
+        return {
+            "name": self.name,
+            "timestamps": [candle.timestamp for candle in self.candles[start:]],
+            "readings": {
+                indicator.name: [copy(indicator.reading(index=i)) for i in range(start, end)]
+                for indicator in self.tree()
+            },
+        }
+
+    def seed_state(self, state: dict):
+        """Warm starts this Indicator from a state created by `export_state`, rather than
+        calculating from the full Candle history. The Candles must contain the state's Candles,
+        E.G only the latest few Candles. Readings before the state are set to None, any after
+        are calculated on from the state.
+
+        Args:
+            state: State exported from an identical Indicator
+        """
+        self.check_initialised()
+        timestamps = state["timestamps"]
+        candles = self.candles
+
+        end = len(candles) - 1
+        while end >= 0 and timestamps and candles[end].timestamp != timestamps[-1]:
+            end -= 1
+        start = end - len(timestamps) + 1
+
+        if start < 0 or [candle.timestamp for candle in candles[start : end + 1]] != timestamps:
+            raise InvalidConfiguration(f"Candles do not contain the state of {self.name}")
+
+        for indicator in self.tree():
+            readings = state["readings"].get(indicator.name)
+            if readings is None:
+                raise InvalidConfiguration(f"State of {self.name} is missing {indicator.name}")
+
+            indicator._rolling_sums.clear()
+            for index in range(end + 1):
+                indicator._set_reading(readings[index - start] if index >= start else None, index)
+
+        self._set_bulk_active_index(end)
+        self.calculate()
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        """Vectorized readings from start to the latest Candle,
+        Indicators which support bulk calculation override this, None if not supported"""
+        return None
+
     def _calculate_sub_indicators(
         self,
         prior_calc: bool,
@@ -233,20 +416,110 @@ class Indicator(Generic[V], ABC):
     def calculate(self):
         """Calculate the TA values, will calculate for all the Candles,
         where this indicator is missing"""
+        self._stale = False
         self.check_initialised()
+        start_index = self._find_calc_index()
+
+        if self._bulk_calculable(start_index) and self._calculate_bulk(start_index) is not None:
+            self._set_bulk_active_index(len(self.candles) - 1)
+            return
 
-        for index in range(self._find_calc_index(), len(self.candles)):
+        # Once re-calculating existing readings, E.G after a prepend, index past which the
+        # readings are beyond the influence of the new Candles
+        settled = None
+        last_index = len(self.candles) - 1
+
+        for index in range(start_index, len(self.candles)):
             self._set_active_index(index)
             self._calculate_sub_indicators(True, index)
 
             reading = round_values(self._calculate_reading(index=index), round_by=self.rounding)
 
-            if index < len(self.candles) - 1 and self._reading_dup(reading, self.candles[index]):
-                break
+            if index < last_index:
+                candle = self.candles[index]
+                if settled is None and self._has_reading(candle):
+                    horizon = self.horizon()
+                    settled = index + horizon if horizon is not None else len(self.candles)
+                if (settled is not None and index >= settled) or self._reading_dup(reading, candle):
+                    # Candles appended before the re-calculation, E.G by a lazy `Hexital`, may
+                    # still be missing their readings after the settled ones
+                    if self._find_calc_index() > index:
+                        self.calculate()
+                    return
 
             self._set_reading(reading, index)
             self._calculate_sub_indicators(False, index)
 
+    def _refresh(self):
+        """Catches up a stale indicator in one pass, after any stale indicators it reads from.
+        Indicators are only marked stale by a lazy `Hexital`"""
+        self._candle_mngr.check_buffers()
+        self._stale = False
+        for dependency in self._dependencies:
+            if dependency._stale:
+                dependency._refresh()
+        self.calculate()
+
+    def _bulk_calculable(self, start_index: int) -> bool:
+        if vectorized.BULK_THRESHOLD is None or not vectorized.available():
+            return False
+        missing = self._first_calculated(start_index) - start_index
+        return missing >= max(vectorized.BULK_THRESHOLD, 1)
+
+    def _first_calculated(self, start_index: int) -> int:
+        """Index of the first Candle from start_index holding a reading, E.G the first Candle
+        before a prepend, or the amount of Candles if none"""
+        if isinstance(self.candles, CandleStore):
+            series = self.candles.series(self.name)
+            first = series.first_index() if series is not None else -1
+            return first if first >= start_index else len(self.candles)
+
+        for index in range(start_index, len(self.candles)):
+            if self._has_reading(self.candles[index]):
+                return index
+        return len(self.candles)
+
+    def _calculate_bulk(self, start_index: int) -> Optional[vectorized.BulkReadings]:
+        """Calculates and sets all readings from start_index in bulk,
+        returns the unrounded readings or None if not supported"""
+        self.check_initialised()
+        readings = self._bulk_readings(start_index)
+        if readings is not None:
+            self._set_bulk_readings(readings, start_index)
+        return readings
+
+    def _set_bulk_readings(self, readings: vectorized.BulkReadings, start_index: int):
+        if isinstance(readings, dict):
+            rows = vectorized.to_dict_readings(readings, self.rounding)
+        else:
+            rows = vectorized.to_readings(readings, self.rounding)
+
+        sub = self._mode != IndicatorMode.SOLO
+        if isinstance(self.candles, CandleStore):
+            self.candles.set_readings(self.name, rows, start_index, sub)
+            return
+
+        for candle, reading in zip(self.candles[start_index:], rows):
+            if sub:
+                candle.sub_indicators[self.name] = reading
+            else:
+                candle.indicators[self.name] = reading
+
+    def _set_bulk_active_index(self, index: int):
+        self._set_active_index(index)
+        for indicator in [*self.sub_indicators.values(), *self.managed_indicators.values()]:
+            indicator._set_bulk_active_index(index)
+
+    def _bulk_prev(self, start_index: int, source: Optional[Source] = None) -> Reading | V:
+        """Reading prior to start_index, None if start_index is the first Candle"""
+        return self.reading(source, start_index - 1) if start_index else None
+
+    def _bulk_source(self, source: Optional[Source] = None) -> Optional[vectorized.ndarray]:
+        """Source values of all Candles as an array, None if it's not a Candle field"""
+        if isinstance(source, str) and source in vectorized.CANDLE_FIELDS:
+            return vectorized.candle_values(self.candles, source)
+        return None
+
     def _reading_dup(self, reading: Reading | V, candle: Candle) -> bool:
         """Optimisation method for 'calculate'.
         if calculating and not on latest Candle, check if reading match's a pre-existing reading.
@@ -254,16 +527,28 @@ class Indicator(Generic[V], ABC):
         It also means if Candles are prepended they will be calculated, and already calculated readings
         will be re-calculated using new prepended candles data until the reading stabilises.
         """
-        if reading is None:
+        if reading is None or (
+            isinstance(reading, dict) and all(value is None for value in reading.values())
+        ):
             return False
-        cur_reading = candle.indicators.get(self.name, candle.sub_indicators.get(self.name))
+        if isinstance(candle, CandleView):
+            cur_reading = candle._store.reading(self.name, candle._row)
+        elif candle._indicators and self.name in candle._indicators:
+            cur_reading = candle._indicators[self.name]
+        else:
+            cur_reading = (candle._sub_indicators or {}).get(self.name)
 
         if cur_reading is None:
             return False
-
-        elif reading == cur_reading:
+        if reading == cur_reading:
             return True
-        return False
+
+        tolerance = self.tolerance()
+        if isinstance(reading, dict) and isinstance(cur_reading, dict):
+            return reading.keys() == cur_reading.keys() and all(
+                converged(value, cur_reading[key], tolerance) for key, value in reading.items()
+            )
+        return converged(reading, cur_reading, tolerance)
 
     def calculate_index(self, start_index: int, end_index: Optional[int] = None):
         """Calculate the TA values, will calculate a index range the Candles, will re-calculate"""
@@ -277,6 +562,9 @@ class Indicator(Generic[V], ABC):
             end_index = start_index
 
         for index in range(start_index, end_index + 1):
+            if self._leader is not None and self._follow(index):
+                continue
+
             self._set_active_index(index)
             self._calculate_sub_indicators(True, index)
 
@@ -285,27 +573,114 @@ class Indicator(Generic[V], ABC):
             self._set_reading(reading, index)
             self._calculate_sub_indicators(False, index)
 
+    def calculate_changed(self, first: int, last: int):
+        """Re-calculates the readings after the Candles from index first to last changed, E.G
+        after an insert, until past the `horizon` of the last changed Candle. Any readings still
+        missing are then calculated"""
+        start, end = self._recalculate_range(first, last)
+        if start <= end:
+            self.calculate_index(start, end)
+        self.calculate()
+
+    def _recalculate_range(self, first: int, last: int) -> Tuple[int, int]:
+        """First and last index of the readings to re-calculate, after the Candles from index
+        first to last changed"""
+        last_index = len(self.candles) - 1
+        start_index = min(first, self._find_calc_index())
+        horizon = self.horizon()
+        if horizon is None:
+            return start_index, last_index
+        return start_index, min(last + horizon, last_index)
+
+    def tree(self) -> Iterator[Indicator]:
+        """This Indicator followed by all of it's sub and managed Indicators, initialising each"""
+        self.check_initialised()
+        yield self
+        for indicator in [*self.sub_indicators.values(), *self.managed_indicators.values()]:
+            yield from indicator.tree()
+
+    def share_key(self) -> Optional[tuple]:
+        """Canonical settings identifying an identical Indicator on the same Candles,
+        None if any setting is not a plain value, E.G an Indicator or NestedSource source"""
+        key = [type(self), id(self._candle_mngr), self._calc_prior, self.rounding]
+        for field_ in fields(self):
+            if not field_.init or field_.name in _SHARE_IGNORED:
+                continue
+            value = getattr(self, field_.name)
+            if value is not None and not isinstance(value, (str, int, float, bool)):
+                return None
+            key.append((field_.name, value))
+        return tuple(key)
+
+    def follow(self, leader: Indicator) -> bool:
+        """Shares the readings of an identical leader Indicator rather than calculating them,
+        including all of it's sub and managed Indicators. The leader must be calculated first.
+        Columnar Candles alias the leader's `ReadingSeries`, otherwise each Candle references
+        the leader's reading. Returns False if the Indicators are structured differently"""
+        followers = list(self.tree())
+        leaders = list(leader.tree())
+        if [type(i) for i in followers] != [type(i) for i in leaders]:
+            return False
+
+        self._leader = leader
+        self._follow_pairs = list(zip(followers, leaders))
+        return True
+
+    def unfollow(self):
+        """Calculates this Indicator's readings itself again, from a copy of any shared series"""
+        if isinstance(self.candles, CandleStore):
+            for follower, _ in self._follow_pairs:
+                self.candles.unalias(follower.name)
+        self._leader = None
+        self._follow_pairs = []
+
+    def _follow(self, index: int) -> bool:
+        """Shares the leader's readings at index, False if the leader has no reading yet"""
+        candles = self.candles
+        if isinstance(candles, CandleStore):
+            if not candles.has_reading(self._leader.name, index):
+                return False
+            for follower, leader in self._follow_pairs:
+                candles.alias(follower.name, leader.name)
+        else:
+            if not self._leader._has_reading(candles[index]):
+                return False
+            for follower, leader in self._follow_pairs:
+                candles[index].sub_indicators[follower.name] = leader.reading(index=index)
+
+        self._set_active_index(index)
+        return True
+
     def _find_calc_index(self) -> int:
         """Optimisation method, to find where to start calculating the indicator from
         Searches from newest to oldest to find the first candle without the indicator
         """
-        if not self.candles or (
-            self.name not in self.candles[0].indicators
-            and self.name not in self.candles[0].sub_indicators
-        ):
+        if isinstance(self.candles, CandleStore):
+            series = self.candles.series(self.name)
+            if series is None or not series.has(0):
+                return 0
+            return series.last_index() + 1
+
+        if not self.candles or not self._has_reading(self.candles[0]):
             return 0
 
         for index in range(len(self.candles) - 1, -1, -1):
-            if (
-                self.name in self.candles[index].indicators
-                or self.name in self.candles[index].sub_indicators
-            ):
+            if self._has_reading(self.candles[index]):
                 return index + 1
 
         return 0
 
+    def _has_reading(self, candle: Candle) -> bool:
+        """Checks if the Candle holds a reading for this indicator, even if it's None"""
+        if isinstance(candle, CandleView):
+            return candle._store.has_reading(self.name, candle._row)
+        return bool(
+            (candle._indicators and self.name in candle._indicators)
+            or (candle._sub_indicators and self.name in candle._sub_indicators)
+        )
+
     def _set_reading(self, reading: Reading, index: Optional[int] = None):
-        index = index if index else self._active_index
+        index = index if index is not None else self._active_index
 
         if self._mode != IndicatorMode.SOLO:
             self.candles[index].sub_indicators[self.name] = reading
@@ -348,21 +723,48 @@ class Indicator(Generic[V], ABC):
     def _find_reading(
         self, source: Optional[Source] = None, index: Optional[int] = None
     ) -> Reading | V:
+        if self._stale:
+            self._refresh()
+        candles = self.candles
         if index is None:
             index = self._active_index
-        elif valid_index(index, len(self.candles)):
-            index = index
-        else:
+        if not -len(candles) <= index < len(candles):
             return None
+        if index < 0:
+            index += len(candles)
 
-        if not source or (isinstance(source, str) and source == self.name):
-            return reading_by_index(self.candles, self.name, index)
+        if not source:
+            name = self.name
         elif isinstance(source, str):
-            return reading_by_index(self.candles, source, index)
+            name = source
         else:
-            return reading_by_index(self.candles, source.name, index)
+            name = source.name
+
+        cached, accessors = self._accessors
+        accessor = accessors.get(name) if cached is candles else None
+        if accessor is None:
+            accessor = self._accessor(name)
+        return accessor(index)
+
+    def _accessor(self, name: str) -> Callable[[int], Reading | V]:
+        """Reading accessor of the given name, resolved once per name and set of Candles"""
+        candles, accessors = self._accessors
+        if candles is not self.candles:
+            candles, accessors = self._accessors = (self.candles, {})
+
+        accessor = accessors.get(name)
+        if accessor is None:
+            accessor = accessors[name] = reading_accessor(candles, name)
+        return accessor
 
     def _find_readings(self, source: Optional[Source] = None) -> List[Reading | V]:
+        if self._stale:
+            self._refresh()
+        if isinstance(self.candles, CandleStore) and not isinstance(source, NestedSource):
+            if not source:
+                return self.candles.readings(self.name)
+            return self.candles.readings(source if isinstance(source, str) else source.name)
+
         if not source:
             return [reading_by_candle(candle, self.name) for candle in self.candles]
         elif isinstance(source, Indicator):
@@ -437,12 +839,7 @@ class Indicator(Generic[V], ABC):
         index: Optional[int] = None,
         include_latest: bool = True,
     ) -> float:
-        return candles_sum(
-            *self._find_candles(source),
-            length,
-            index if index is not None else self._active_index,
-            include_latest,
-        )
+        return self._rolling_sum(length, source, index, include_latest).total
 
     def candles_average(
         self,
@@ -451,12 +848,35 @@ class Indicator(Generic[V], ABC):
         index: Optional[int] = None,
         include_latest: bool = True,
     ) -> float:
-        return candles_average(
-            *self._find_candles(source),
-            length,
-            index if index is not None else self._active_index,
-            include_latest,
-        )
+        return self._rolling_sum(length, source, index, include_latest).average
+
+    def _rolling_sum(
+        self,
+        length: int,
+        source: Optional[Source],
+        index: Optional[int],
+        include_latest: bool,
+    ) -> RollingSum:
+        """Rolling sum of the source over length, moved to end at the index. Re-used across
+        calls, so stepping forward one Candle at a time is O(1)"""
+        candles, name = self._find_candles(source)
+        index_ = absindex(index if index is not None else self._active_index, len(candles))
+
+        key = (name, length, include_latest)
+        rolling = self._rolling_sums.get(key)
+        if rolling is None:
+            rolling = self._rolling_sums[key] = RollingSum(name, length)
+
+        rolling.update(candles, index_ + 1 if include_latest else index_, self._trimmed(source))
+        return rolling
+
+    def _trimmed(self, source: Optional[Source] = None) -> int:
+        """Amount of Candles trimmed from the front of the source's Candles"""
+        if isinstance(source, NestedSource):
+            source = source.indicator
+        if isinstance(source, Indicator):
+            return source._candle_mngr._trimmed
+        return self._candle_mngr._trimmed
 
     def get_readings_period(
         self,
@@ -521,8 +941,25 @@ class Managed(Indicator):
 
 
 class NestedSource:
+    """A named field of an indicator's dict readings, E.G `NestedSource(self.data, "gain")`.
+
+    Instances are re-used per indicator and nested name, creating the same NestedSource on
+    every Candle doesn't allocate, and it's name is only rebuilt if the indicator is renamed."""
+
     indicator: Indicator
     nested_name: str
+    _indicator_name: Optional[str]
+    _name: str
+
+    def __new__(cls, indicator: Optional[Indicator] = None, nested_name: str = ""):
+        sources = getattr(indicator, "_nested_sources", None)
+        source = sources.get(nested_name) if sources is not None else None
+        if source is None or source.indicator is not indicator:
+            source = super().__new__(cls)
+            source._indicator_name = None
+            if sources is not None:
+                sources[nested_name] = source
+        return source
 
     def __init__(self, indicator: Indicator, nested_name: str):
         self.indicator = indicator
@@ -534,7 +971,10 @@ class NestedSource:
 
     @property
     def name(self):
-        return f"{self.indicator.name}.{self.nested_name}"
+        if self._indicator_name is not self.indicator.name:
+            self._indicator_name = self.indicator.name
+            self._name = f"{self.indicator.name}.{self.nested_name}"
+        return self._name
 
     def reading(self, index: Optional[int] = None) -> Reading:
         value = self.indicator.reading(index=index)
@@ -548,6 +988,9 @@ class NestedSource:
             for v in self.indicator.readings()
         ]
 
+    def window(self, length: Optional[int] = None) -> ReadingWindow:
+        return self.indicator.window(length, self)
+
     def __str__(self):
         return f"{self.indicator.name}.{self.nested_name}"
 
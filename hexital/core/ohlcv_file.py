@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import csv
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime, timezone, tzinfo
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from hexital.core.candle import Candle
+from hexital.core.candle_store import NO_TIME, micro_to_timestamp, timestamp_to_micro
+from hexital.exceptions import InvalidOHLCVFile
+
+OHLCV_MAGIC = b"HEXOHLCV"
+OHLCV_VERSION = 1
+
+# Default amount of Candles read per chunk
+OHLCV_CHUNK = 100000
+
+# Magic, version, flags
+_HEADER = struct.Struct("<8sII")
+# Timestamp as microseconds since epoch, open, high, low, close, volume
+_RECORD = struct.Struct("<q5d")
+_FIELDS = 6
+
+# Flag set when the timestamps are timezone aware, stored as UTC
+_FLAG_UTC = 1
+
+_SWAP = sys.byteorder != "little"
+
+# CSV header names, aliases match `Candle.from_dict`
+_CSV_NAMES = {
+    "timestamp": "timestamp",
+    "time": "timestamp",
+    "date": "timestamp",
+    "open": "open",
+    "high": "high",
+    "low": "low",
+    "close": "close",
+    "volume": "volume",
+}
+_CSV_ORDER = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+class OHLCVColumns(NamedTuple):
+    """A chunk of Candles as columns, timestamps as microseconds since epoch or `NO_TIME`.
+    Timestamps are timezone aware when `tz` is set"""
+
+    timestamp: array
+    open: array
+    high: array
+    low: array
+    close: array
+    volume: array
+    tz: Optional[tzinfo] = None
+
+    def candles(self) -> List[Candle]:
+        """The chunk as `Candle` objects"""
+        return [
+            Candle(open, high, low, close, volume, micro_to_timestamp(timestamp, self.tz))
+            for timestamp, open, high, low, close, volume in zip(*self[:_FIELDS])
+        ]
+
+
+def candles_to_columns(candles: Iterable[Candle]) -> OHLCVColumns:
+    """Converts Candles into columns, the timezone is taken from the first aware timestamp"""
+    columns = OHLCVColumns(*(array("q" if i == 0 else "d") for i in range(_FIELDS)))
+    tz = None
+    for candle in candles:
+        if tz is None and candle.timestamp is not None:
+            tz = candle.timestamp.tzinfo
+        columns.timestamp.append(timestamp_to_micro(candle.timestamp))
+        columns.open.append(candle.open)
+        columns.high.append(candle.high)
+        columns.low.append(candle.low)
+        columns.close.append(candle.close)
+        columns.volume.append(candle.volume)
+    return columns._replace(tz=tz)
+
+
+def _read_header(header: bytes, path: str) -> int:
+    if len(header) < _HEADER.size:
+        raise InvalidOHLCVFile(f"OHLCV file is truncated: {path}")
+
+    magic, version, flags = _HEADER.unpack_from(header)
+    if magic != OHLCV_MAGIC:
+        raise InvalidOHLCVFile(f"Not a Hexital OHLCV file: {path}")
+    if version != OHLCV_VERSION:
+        raise InvalidOHLCVFile(
+            f"OHLCV file version {version} is not supported, expected {OHLCV_VERSION}"
+        )
+    return flags
+
+
+def write_ohlcv(path: str, candles: Iterable[Candle] | OHLCVColumns, append: bool = False):
+    """Writes Candles into a fixed width binary OHLCV file, read back with `read_ohlcv`.
+
+    Layout: a 16 byte header of magic, version and flags, followed by a 48 byte little endian
+    record per Candle, of the timestamp as microseconds since epoch then open, high, low, close
+    and volume as doubles. Timezone aware timestamps are stored as UTC. Only the OHLCV values
+    and timestamp of each Candle are written.
+
+    Args:
+        path: File path to write to
+        candles: The Candles, or columns of Candles E.G from `read_csv`
+        append: Append to an existing file instead of replacing it
+    """
+    columns = candles if isinstance(candles, OHLCVColumns) else candles_to_columns(candles)
+    flags = _FLAG_UTC if columns.tz is not None else 0
+
+    count = len(columns.timestamp)
+    records = array("d", bytes(_RECORD.size * count))
+    records[0::_FIELDS] = array("d", columns.timestamp.tobytes())
+    for field, column in enumerate(columns[1:_FIELDS], start=1):
+        records[field::_FIELDS] = column if column.typecode == "d" else array("d", column)
+    if _SWAP:
+        records.byteswap()
+
+    if append and os.path.exists(path) and os.path.getsize(path):
+        with open(path, "rb") as file:
+            existing = _read_header(file.read(_HEADER.size), path)
+        if count and existing != flags:
+            raise InvalidOHLCVFile(
+                f"Can't mix timezone aware and naive timestamps in OHLCV file: {path}"
+            )
+        with open(path, "ab") as file:
+            file.write(records.tobytes())
+        return
+
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(OHLCV_MAGIC, OHLCV_VERSION, flags))
+        file.write(records.tobytes())
+
+
+def read_ohlcv(path: str, chunk_size: int = OHLCV_CHUNK) -> Iterator[OHLCVColumns]:
+    """Reads a binary OHLCV file written by `write_ohlcv` in chunks of columns. The file is
+    memory mapped, each chunk's records are copied in one go and split into columns by stride.
+
+    Args:
+        path: File path of the OHLCV file
+        chunk_size: Amount of Candles per chunk
+
+    Yields:
+        OHLCVColumns: Each chunk of Candles as columns
+    """
+    with open(path, "rb") as file:
+        flags = _read_header(file.read(_HEADER.size), path)
+        size = os.fstat(file.fileno()).st_size
+        if (size - _HEADER.size) % _RECORD.size:
+            raise InvalidOHLCVFile(f"OHLCV file is truncated: {path}")
+        if size == _HEADER.size:
+            return
+
+        tz = timezone.utc if flags & _FLAG_UTC else None
+        step = chunk_size * _RECORD.size
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            with memoryview(data) as view:
+                for start in range(_HEADER.size, size, step):
+                    values = array("d")
+                    values.frombytes(view[start : start + step])
+                    timestamps = array("q")
+                    timestamps.frombytes(view[start : start + step])
+                    if _SWAP:
+                        values.byteswap()
+                        timestamps.byteswap()
+
+                    yield OHLCVColumns(
+                        timestamps[0::_FIELDS],
+                        *(values[field::_FIELDS] for field in range(1, _FIELDS)),
+                        tz=tz,
+                    )
+
+
+def _is_numeric(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_timestamps(values: Iterable[str], numeric: bool) -> array:
+    if numeric:
+        return array("q", (round(float(value) * 1e6) for value in values))
+    parse = datetime.fromisoformat
+    return array("q", (timestamp_to_micro(parse(value)) if value else NO_TIME for value in values))
+
+
+def _split_fields(lines: List[str], width: int, delimiter: str) -> List[str]:
+    """Every field of the lines as one flat list, row after row. Lines are split in one go,
+    unless quoted or ragged, which are left to the `csv` module"""
+    text = "".join(lines)
+    if '"' not in text:
+        fields = text.replace("\n", delimiter).split(delimiter)
+        if fields[-1] == "":
+            fields.pop()
+        if len(fields) == len(lines) * width:
+            return fields
+
+    rows = [row for row in csv.reader(lines, delimiter=delimiter) if row]
+    if any(len(row) != width for row in rows):
+        raise InvalidOHLCVFile(f"CSV rows must each have {width} columns")
+    return list(chain.from_iterable(rows))
+
+
+def read_csv(
+    path: str, chunk_size: int = OHLCV_CHUNK, delimiter: str = ","
+) -> Iterator[OHLCVColumns]:
+    """Reads Candles from a CSV file in chunks of columns, rows are never turned into `Candle`
+    objects or dicts. Each chunk of lines is split into one flat list of fields, every column
+    then being a strided slice of it. A header row naming the columns is optional, without one
+    the columns are taken as `[timestamp], open, high, low, close, volume`, like
+    `Candle.from_list`.
+
+    Timestamps are either ISO format strings or numeric seconds since epoch, which are read as
+    UTC. Timezone aware ISO timestamps take their timezone from the first row.
+
+    Args:
+        path: File path of the CSV file
+        chunk_size: Amount of Candles per chunk
+        delimiter: CSV delimiter
+
+    Yields:
+        OHLCVColumns: Each chunk of Candles as columns
+    """
+    with open(path) as file:
+        first_line = file.readline()
+        if not first_line.strip():
+            return
+
+        first = next(csv.reader([first_line], delimiter=delimiter))
+        width = len(first)
+        names = [_CSV_NAMES.get(name.strip().lower()) for name in first]
+        lines: Iterator[str] = file
+        if "open" not in names:
+            names = list(_CSV_ORDER if width > 5 else _CSV_ORDER[1:])
+            lines = chain([first_line], file)
+
+        positions = {name: index for index, name in enumerate(names) if name}
+        missing = [name for name in _CSV_ORDER[1:] if name not in positions]
+        if missing:
+            raise InvalidOHLCVFile(f"CSV file is missing columns {missing}: {path}")
+
+        numeric = None
+        tz = None
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                return
+
+            fields = _split_fields(chunk, width, delimiter)
+            if not fields:
+                continue
+
+            if "timestamp" in positions:
+                stamps = fields[positions["timestamp"] :: width]
+                if numeric is None:
+                    numeric = _is_numeric(stamps[0])
+                    if numeric:
+                        tz = timezone.utc
+                    elif stamps[0]:
+                        tz = datetime.fromisoformat(stamps[0]).tzinfo
+                timestamps = _parse_timestamps(stamps, numeric)
+            else:
+                timestamps = array("q", [NO_TIME]) * (len(fields) // width)
+
+            yield OHLCVColumns(
+                timestamps,
+                *(
+                    array("d", map(float, fields[positions[name] :: width]))
+                    for name in _CSV_ORDER[1:]
+                ),
+                tz=tz,
+            )
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from math import nan
+from typing import List, Optional, Tuple
+
+from hexital.core import Reading
+
+ABSENT = 0
+PRESENT = 1
+_PRESENT_BYTE = bytes([PRESENT])
+
+# Minimum amount of empty slots reserved in front of a column, when a row is pushed to the front
+FRONT_RESERVE = 16
+
+
+def reserve_front(column: array | bytearray | list, size: int):
+    """Inserts `size` empty slots in front of the column, NaN/0 for arrays, None for lists"""
+    if isinstance(column, array):
+        filler = array(column.typecode, [nan if column.typecode == "d" else 0])
+        column[0:0] = filler * size
+    elif isinstance(column, bytearray):
+        column[0:0] = bytearray(size)
+    else:
+        column[0:0] = [None] * size
+
+
+def clear_slots(column: array | bytearray | list, start: int, stop: int):
+    """Empties the slots from start to stop, releasing any held objects"""
+    size = stop - start
+    if isinstance(column, array):
+        filler = array(column.typecode, [nan if column.typecode == "d" else 0])
+        column[start:stop] = filler * size
+    elif isinstance(column, bytearray):
+        column[start:stop] = bytearray(size)
+    else:
+        column[start:stop] = [None] * size
+
+
+class Coverage:
+    """Contiguous ranges of rows holding a valid, not `None`, reading.
+
+    Held as sorted `[start, stop)` runs, so whether a row is valid and how many consecutive
+    valid readings end at a row are a bisect over the runs, instead of a walk over the rows.
+    Setting the next row after the last run, the common case, extends it in O(1)."""
+
+    __slots__ = ("_starts", "_stops")
+
+    _starts: List[int]
+    _stops: List[int]
+
+    def __init__(self):
+        self._starts = []
+        self._stops = []
+
+    def __repr__(self) -> str:
+        return f"Coverage({self.ranges()!r})"
+
+    def _run(self, row: int) -> int:
+        """Index of the run containing the row, -1 if none"""
+        run = bisect_right(self._starts, row) - 1
+        if run >= 0 and row < self._stops[run]:
+            return run
+        return -1
+
+    def ranges(self) -> List[Tuple[int, int]]:
+        """Each `(start, stop)` range of consecutive valid rows"""
+        return list(zip(self._starts, self._stops))
+
+    def first(self) -> int:
+        """First valid row, -1 if none"""
+        return self._starts[0] if self._starts else -1
+
+    def valid(self, row: int) -> bool:
+        return self._run(row) != -1
+
+    def count(self, row: int) -> int:
+        """Amount of consecutive valid rows, ending at and including the row"""
+        run = self._run(row)
+        return row - self._starts[run] + 1 if run != -1 else 0
+
+    def add(self, row: int):
+        starts, stops = self._starts, self._stops
+        if stops and stops[-1] == row:
+            stops[-1] += 1
+            return
+
+        run = bisect_right(starts, row) - 1
+        if run >= 0 and row < stops[run]:
+            return
+
+        joins_prev = run >= 0 and stops[run] == row
+        joins_next = run + 1 < len(starts) and starts[run + 1] == row + 1
+        if joins_prev and joins_next:
+            stops[run] = stops[run + 1]
+            del starts[run + 1]
+            del stops[run + 1]
+        elif joins_prev:
+            stops[run] += 1
+        elif joins_next:
+            starts[run + 1] = row
+        else:
+            starts.insert(run + 1, row)
+            stops.insert(run + 1, row + 1)
+
+    def remove(self, row: int):
+        run = self._run(row)
+        if run == -1:
+            return
+
+        starts, stops = self._starts, self._stops
+        start, stop = starts[run], stops[run]
+        if start == row and stop == row + 1:
+            del starts[run]
+            del stops[run]
+        elif start == row:
+            starts[run] += 1
+        elif stop == row + 1:
+            stops[run] -= 1
+        else:
+            stops[run] = row
+            starts.insert(run + 1, row + 1)
+            stops.insert(run + 1, stop)
+
+    def insert(self, row: int):
+        """Shifts rows from the given row forward by one, for an inserted empty row"""
+        starts, stops = self._starts, self._stops
+        run = bisect_right(starts, row) - 1
+        if run >= 0 and row < stops[run] and starts[run] < row:
+            starts.insert(run + 1, row)
+            stops.insert(run + 1, stops[run])
+            stops[run] = row
+            run += 1
+        elif run < 0 or row >= stops[run]:
+            run += 1
+
+        for index in range(run, len(starts)):
+            starts[index] += 1
+            stops[index] += 1
+
+    def delete(self, start: int, stop: int):
+        """Removes the rows from start up to stop, shifting later rows back"""
+        removed = stop - start
+        if removed <= 0:
+            return
+
+        def shift(row: int) -> int:
+            if row <= start:
+                return row
+            return start if row <= stop else row - removed
+
+        starts: List[int] = []
+        stops: List[int] = []
+        for start_, stop_ in zip(self._starts, self._stops):
+            start_, stop_ = shift(start_), shift(stop_)
+            if start_ == stop_:
+                continue
+            if stops and stops[-1] == start_:
+                stops[-1] = stop_
+            else:
+                starts.append(start_)
+                stops.append(stop_)
+
+        self._starts = starts
+        self._stops = stops
+
+    def clear(self):
+        self._starts.clear()
+        self._stops.clear()
+
+
+class ReadingSeries:
+    """Readings of a single indicator, aligned to the Candle index.
+
+    Float readings are held in a contiguous `array('d')` with NaN as the `None` sentinel.
+    If a non float reading is set (dict, int, bool), the series converts to a plain list.
+    Whether a row holds a reading at all, even a `None` one, is tracked separately.
+
+    The last row holding a reading and the `Coverage` of valid readings are kept up to date
+    through every row change, so resuming and period checks don't walk the rows.
+
+    Rows are offset by a reserved gap at the front of the columns, so pushing a row to the
+    front and removing rows from the front are amortized O(1). Rows are never negative."""
+
+    __slots__ = ("_values", "_present", "_objects", "_head", "_last", "coverage")
+
+    _values: array | List[Reading]
+    _present: bytearray
+    _objects: bool
+    _head: int
+    _last: int
+    coverage: Coverage
+
+    def __init__(self, length: int = 0):
+        self._values = array("d", [nan]) * length
+        self._present = bytearray(length)
+        self._objects = False
+        self._head = 0
+        self._last = -1
+        self.coverage = Coverage()
+
+    def __len__(self) -> int:
+        return len(self._present) - self._head
+
+    def __repr__(self) -> str:
+        return f"ReadingSeries({self.as_list()!r})"
+
+    def _to_objects(self):
+        self._values = [None if value != value else value for value in self._values]
+        self._objects = True
+
+    def _find_last(self) -> int:
+        row = self._present.rfind(_PRESENT_BYTE, self._head)
+        return row - self._head if row != -1 else -1
+
+    def has(self, row: int) -> bool:
+        """Whether the row holds a reading, even if that reading is `None`"""
+        return self._present[row + self._head] == PRESENT
+
+    def get(self, row: int) -> Reading:
+        value = self._values[row + self._head]
+        if self._objects or value == value:
+            return value
+        return None
+
+    def set(self, row: int, reading: Reading):
+        if row < 0:
+            row += len(self)
+        physical = row + self._head
+        self._present[physical] = PRESENT
+        if row > self._last:
+            self._last = row
+
+        if reading is None:
+            self.coverage.remove(row)
+        else:
+            self.coverage.add(row)
+
+        if self._objects:
+            self._values[physical] = reading
+        elif reading is None:
+            self._values[physical] = nan
+        elif type(reading) is float:
+            self._values[physical] = reading
+        else:
+            self._to_objects()
+            self._values[physical] = reading
+
+    def discard(self, row: int):
+        if row < 0:
+            row += len(self)
+        physical = row + self._head
+        self._present[physical] = ABSENT
+        self._values[physical] = None if self._objects else nan
+        self.coverage.remove(row)
+        if row == self._last:
+            self._last = self._find_last()
+
+    def insert(self, row: int):
+        """Inserts an empty row"""
+        length = len(self)
+        row = max(0, row + length) if row < 0 else min(row, length)
+        if row == 0:
+            if not self._head:
+                self._head = max(FRONT_RESERVE, length)
+                reserve_front(self._present, self._head)
+                reserve_front(self._values, self._head)
+            self._head -= 1
+        else:
+            self._present.insert(row + self._head, ABSENT)
+            self._values.insert(row + self._head, None if self._objects else nan)
+
+        self.coverage.insert(row)
+        if row <= self._last:
+            self._last += 1
+
+    def append(self):
+        """Appends an empty row"""
+        self._present.append(ABSENT)
+        self._values.append(None if self._objects else nan)
+
+    def extend(self, count: int):
+        """Appends count empty rows"""
+        self._present.extend(bytes(count))
+        if self._objects:
+            self._values.extend([None] * count)
+        else:
+            self._values.extend(array("d", [nan]) * count)
+
+    def _delete_front(self, count: int):
+        head = self._head
+        clear_slots(self._present, head, head + count)
+        clear_slots(self._values, head, head + count)
+        self._head += count
+
+        if self._head > FRONT_RESERVE and self._head > len(self):
+            del self._present[: self._head]
+            del self._values[: self._head]
+            self._head = 0
+
+    def __delitem__(self, index: int | slice):
+        length = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(length)
+        else:
+            start = index + length if index < 0 else index
+            if not 0 <= start < length:
+                raise IndexError("ReadingSeries index out of range")
+            stop, step = start + 1, 1
+
+        if step != 1:
+            for row in sorted(range(start, stop, step), reverse=True):
+                del self[row]
+            return
+        if stop <= start:
+            return
+
+        if start == 0:
+            self._delete_front(stop)
+        else:
+            del self._present[start + self._head : stop + self._head]
+            del self._values[start + self._head : stop + self._head]
+
+        self.coverage.delete(start, stop)
+        if self._last >= stop:
+            self._last -= stop - start
+        elif self._last >= start:
+            self._last = self._find_last()
+
+    def first_index(self) -> int:
+        """Index of the first row holding a reading, -1 if none"""
+        row = self._present.find(_PRESENT_BYTE, self._head)
+        return row - self._head if row != -1 else -1
+
+    def last_index(self) -> int:
+        """Index of the last row holding a reading, -1 if none"""
+        return self._last
+
+    def buffer(self, start: int = 0, stop: Optional[int] = None) -> Optional[memoryview]:
+        """Memoryview of the float values of the rows within start and stop, sharing storage.
+        No reading is NaN. None if the series holds object readings, E.G dicts.
+        The series can't grow while the view is held, release it before appending"""
+        if self._objects:
+            return None
+        start, stop, _ = slice(start, stop).indices(len(self))
+        with memoryview(self._values) as view:
+            return view[start + self._head : max(start, stop) + self._head]
+
+    def as_list(self, start: int = 0, stop: Optional[int] = None) -> List[Reading]:
+        start, stop, _ = slice(start, stop).indices(len(self))
+        values = self._values[start + self._head : max(start, stop) + self._head]
+        if self._objects:
+            return list(values)
+        return [None if value != value else value for value in values]
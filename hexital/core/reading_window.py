@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from math import nan
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, overload
+
+from hexital.core import Reading
+from hexital.core.candle_store import CandleStore
+from hexital.utils.candles import reading_accessor
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+
+    from hexital.core.candle_manager import CandleManager
+    from hexital.core.indicator import Indicator
+
+
+class ReadingWindow(Sequence):
+    """Live view of the latest `length` readings of a name within a Candle Manager's Candles,
+    or every reading without a length. Candle fields are included, E.G 'close'.
+
+    Nothing is copied, each access reads straight from the Candles. As Candles are appended
+    the window moves along with them, so a window created once always covers the latest
+    readings, catching up the indicator first if it's stale. `buffer` and `numpy` export the
+    window as float values sharing storage with columnar Candles, to be released before the
+    Candles change."""
+
+    __slots__ = ("manager", "name", "length", "indicator", "_candles", "_accessor")
+
+    manager: CandleManager
+    name: str
+    length: Optional[int]
+    indicator: Optional[Indicator]
+    _candles: Optional[List]
+    _accessor: Optional[Callable[[int], Reading]]
+
+    def __init__(
+        self,
+        manager: CandleManager,
+        name: str,
+        length: Optional[int] = None,
+        indicator: Optional[Indicator] = None,
+    ):
+        self.manager = manager
+        self.name = name
+        self.length = length
+        self.indicator = indicator
+        self._candles = None
+        self._accessor = None
+
+    def __repr__(self) -> str:
+        return f"ReadingWindow({self.name!r}, {list(self)!r})"
+
+    def _bind(self) -> Callable[[int], Reading]:
+        if self.indicator is not None and self.indicator._stale:
+            self.indicator._refresh()
+        candles = self.manager.candles
+        if candles is not self._candles:
+            self._candles = candles
+            self._accessor = reading_accessor(candles, self.name)
+        return self._accessor
+
+    def _start(self) -> int:
+        return len(self.manager.candles) - len(self)
+
+    def __len__(self) -> int:
+        size = len(self.manager.candles)
+        return size if self.length is None else min(self.length, size)
+
+    @overload
+    def __getitem__(self, index: int) -> Reading: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Reading]: ...
+
+    def __getitem__(self, index: int | slice) -> Reading | List[Reading]:
+        accessor = self._bind()
+        start = self._start()
+        length = len(self)
+
+        if isinstance(index, slice):
+            return [accessor(start + row) for row in range(*index.indices(length))]
+
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("ReadingWindow index out of range")
+        return accessor(start + index)
+
+    def __iter__(self) -> Iterator[Reading]:
+        accessor = self._bind()
+        start = self._start()
+        for row in range(start, start + len(self)):
+            yield accessor(row)
+
+    def buffer(self) -> memoryview:
+        """Memoryview of the window as float values, `None` readings being NaN. Shares storage
+        with columnar Candles of float readings or Candle fields, otherwise the values are
+        copied. Candles sharing storage can't grow while the view is held, appending raises
+        `BufferHeld` until it's released, E.G with `with window.buffer() as view:`"""
+        self._bind()
+        candles = self.manager.candles
+        if isinstance(candles, CandleStore):
+            start = self._start()
+            view = candles.buffer(self.name, start, start + len(self))
+            if view is not None:
+                return view
+
+        values = array("d", [nan if value is None else value for value in self])
+        return memoryview(values)
+
+    def numpy(self) -> ndarray:
+        """NumPy array of the window as float values, sharing storage as with `buffer`, which
+        the array holds until it's deleted"""
+        from hexital.utils.vectorized import available, np
+
+        if not available():
+            raise ImportError("NumPy is required for ReadingWindow.numpy")
+        values = np.frombuffer(self.buffer(), dtype=float)
+        candles = self.manager.candles
+        if isinstance(candles, CandleStore):
+            candles.track(values)
+        return values
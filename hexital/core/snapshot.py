@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from hexital.core.candle_manager import CandleManager
+from hexital.core.candle_store import CandleStore
+from hexital.core.hexital import Hexital
+from hexital.core.reading_series import ReadingSeries
+from hexital.exceptions import InvalidSnapshot
+
+SNAPSHOT_MAGIC = b"HEXITAL\x00"
+SNAPSHOT_VERSION = 1
+
+# Magic, version, header length
+_PREFIX = struct.Struct("<8sIQ")
+_ALIGN = 8
+_PICKLED = "pickle"
+
+# CandleManager state required to carry on appending, syncing and aggregating trades
+_MANAGER_STATE = ("_revision", "_trimmed", "_synced", "_settled", "_settled_values", "_trades")
+
+# Offset within the data section, length in bytes and the `array` typecode, or pickled
+Block = Tuple[int, int, str]
+
+
+class _Writer:
+    """Collects the data section, each block aligned to 8 bytes"""
+
+    chunks: List[bytes]
+    offset: int
+
+    def __init__(self):
+        self.chunks = []
+        self.offset = 0
+
+    def add(self, data: bytes | bytearray | array, typecode: str = "B") -> Block:
+        raw = data.tobytes() if isinstance(data, array) else bytes(data)
+        block = (self.offset, len(raw), typecode)
+        padding = -len(raw) % _ALIGN
+        self.chunks.append(raw + bytes(padding))
+        self.offset += len(raw) + padding
+        return block
+
+    def column(self, column: array, head: int = 0) -> Block:
+        return self.add(column[head:], column.typecode)
+
+    def objects(self, values: Sequence[Any]) -> Optional[Block]:
+        """Pickled values, None if every value is None"""
+        if all(value is None for value in values):
+            return None
+        return self.add(pickle.dumps(list(values), pickle.HIGHEST_PROTOCOL), _PICKLED)
+
+
+class _Reader:
+    """Reads blocks from the mapped data section"""
+
+    view: memoryview
+    swap: bool
+
+    def __init__(self, view: memoryview, swap: bool):
+        self.view = view
+        self.swap = swap
+
+    def column(self, block: Block) -> array:
+        offset, length, typecode = block
+        column = array(typecode)
+        column.frombytes(self.view[offset : offset + length])
+        if self.swap:
+            column.byteswap()
+        return column
+
+    def bytes(self, block: Block) -> bytearray:
+        offset, length, _ = block
+        return bytearray(self.view[offset : offset + length])
+
+    def objects(self, block: Optional[Block], length: int) -> list:
+        if block is None:
+            return [None] * length
+        offset, length_, _ = block
+        return pickle.loads(self.view[offset : offset + length_])
+
+
+def _nested_keys(values: Sequence[Any]) -> Optional[Tuple[str, ...]]:
+    """Keys of dict readings, if every reading is None or a dict of the same float keys"""
+    keys = None
+    for value in values:
+        if value is None:
+            continue
+        if not isinstance(value, dict):
+            return None
+        if keys is None:
+            keys = tuple(value)
+        elif tuple(value) != keys:
+            return None
+        if any(reading is not None and type(reading) is not float for reading in value.values()):
+            return None
+    return keys
+
+
+def _dump_series(writer: _Writer, series: ReadingSeries) -> dict:
+    head = series._head
+    meta = {
+        "present": writer.add(series._present[head:]),
+        "last": series._last,
+        "starts": writer.add(array("q", series.coverage._starts), "q"),
+        "stops": writer.add(array("q", series.coverage._stops), "q"),
+    }
+
+    if not series._objects:
+        meta["values"] = writer.column(series._values, head)
+        return meta
+
+    values = series._values[head:]
+    keys = _nested_keys(values)
+    if keys is None:
+        meta["objects"] = writer.objects(values)
+        return meta
+
+    meta["keys"] = keys
+    meta["dicts"] = writer.add(bytearray(value is not None for value in values))
+    meta["nested"] = [
+        writer.add(
+            array("d", [float("nan") if v is None or v[key] is None else v[key] for v in values]),
+            "d",
+        )
+        for key in keys
+    ]
+    return meta
+
+
+def _load_series(reader: _Reader, meta: dict) -> ReadingSeries:
+    series = ReadingSeries()
+    series._present = reader.bytes(meta["present"])
+    series._last = meta["last"]
+    series.coverage._starts = reader.column(meta["starts"]).tolist()
+    series.coverage._stops = reader.column(meta["stops"]).tolist()
+
+    if "values" in meta:
+        series._values = reader.column(meta["values"])
+        return series
+
+    series._objects = True
+    if "objects" in meta:
+        series._values = reader.objects(meta["objects"], len(series._present))
+        return series
+
+    keys = meta["keys"]
+    columns = [reader.column(block) for block in meta["nested"]]
+    series._values = [
+        {key: None if value != value else value for key, value in zip(keys, row)}
+        if is_dict
+        else None
+        for is_dict, row in zip(reader.bytes(meta["dicts"]), zip(*columns))
+    ]
+    return series
+
+
+def _dump_store(
+    writer: _Writer, store: CandleStore, refs: Optional[List[Optional[dict]]] = None
+) -> dict:
+    head = store._head
+    return {
+        "length": len(store),
+        "tz": store._tz,
+        "columns": [writer.column(column, head) for column in store._columns[:10]],
+        "tags": writer.objects(store._tags[head:]),
+        "refs": writer.objects(refs if refs is not None else store._refs[head:]),
+        "indicators": {
+            name: _dump_series(writer, series) for name, series in store._indicators.items()
+        },
+        "sub_indicators": {
+            name: _dump_series(writer, series) for name, series in store._sub_indicators.items()
+        },
+    }
+
+
+def _load_store(reader: _Reader, meta: dict) -> CandleStore:
+    store = CandleStore()
+    (
+        store._open,
+        store._high,
+        store._low,
+        store._close,
+        store._volume,
+        store._timestamp,
+        store._timeframe,
+        store._aggregation,
+        store._start,
+        store._end,
+    ) = [reader.column(block) for block in meta["columns"]]
+    store._tags = reader.objects(meta["tags"], meta["length"])
+    store._refs = reader.objects(meta["refs"], meta["length"])
+    store._tz = meta["tz"]
+    store._indicators = {
+        name: _load_series(reader, series) for name, series in meta["indicators"].items()
+    }
+    store._sub_indicators = {
+        name: _load_series(reader, series) for name, series in meta["sub_indicators"].items()
+    }
+    return store
+
+
+def _dump_manager(writer: _Writer, manager: CandleManager) -> dict:
+    candles = manager._candles
+    store = candles if isinstance(candles, CandleStore) else CandleStore(candles)
+    meta = {
+        "name": manager.name,
+        "state": {name: getattr(manager, name) for name in _MANAGER_STATE},
+    }
+
+    if not manager.candlestick:
+        meta["candles"] = _dump_store(writer, store)
+        return meta
+
+    # Derived Candles are stored separately, each Candle's refs only hold how many it derived
+    acronym = manager.candlestick.acronym
+    refs = []
+    counts = array("q")
+    for ref in store._refs[store._head :]:
+        derived = ref.get(acronym, -1) if ref else -1
+        counts.append(derived if derived == -1 else len(derived or []))
+        ref = {k: v for k, v in ref.items() if k != acronym} if ref else None
+        refs.append(ref if ref else None)
+
+    meta["candles"] = _dump_store(writer, store, refs)
+    meta["counts"] = writer.column(counts)
+    meta["derived"] = _dump_store(writer, CandleStore(list(manager.candlestick.derived_candles)))
+    meta["derived_index"] = manager.candlestick._derived_idx
+    return meta
+
+
+def _load_manager(reader: _Reader, manager: CandleManager, meta: dict):
+    store = _load_store(reader, meta["candles"])
+    candles = store if manager.columnar else store.candles()
+
+    if manager.candlestick:
+        acronym = manager.candlestick.acronym
+        derived = _load_store(reader, meta["derived"]).candles()
+        position = 0
+        for row, count in enumerate(reader.column(meta["counts"])):
+            if count == -1:
+                continue
+            refs = dict(store._refs[row] or {})
+            refs[acronym] = derived[position : position + count] if count else None
+            position += count
+            if isinstance(candles, CandleStore):
+                candles._refs[row] = refs
+            else:
+                candles[row].refs = refs
+
+        manager.candlestick.set_candle_refs(candles)
+        manager.candlestick.derived_candles.reset()
+        for candle in derived:
+            manager.candlestick.derived_candles.append(candle)
+        manager.candlestick._derived_idx = meta["derived_index"]
+
+    manager._candles = candles
+    for name, value in meta["state"].items():
+        setattr(manager, name, value)
+
+
+def save_snapshot(hexital: Hexital, path: str):
+    """Writes the full state of a `Hexital` into a versioned binary snapshot.
+
+    Layout: the prefix of magic, version and header length, then a pickled header of the
+    settings and the layout of each Candle Manager, followed by the data section. Candle
+    columns and float reading series are written as raw `array` bytes, dict readings of floats
+    as a float column per key, any other readings are pickled.
+
+    Args:
+        hexital: The `Hexital` to snapshot, it's indicators must be re-creatable from settings
+        path: File path to write the snapshot to
+    """
+    writer = _Writer()
+    header = pickle.dumps(
+        {
+            "settings": hexital.settings,
+            "byteorder": sys.byteorder,
+            "managers": [
+                _dump_manager(writer, manager) for manager in hexital._candle_map.values()
+            ],
+        },
+        pickle.HIGHEST_PROTOCOL,
+    )
+
+    with open(path, "wb") as file:
+        file.write(_PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header)))
+        file.write(header)
+        file.write(bytes(-(_PREFIX.size + len(header)) % _ALIGN))
+        file.writelines(writer.chunks)
+
+
+def load_snapshot(path: str) -> Hexital:
+    """Restores a `Hexital` from a snapshot written by `save_snapshot`, including all Candles and
+    readings, no readings are re-calculated. The file is memory mapped and each column copied
+    straight from it. Snapshots contain pickled data, only load snapshots from trusted sources.
+
+    Args:
+        path: File path of the snapshot
+
+    Returns:
+        Hexital: The restored `Hexital`
+    """
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if len(data) < _PREFIX.size:
+            raise InvalidSnapshot(f"Snapshot is truncated: {path}")
+
+        magic, version, header_length = _PREFIX.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC:
+            raise InvalidSnapshot(f"Not a Hexital snapshot: {path}")
+        if version != SNAPSHOT_VERSION:
+            raise InvalidSnapshot(
+                f"Snapshot version {version} is not supported, expected {SNAPSHOT_VERSION}"
+            )
+
+        header: Dict[str, Any] = pickle.loads(data[_PREFIX.size : _PREFIX.size + header_length])
+        start = _PREFIX.size + header_length
+        start += -start % _ALIGN
+
+        hexital = Hexital(**header["settings"])
+
+        with memoryview(data) as view, view[start:] as section:
+            reader = _Reader(section, header["byteorder"] != sys.byteorder)
+            for meta in header["managers"]:
+                manager = hexital._candle_map.get(meta["name"])
+                if manager is None:
+                    raise InvalidSnapshot(f"Snapshot Candles '{meta['name']}' have no manager")
+                _load_manager(reader, manager, meta)
+
+    for indicator in hexital.indicators.values():
+        for node in indicator.tree():
+            node.candle_manager = node.candle_manager
+
+    return hexital
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from hexital.core.candle import Candle
+from hexital.utils.timeframe import timeframe_end
+
+_SECOND = timedelta(seconds=1)
+
+
+class TradeBucket:
+    """Aggregates trades into the OHLCV of the open timeframe Candle.
+
+    A trade belongs to the Candle ending on the next timeframe boundary, the same as resampled
+    Candles, E.G T5: 09:00:01 -> 09:05:00 and 09:05:00 -> 09:05:00. Adding a trade within the
+    open bucket is O(1), only comparing the timestamp against the bucket bounds."""
+
+    __slots__ = (
+        "timeframe",
+        "end",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "trades",
+        "first",
+        "last",
+        "refreshed",
+        "published",
+        "_lower",
+        "_upper",
+    )
+
+    timeframe: timedelta
+    end: Optional[datetime]
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    trades: int
+    first: Optional[datetime]
+    last: Optional[datetime]
+    refreshed: Optional[datetime]
+    published: int
+    _lower: Optional[datetime]
+    _upper: Optional[datetime]
+
+    def __init__(self, timeframe: timedelta):
+        self.timeframe = timeframe
+        self.end = None
+        self.trades = 0
+        self.first = None
+        self.last = None
+        self.refreshed = None
+        self.published = 0
+        self._lower = None
+        self._upper = None
+
+    def within(self, timestamp: datetime) -> bool:
+        """Whether the timestamp falls within the open bucket"""
+        return self._lower is not None and self._lower <= timestamp < self._upper
+
+    def before(self, timestamp: datetime) -> bool:
+        """Whether the timestamp falls before the open bucket"""
+        return self._lower is not None and timestamp < self._lower
+
+    def start(self, timestamp: datetime, price: float, size: float):
+        """Opens a new bucket with the given trade"""
+        self.end = timeframe_end(timestamp, self.timeframe)
+        self._lower = self.end - self.timeframe + _SECOND
+        self._upper = self.end + _SECOND
+        self.open = self.high = self.low = self.close = price
+        self.volume = size
+        self.trades = 1
+        self.first = self.last = timestamp
+        self.refreshed = None
+        self.published = 0
+
+    def add(self, timestamp: datetime, price: float, size: float):
+        """Adds a trade within the open bucket"""
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += size
+        self.trades += 1
+        self.last = timestamp
+
+    @property
+    def pending(self) -> bool:
+        """Whether the open bucket has trades not yet written into a Candle"""
+        return self.trades != self.published
+
+    def candle(self) -> Candle:
+        """Creates the timeframe Candle of the open bucket"""
+        candle = Candle(
+            self.open,
+            self.high,
+            self.low,
+            self.close,
+            self.volume,
+            timestamp=self.end,
+            timeframe=self.timeframe,
+        )
+        self.write(candle)
+        return candle
+
+    def write(self, candle: Candle):
+        """Writes the open bucket into the given Candle, wiping it's readings"""
+        candle.open = self.open
+        candle.high = self.high
+        candle.low = self.low
+        candle.close = self.close
+        candle.volume = self.volume
+        candle.aggregation_factor = self.trades
+        candle._start_timestamp = self.first
+        candle._end_timestamp = self.last if self.last != self.first else None
+        candle.reset_candle()
+        self.refreshed = self.last
+        self.published = self.trades
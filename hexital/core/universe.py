@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import multiprocessing
+from copy import deepcopy
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from zlib import crc32
+
+from hexital.core import Reading
+from hexital.core.candle_manager import Candles
+from hexital.core.hexital import Hexital
+from hexital.core.indicator import Indicator
+from hexital.core.indicator_collection import IndicatorCollection
+
+Readings = Dict[str, Dict[str, Reading]]
+
+
+class UniverseShard:
+    """A set of symbols each with their own `Hexital`, all built from the same settings.
+    Runs within a `HexitalUniverse` worker process, or in process when there's no workers"""
+
+    _settings: dict
+    _hexitals: Dict[str, Hexital]
+
+    def __init__(self, settings: dict):
+        self._settings = settings
+        self._hexitals = {}
+
+    def symbols(self) -> List[str]:
+        return list(self._hexitals)
+
+    def hexital(self, symbol: str) -> Hexital:
+        """The symbol's `Hexital`, created on first use"""
+        hexital = self._hexitals.get(symbol)
+        if hexital is None:
+            hexital = self._hexitals[symbol] = Hexital(**deepcopy(self._settings))
+        return hexital
+
+    def latest(self, hexital: Hexital) -> Dict[str, Reading]:
+        """Latest reading of each Indicator"""
+        return {name: hexital.reading(name) for name in hexital.indicators}
+
+    def append(self, candles: Dict[str, Candles]) -> Readings:
+        """Appends each symbol's Candles, returns their latest readings"""
+        readings = {}
+        for symbol, candles_ in candles.items():
+            hexital = self.hexital(symbol)
+            hexital.append(candles_)
+            readings[symbol] = self.latest(hexital)
+        return readings
+
+    def readings(self, symbols: Optional[Iterable[str]] = None) -> Readings:
+        """Latest readings of the given symbols, or all symbols"""
+        symbols_ = self._hexitals if symbols is None else symbols
+        return {
+            symbol: self.latest(self._hexitals[symbol])
+            for symbol in symbols_
+            if symbol in self._hexitals
+        }
+
+    def remove(self, symbols: Iterable[str]):
+        for symbol in symbols:
+            self._hexitals.pop(symbol, None)
+
+
+def _universe_worker(connection: Connection, settings: dict):
+    """Worker process loop, runs the shard's methods as requested until closed"""
+    shard = UniverseShard(settings)
+
+    while True:
+        try:
+            method, args = connection.recv()
+        except EOFError:
+            break
+
+        if method is None:
+            break
+
+        try:
+            connection.send((True, getattr(shard, method)(*args)))
+        except Exception as error:
+            connection.send((False, error))
+
+    connection.close()
+
+
+class HexitalUniverse:
+    """Many symbols sharing one Indicator configuration, each symbol has it's own `Hexital`.
+
+    With `workers`, symbols are sharded across that many worker processes by a stable hash of
+    the symbol. A batch is sent to every shard before any results are collected, so shards
+    calculate in parallel, each shard replying with a single message of it's latest readings.
+    Without `workers`, everything runs within the current process.
+    """
+
+    name: str
+    workers: int
+
+    _settings: dict
+    _local: Optional[UniverseShard]
+    _connections: List[Connection]
+    _processes: List[BaseProcess]
+
+    def __init__(
+        self,
+        name: str,
+        indicators: Sequence[Dict[str, Any] | Indicator] | IndicatorCollection,
+        workers: int = 0,
+        **kwargs,
+    ):
+        """
+        Args:
+            name: Name of the universe, also used as each symbol's `Hexital` name
+            indicators: Indicators calculated for every symbol
+            workers: Amount of worker processes, 0 to run within the current process
+            kwargs: Any other `Hexital` setting, E.G `timeframe` or `candle_life`
+        """
+        self.name = name
+        self.workers = workers
+        self._settings = Hexital(name, [], indicators, **kwargs).settings
+        self._local = None
+        self._connections = []
+        self._processes = []
+
+        if not workers:
+            self._local = UniverseShard(self._settings)
+            return
+
+        context = multiprocessing.get_context()
+        for _ in range(workers):
+            connection, worker_connection = context.Pipe()
+            process = context.Process(
+                target=_universe_worker, args=(worker_connection, self._settings), daemon=True
+            )
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+    def __enter__(self) -> HexitalUniverse:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @property
+    def settings(self) -> dict:
+        """The `Hexital` settings every symbol is created with"""
+        return deepcopy(self._settings)
+
+    @property
+    def symbols(self) -> List[str]:
+        if self._local is not None:
+            return self._local.symbols()
+        return [symbol for symbols in self._request_all("symbols") for symbol in symbols]
+
+    def shard(self, symbol: str) -> int:
+        """Index of the worker the symbol belongs to"""
+        return crc32(symbol.encode()) % self.workers if self.workers else 0
+
+    def _split(self, symbols: Iterable[str]) -> List[List[str]]:
+        shards = [[] for _ in range(max(self.workers, 1))]
+        for symbol in symbols:
+            shards[self.shard(symbol)].append(symbol)
+        return shards
+
+    def _request_all(self, method: str, shard_args: Optional[List[tuple]] = None) -> List[Any]:
+        """Sends the request to every shard with arguments, then collects each reply. Every
+        reply is read before raising the first shard error, so none are left in the pipes"""
+        shard_args = shard_args if shard_args is not None else [()] * self.workers
+        pending = []
+        for connection, args in zip(self._connections, shard_args):
+            if args is not None:
+                connection.send((method, args))
+                pending.append(connection)
+
+        replies = [connection.recv() for connection in pending]
+        for success, result in replies:
+            if not success:
+                raise result
+        return [result for _, result in replies]
+
+    def append(self, candles: Dict[str, Candles]) -> Readings:
+        """Appends a batch of Candles per symbol, creating new symbols as needed.
+
+        Args:
+            candles: Each symbol's Candle or List of Candle's to append
+
+        Returns:
+            Dict: Latest reading of each Indicator, for each symbol within the batch
+        """
+        if self._local is not None:
+            return self._local.append(candles)
+
+        batches = [{} for _ in range(self.workers)]
+        for symbol, candles_ in candles.items():
+            batches[self.shard(symbol)][symbol] = candles_
+
+        readings = {}
+        for result in self._request_all("append", [(b,) if b else None for b in batches]):
+            readings.update(result)
+        return readings
+
+    def readings(self, symbols: Optional[Iterable[str]] = None) -> Readings:
+        """Latest reading of each Indicator, for the given symbols or all symbols"""
+        if self._local is not None:
+            return self._local.readings(symbols)
+
+        if symbols is None:
+            shard_args = [(None,)] * self.workers
+        else:
+            shard_args = [(shard,) if shard else None for shard in self._split(symbols)]
+
+        readings = {}
+        for result in self._request_all("readings", shard_args):
+            readings.update(result)
+        return readings
+
+    def reading(self, symbol: str, name: str) -> Reading:
+        """Latest reading of the given Indicator for the symbol"""
+        return self.readings([symbol]).get(symbol, {}).get(name)
+
+    def remove(self, symbols: str | Iterable[str]):
+        """Removes the symbols and all of their Candles"""
+        symbols_ = [symbols] if isinstance(symbols, str) else list(symbols)
+        if self._local is not None:
+            self._local.remove(symbols_)
+            return
+
+        self._request_all(
+            "remove", [(shard,) if shard else None for shard in self._split(symbols_)]
+        )
+
+    def close(self):
+        """Stops the worker processes"""
+        for connection in self._connections:
+            try:
+                connection.send((None, ()))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
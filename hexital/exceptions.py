@@ -26,3 +26,18 @@ class InvalidCandlestickType(Exception):
 class InvalidConfiguration(Exception):
     def __init__(self, message):
         super().__init__(message)
+
+
+class InvalidSnapshot(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+
+
+class InvalidOHLCVFile(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+
+
+class BufferHeld(Exception):
+    def __init__(self, message):
+        super().__init__(message)
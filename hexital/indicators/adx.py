@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Optional
 
-from hexital.core.indicator import Indicator, Managed, NestedSource
+from hexital.core.indicator import Indicator, Managed, NestedSource, convergence
 from hexital.indicators.atr import ATR
 from hexital.indicators.rma import RMA
 
@@ -32,6 +32,13 @@ class ADX(Indicator[dict]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}_{self.period_signal}"
 
+    def lookback(self) -> int:
+        return self.period + self.period_signal + 1
+
+    def warmup(self) -> int:
+        period = self.period + 1 + convergence(1.0 - 1.0 / self.period)
+        return period + self.period_signal + convergence(1.0 - 1.0 / self.period_signal)
+
     def _validate_fields(self):
         if self.period_signal is None:
             self.period_signal = self.period
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
-from hexital.analysis import movement
 from hexital.core.indicator import Indicator
+from hexital.utils.rolling import RollingExtreme
 
 
 @dataclass(kw_only=True)
@@ -25,24 +25,34 @@ class AROON(Indicator[dict]):
     _name: str = field(init=False, default="AROON")
     period: int = 14
 
+    _highest: RollingExtreme = field(init=False, repr=False, compare=False)
+    _lowest: RollingExtreme = field(init=False, repr=False, compare=False)
+
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def warmup(self) -> int:
+        return self.period + 1
+
+    def _initialise(self):
+        self._highest = RollingExtreme("high", self.period + 1)
+        self._lowest = RollingExtreme("low", self.period + 1, highest=False)
+
     def _calculate_reading(self, index: int) -> dict:
         aroon = {
             "AROONU": None,
             "AROOND": None,
             "AROONOSC": None,
         }
+        self._highest.update(self.candles, index, self._trimmed())
+        self._lowest.update(self.candles, index, self._trimmed())
+
         if self.prev_exists() or self.reading_period(self.period + 1, "high"):
-            aroon["AROONU"] = (
-                (self.period - movement.highestbar(self.candles, "high", self.period + 1, index))
-                / self.period
-            ) * 100
-            aroon["AROOND"] = (
-                (self.period - movement.lowestbar(self.candles, "low", self.period + 1, index))
-                / self.period
-            ) * 100
+            aroon["AROONU"] = ((self.period - self._highest.offset) / self.period) * 100
+            aroon["AROOND"] = ((self.period - self._lowest.offset) / self.period) * 100
 
             aroon["AROONOSC"] = aroon["AROONU"] - aroon["AROOND"]
 
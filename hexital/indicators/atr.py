@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
-from hexital.core.indicator import Indicator
+from hexital.core.indicator import Indicator, convergence
 from hexital.indicators.tr import TR
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -26,6 +28,15 @@ class ATR(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def state_period(self) -> int:
+        return 1
+
+    def warmup(self) -> int:
+        return self.period + 1 + convergence(1.0 - 1.0 / self.period)
+
     def _initialise(self):
         self.sub_tr = self.add_sub_indicator(TR())
 
@@ -37,3 +48,14 @@ class ATR(Indicator[float | None]):
             return self.sub_tr.candles_average(self.period)
 
         return None
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        self.sub_tr.check_initialised()
+        true_range = vectorized.true_range(
+            self._bulk_source("high"), self._bulk_source("low"), self._bulk_source("close")
+        )
+        self.sub_tr._set_bulk_readings(true_range[start:], start)
+
+        return vectorized.wilder(
+            true_range, start, self.period, self._bulk_prev(start), self.rounding
+        )
@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
 from hexital.core.indicator import Indicator, Source
 from hexital.indicators.sma import SMA
 from hexital.indicators.stdev import STDEV
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -31,6 +33,12 @@ class BBANDS(Indicator[dict]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def warmup(self) -> int:
+        return self.period
+
     def _initialise(self):
         self.sub_stdev = self.add_sub_indicator(STDEV(source=self.source, period=self.period))
         self.sub_sma = self.add_sub_indicator(SMA(source=self.source, period=self.period))
@@ -52,3 +60,16 @@ class BBANDS(Indicator[dict]):
             }
 
         return bbands
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        stdev = self.sub_stdev._calculate_bulk(start)
+        if stdev is None:
+            return None
+        sma = self.sub_sma._calculate_bulk(start)
+        sma = vectorized.valid_where(sma, stdev)
+
+        return {
+            "BBM": sma,
+            "BBL": sma - (stdev * self._std),
+            "BBU": sma + (stdev * self._std),
+        }
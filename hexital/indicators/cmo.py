@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 
-from hexital.core.indicator import Indicator, Managed, NestedSource, Source
+from hexital.core.indicator import Indicator, Managed, NestedSource, Source, convergence
 
 
 @dataclass(kw_only=True)
@@ -29,6 +29,12 @@ class CMO(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def warmup(self) -> int:
+        return self.period + 1 + convergence(1.0 - 1.0 / self.period)
+
     def _initialise(self):
         self.data = self.add_managed_indicator(Managed())
 
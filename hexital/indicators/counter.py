@@ -26,6 +26,9 @@ class Counter(Indicator[int]):
     def _generate_name(self) -> str:
         return f"{self._name}_{str(self.source)}"
 
+    def lookback(self) -> int:
+        return 2
+
     def _calculate_reading(self, index: int) -> int:
         count = self.prev_reading(default=0)
         reading = self.reading(self.source, default=count)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
-from hexital.analysis import movement
 from hexital.core.indicator import Indicator
+from hexital.utils.rolling import RollingExtreme
 
 
 @dataclass(kw_only=True)
@@ -25,15 +25,30 @@ class Donchian(Indicator[dict]):
     _name: str = field(init=False, default="DONCHIAN")
     period: int = 20
 
+    _highest: RollingExtreme = field(init=False, repr=False, compare=False)
+    _lowest: RollingExtreme = field(init=False, repr=False, compare=False)
+
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period
+
+    def warmup(self) -> int:
+        return self.period
+
+    def _initialise(self):
+        self._highest = RollingExtreme("high", self.period - 1)
+        self._lowest = RollingExtreme("low", self.period - 1, highest=False)
+
     def _calculate_reading(self, index: int) -> dict:
         donchian = {"DCL": None, "DCM": None, "DCU": None}
+        self._highest.update(self.candles, index, self._trimmed())
+        self._lowest.update(self.candles, index, self._trimmed())
 
         if self.prev_exists() or self.reading_period(self.period, "high", index):
-            donchian["DCU"] = movement.highest(self.candles, "high", self.period - 1, index)
-            donchian["DCL"] = movement.lowest(self.candles, "low", self.period - 1, index)
+            donchian["DCU"] = self._highest.reading
+            donchian["DCL"] = self._lowest.reading
             donchian["DCM"] = (donchian["DCU"] + donchian["DCL"]) / 2
 
         return donchian
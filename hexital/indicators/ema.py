@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
-from hexital.core.indicator import Indicator, Source
+from hexital.core.indicator import Indicator, Source, convergence
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -31,6 +33,15 @@ class EMA(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def state_period(self) -> int:
+        return 1
+
+    def warmup(self) -> int:
+        return self.period + convergence(1.0 - self._alpha)
+
     def _validate_fields(self):
         self._alpha = float(self.smoothing / (self.period + 1.0))
 
@@ -45,3 +56,11 @@ class EMA(Indicator[float | None]):
             return self.candles_average(self.period, self.source)
 
         return None
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        values = self._bulk_source(self.source)
+        if values is None:
+            return None
+        return vectorized.ema(
+            values, start, self.period, self._alpha, self._bulk_prev(start), self.rounding
+        )
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
-from hexital.analysis.utils import highest, lowest
 from hexital.core.indicator import Indicator
+from hexital.utils.rolling import RollingExtreme
 
 
 @dataclass(kw_only=True)
@@ -19,11 +19,24 @@ class HL(Indicator[dict]):
     _name: str = field(init=False, default="HL")
     period: int = 100
 
+    _highest: RollingExtreme = field(init=False, repr=False, compare=False)
+    _lowest: RollingExtreme = field(init=False, repr=False, compare=False)
+
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period
+
+    def warmup(self) -> int:
+        return self.period
+
+    def _initialise(self):
+        self._highest = RollingExtreme("high", self.period)
+        self._lowest = RollingExtreme("low", self.period, highest=False)
+
     def _calculate_reading(self, index: int) -> dict:
-        return {
-            "low": lowest(self.candles, "low", self.period, index),
-            "high": highest(self.candles, "high", self.period, index),
-        }
+        self._highest.update(self.candles, index, self._trimmed())
+        self._lowest.update(self.candles, index, self._trimmed())
+
+        return {"low": self._lowest.reading, "high": self._highest.reading}
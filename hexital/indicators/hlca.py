@@ -15,5 +15,8 @@ class HLCA(Indicator[float]):
     def _generate_name(self) -> str:
         return f"{self._name}"
 
+    def lookback(self) -> int:
+        return 1
+
     def _calculate_reading(self, index: int) -> float:
         return (self.candles[index].high + self.candles[index].low + self.candles[index].close) / 3
@@ -30,6 +30,12 @@ class HMA(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + int(math.sqrt(self.period))
+
+    def warmup(self) -> int:
+        return self.period + int(math.sqrt(self.period)) - 1
+
     def _initialise(self):
         self.sub_wma = self.add_sub_indicator(WMA(source=self.source, period=self.period))
         self.sub_wmah = self.add_sub_indicator(
@@ -38,6 +38,14 @@ class JMA(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}_{self.phase}"
 
+    def lookback(self) -> int:
+        # Volatility averaged over 10 readings, then averaged again over 65
+        return 75
+
+    def state_period(self) -> int:
+        # Volatility is averaged over the latest 65 readings
+        return 64
+
     def _initialise(self):
         self.data = self.add_managed_indicator(Managed())
 
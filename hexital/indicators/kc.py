@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 
-from hexital.core.indicator import Indicator, Source
+from hexital.core.indicator import Indicator, Source, convergence
 from hexital.indicators import ATR, EMA
 
 
@@ -31,6 +31,14 @@ class KC(Indicator[dict]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}_{self.multiplier}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def warmup(self) -> int:
+        atr = self.period + 1 + convergence(1.0 - 1.0 / self.period)
+        ema = self.period + convergence(1.0 - 2.0 / (self.period + 1.0))
+        return max(atr, ema)
+
     def _initialise(self):
         self.sub_atr = self.add_sub_indicator(ATR(period=self.period))
         self.sub_ema = self.add_sub_indicator(EMA(source=self.source, period=self.period))
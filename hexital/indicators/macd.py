@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
-from hexital.core.indicator import Indicator, Managed, Source
+from hexital.core.indicator import Indicator, Managed, Source, convergence
 from hexital.indicators import EMA
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -39,6 +41,13 @@ class MACD(Indicator[dict]):
             self.signal_period,
         )
 
+    def lookback(self) -> int:
+        return self.slow_period + self.signal_period
+
+    def warmup(self) -> int:
+        slow = self.slow_period + convergence(1.0 - 2.0 / (self.slow_period + 1.0))
+        return slow + self.signal_period + convergence(1.0 - 2.0 / (self.signal_period + 1.0))
+
     def _validate_fields(self):
         if self.slow_period < self.fast_period:
             self.fast_period, self.slow_period = self.slow_period, self.fast_period
@@ -68,3 +77,29 @@ class MACD(Indicator[dict]):
                 return {"MACD": macd, "signal": signal, "histogram": histogram}
 
         return {"MACD": None, "signal": None, "histogram": None}
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        if self._bulk_source(self.source) is None:
+            return None
+
+        macd = self.sub_emaf._calculate_bulk(start) - self.sub_emas._calculate_bulk(start)
+        self.data._set_bulk_readings(macd, start)
+
+        prev_signal = self.sub_signal._bulk_prev(start)
+        prior = self.data.readings()[:start] if prev_signal is None else [None] * start
+
+        signal = vectorized.ema(
+            vectorized.concat(prior, macd),
+            start,
+            self.signal_period,
+            self.sub_signal._alpha,
+            prev_signal,
+            self.sub_signal.rounding,
+        )
+        self.sub_signal._set_bulk_readings(signal, start)
+
+        return {
+            "MACD": vectorized.valid_where(macd, signal),
+            "signal": signal,
+            "histogram": macd - signal,
+        }
@@ -28,6 +28,9 @@ class MFI(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
     def _initialise(self):
         self.sub_hlca = self.add_sub_indicator(HLCA())
         self.data = self.add_managed_indicator(Managed())
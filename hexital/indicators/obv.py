@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
 from hexital.core.indicator import Indicator
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -22,6 +24,12 @@ class OBV(Indicator[float]):
     def _generate_name(self) -> str:
         return self._name
 
+    def lookback(self) -> int:
+        return 2
+
+    def state_period(self) -> int:
+        return 1
+
     def _calculate_reading(self, index: int) -> float:
         if self.prev_exists():
             if self.candles[index].close == self.candles[index - 1].close:
@@ -32,3 +40,8 @@ class OBV(Indicator[float]):
             return self.prev_reading() - self.candles[index].volume
 
         return self.candles[index].volume
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        return vectorized.obv(
+            self._bulk_source("close"), self._bulk_source("volume"), start, self._bulk_prev(start)
+        )
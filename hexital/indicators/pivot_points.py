@@ -24,6 +24,9 @@ class PivotPoints(Indicator[dict]):
     def _generate_name(self) -> str:
         return f"{self._name}"
 
+    def lookback(self) -> int:
+        return 2
+
     def _calculate_reading(self, index: int) -> dict:
         pivot_points = {"S1": None, "R1": None, "S2": None, "R2": None}
 
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
-from hexital.core.indicator import Indicator, Source
+from hexital.core.indicator import Indicator, Source, convergence
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -30,6 +32,15 @@ class RMA(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def state_period(self) -> int:
+        return 1
+
+    def warmup(self) -> int:
+        return self.period + convergence(1.0 - self._alpha)
+
     def _validate_fields(self):
         self._alpha = float(1.0 / self.period)
 
@@ -56,3 +67,11 @@ class RMA(Indicator[float | None]):
             return values / divide_by
 
         return None
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        values = self._bulk_source(self.source)
+        if values is None:
+            return None
+        return vectorized.rma(
+            values, start, self.period, self._alpha, self._bulk_prev(start), self.rounding
+        )
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
 from hexital.core.indicator import Indicator, Source
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -31,6 +33,12 @@ class ROC(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def warmup(self) -> int:
+        return self.period + 1
+
     def _calculate_reading(self, index: int) -> float | None:
         if self.prev_exists() or self.reading_period(self.period + 1, self.source):
             period_n_back = self.reading(self.source, index - self.period)
@@ -40,3 +48,9 @@ class ROC(Indicator[float | None]):
 
             return ((self.reading(self.source) - period_n_back) / period_n_back) * 100
         return None
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        values = self._bulk_source(self.source)
+        if values is None:
+            return None
+        return vectorized.roc(values, start, self.period)
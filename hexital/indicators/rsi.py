@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
-from hexital.core.indicator import Indicator, Managed, NestedSource, Source
+from hexital.core.indicator import Indicator, Managed, NestedSource, Source, convergence
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -27,6 +29,15 @@ class RSI(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def state_period(self) -> int:
+        return 1
+
+    def warmup(self) -> int:
+        return self.period + 1 + convergence(1.0 - 1.0 / self.period)
+
     def _initialise(self):
         self.data = self.add_managed_indicator(Managed())
 
@@ -64,3 +75,17 @@ class RSI(Indicator[float | None]):
             return 100.0 - (100.0 / (1.0 + (gains / losses)))
 
         return None
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        values = self._bulk_source(self.source)
+        if values is None:
+            return None
+
+        prev_gain = prev_loss = None
+        if self._bulk_prev(start) is not None:
+            prev_gain = self._bulk_prev(start, NestedSource(self.data, "gain"))
+            prev_loss = self._bulk_prev(start, NestedSource(self.data, "loss"))
+
+        readings, gains, losses = vectorized.rsi(values, start, self.period, prev_gain, prev_loss)
+        self.data._set_bulk_readings({"gain": gains, "loss": losses}, start)
+        return readings
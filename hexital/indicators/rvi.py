@@ -31,6 +31,10 @@ class RVI(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        # STDEV, then EMA's of the change in source weighted by it
+        return 2 * self.period + 1
+
     def _initialise(self):
         self.data = self.add_managed_indicator(Managed())
 
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
 from hexital.core.indicator import Indicator, Source
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -27,6 +29,12 @@ class SMA(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def warmup(self) -> int:
+        return self.period
+
     def _calculate_reading(self, index: int) -> float | None:
         if self.prev_exists():
             return (
@@ -39,3 +47,9 @@ class SMA(Indicator[float | None]):
             return self.candles_average(self.period, self.source)
 
         return None
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        values = self._bulk_source(self.source)
+        if values is None:
+            return None
+        return vectorized.sma(values, start, self.period)
@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
 from math import sqrt
+from typing import Optional
 
 from hexital.core.indicator import Indicator, Managed, NestedSource, Source
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -29,6 +31,12 @@ class STDEV(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def warmup(self) -> int:
+        return self.period
+
     def _initialise(self):
         self.data = self.add_managed_indicator(Managed())
 
@@ -58,3 +66,18 @@ class STDEV(Indicator[float | None]):
 
         if self.prev_exists() or self.reading_period(self.period, self.source, index):
             return sqrt(variance) if variance > 0 else 0
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        values = self._bulk_source(self.source)
+        if values is None:
+            return None
+
+        readings, mean, variance = vectorized.stdev(
+            values,
+            start,
+            self.period,
+            self._bulk_prev(start, NestedSource(self.data, "mean")) or 0.0,
+            self._bulk_prev(start, NestedSource(self.data, "variance")) or 0.0,
+        )
+        self.data._set_bulk_readings({"mean": mean, "variance": variance}, start)
+        return readings
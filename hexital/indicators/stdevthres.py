@@ -30,6 +30,9 @@ class STDEVT(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
     def _initialise(self):
         self.sub_stdev = self.add_sub_indicator(
             STDEV(
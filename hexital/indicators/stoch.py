@@ -1,8 +1,8 @@
 from dataclasses import dataclass, field
 
-from hexital.analysis import movement
 from hexital.core.indicator import Indicator, Managed, NestedSource, Source
 from hexital.indicators.sma import SMA
+from hexital.utils.rolling import RollingExtreme
 
 
 @dataclass(kw_only=True)
@@ -39,10 +39,22 @@ class STOCH(Indicator[dict]):
     smoothing_k: int = 3
     source: Source = "close"
 
+    _highest: RollingExtreme = field(init=False, repr=False, compare=False)
+    _lowest: RollingExtreme = field(init=False, repr=False, compare=False)
+
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + self.smoothing_k + self.slow_period
+
+    def warmup(self) -> int:
+        return self.period + self.smoothing_k + self.slow_period - 2
+
     def _initialise(self):
+        self._highest = RollingExtreme("high", self.period)
+        self._lowest = RollingExtreme("low", self.period, highest=False)
+
         self.data = self.add_managed_indicator(Managed())
         self.sub_k = self.data.add_sub_indicator(
             SMA(
@@ -63,10 +75,12 @@ class STOCH(Indicator[dict]):
     def _calculate_reading(self, index: int) -> dict:
         stoch = None
         k = None
+        self._highest.update(self.candles, index, self._trimmed())
+        self._lowest.update(self.candles, index, self._trimmed())
 
         if self.reading_period(self.period, self.source):
-            lowest = movement.lowest(self.candles, "low", self.period, index)
-            highest = movement.highest(self.candles, "high", self.period, index)
+            lowest = self._lowest.reading
+            highest = self._highest.reading
 
             stoch = ((self.reading(self.source) - lowest) / (highest - lowest)) * 100
 
@@ -29,6 +29,12 @@ class Supertrend(Indicator[dict]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def state_period(self) -> int:
+        return 1
+
     def _initialise(self):
         self.sub_atr = self.add_sub_indicator(indicators.ATR(period=self.period))
         self.sub_hl = self.add_sub_indicator(indicators.HLA())
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
 from hexital.core.indicator import Indicator
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -21,6 +23,12 @@ class TR(Indicator[float | None]):
     def _generate_name(self) -> str:
         return self._name
 
+    def lookback(self) -> int:
+        return 2
+
+    def warmup(self) -> int:
+        return 2
+
     def _calculate_reading(self, index: int) -> float | None:
         if self.prev_exists("close"):
             close = self.candles[index - 1].close
@@ -29,3 +37,8 @@ class TR(Indicator[float | None]):
             return max(high - low, abs(high - close), abs(low - close))
 
         return None
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        return vectorized.true_range(
+            self._bulk_source("high"), self._bulk_source("low"), self._bulk_source("close")
+        )[start:]
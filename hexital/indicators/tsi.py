@@ -31,6 +31,12 @@ class TSI(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}_{self.smooth_period}"
 
+    def lookback(self) -> int:
+        return self.period + self.smooth_period + 1
+
+    def state_period(self) -> int:
+        return 1
+
     def _validate_fields(self):
         if not self.smooth_period:
             self.smooth_period = int(int(self.period / 2) + (self.period % 2 > 0))
@@ -35,6 +35,12 @@ class VWAP(Indicator[float]):
     def _generate_name(self) -> str:
         return f"{self._name}_{timedelta_to_str(self.anchor)}"
 
+    def lookback(self) -> int:
+        return 2
+
+    def state_period(self) -> int:
+        return 1
+
     def _validate_fields(self):
         if not timeframe_validation(self.anchor):
             raise InvalidConfiguration(f"Anchor is Invalid: {self.anchor}")
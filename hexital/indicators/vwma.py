@@ -26,6 +26,12 @@ class VWMA(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period
+
+    def warmup(self) -> int:
+        return self.period
+
     def _calculate_reading(self, index: int) -> float | None:
         if self.prev_exists() or self.reading_period(self.period, "close"):
             volume_close = sum(
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
 from hexital.core.indicator import Indicator, Source
+from hexital.utils import vectorized
 
 
 @dataclass(kw_only=True)
@@ -29,6 +31,12 @@ class WMA(Indicator[float | None]):
     def _generate_name(self) -> str:
         return f"{self._name}_{self.period}"
 
+    def lookback(self) -> int:
+        return self.period
+
+    def warmup(self) -> int:
+        return self.period
+
     def _calculate_reading(self, index: int) -> float | None:
         if self.prev_exists() or self.reading_period(self.period, self.source):
             values = sum(
@@ -38,3 +46,9 @@ class WMA(Indicator[float | None]):
             weight = (self.period * (self.period + 1)) / 2
             return values / weight
         return None
+
+    def _bulk_readings(self, start: int) -> Optional[vectorized.BulkReadings]:
+        values = self._bulk_source(self.source)
+        if values is None:
+            return None
+        return vectorized.wma(values, start, self.period)
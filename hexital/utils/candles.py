@@ -1,6 +1,8 @@
-from typing import List, Optional
+from operator import attrgetter
+from typing import Callable, List, Optional
 
 from hexital.core.candle import Candle
+from hexital.core.candle_store import CandleStore, CandleView
 from hexital.utils.indexing import absindex, valid_index
 
 
@@ -9,12 +11,17 @@ def reading_by_index(candles: List[Candle], name: str, index: int = -1) -> float
     if not valid_index(index, len(candles)):
         return None
 
+    if isinstance(candles, CandleStore):
+        return candles.reading(name, index)
+
     return reading_by_candle(candles[index], name)
 
 
 def reading_by_candle(candle: Candle, name: str) -> float | dict | None:
     """Simple method to get a reading from the given indicator from a candle
     Uses '.' to find nested reading, E.G 'MACD_12_26_9.MACD"""
+    if isinstance(candle, CandleView):
+        return candle._store.reading(name, candle._row)
 
     if "." in name:
         main_name, nested_name = name.split(".")
@@ -26,22 +33,55 @@ def reading_by_candle(candle: Candle, name: str) -> float | dict | None:
     if attr is not None:
         return attr
 
-    if name in candle.indicators:
-        return candle.indicators[name]
+    if candle._indicators and name in candle._indicators:
+        return candle._indicators[name]
 
-    if name in candle.sub_indicators:
-        return candle.sub_indicators[name]
+    if candle._sub_indicators and name in candle._sub_indicators:
+        return candle._sub_indicators[name]
 
     return None
 
 
+def reading_accessor(candles: List[Candle], name: str) -> Callable[[int], float | dict | None]:
+    """Pre-binds `reading_by_index` for the given name, a function of the index.
+    Resolves what the name refers to once, instead of on every read. Index must be valid"""
+    if isinstance(candles, CandleStore):
+        return candles.accessor(name)
+
+    if "." in name:
+        main_name, nested_name = name.split(".")
+        return lambda index: _nested_indicator(candles[index], main_name, nested_name)
+
+    if hasattr(Candle, name):
+        getter = attrgetter(name)
+
+        def attribute(index: int) -> float | dict | None:
+            candle = candles[index]
+            value = getter(candle)
+            return value if value is not None else reading_by_candle(candle, name)
+
+        return attribute
+
+    def reading(index: int) -> float | dict | None:
+        candle = candles[index]
+        indicators = candle._indicators
+        if indicators and name in indicators:
+            return indicators[name]
+        sub_indicators = candle._sub_indicators
+        if sub_indicators and name in sub_indicators:
+            return sub_indicators[name]
+        return None
+
+    return reading
+
+
 def _nested_indicator(candle: Candle, name: str, nested_name: str) -> float | None:
-    if name in candle.indicators:
-        reading = candle.indicators[name]
+    if candle._indicators and name in candle._indicators:
+        reading = candle._indicators[name]
         return reading.get(nested_name) if isinstance(reading, dict) else reading
 
-    if name in candle.sub_indicators:
-        reading = candle.sub_indicators[name]
+    if candle._sub_indicators and name in candle._sub_indicators:
+        reading = candle._sub_indicators[name]
         return reading.get(nested_name) if isinstance(reading, dict) else reading
 
     return None
@@ -51,6 +91,11 @@ def reading_count(candles: List[Candle], name: str, index: Optional[int] = None)
     """Returns how many instance of the given indicator exist"""
     index_ = absindex(index, len(candles))
 
+    if isinstance(candles, CandleStore):
+        count = candles.valid_count(name, index_)
+        if count is not None:
+            return count
+
     for count, idx in enumerate(range(index_, -1, -1)):
         if reading_by_candle(candles[idx], name) is None:
             return count
@@ -72,7 +117,11 @@ def reading_period(
     if index_ - period_ < 0:
         return False
 
-    for point in [period_, period_ / 2, 0]:
+    points = [period_, period_ / 2, 0]
+    if isinstance(candles, CandleStore) and candles.valid_count(name, index_) is not None:
+        return all(candles.valid_count(name, index_ - int(point)) for point in points)
+
+    for point in points:
         if reading_by_index(candles, name, index_ - int(point)) is None:
             return False
     return True
@@ -114,11 +163,9 @@ def get_readings_period(
     start = to_index - length
     start = 0 if start < 0 else start
 
-    readings = []
-
-    for candle in candles[start:to_index]:
-        reading = reading_by_candle(candle, name)
-        if isinstance(reading, (float, int)):
-            readings.append(reading)
+    if isinstance(candles, CandleStore):
+        values = candles.readings(name, start, to_index)
+    else:
+        values = [reading_by_candle(candle, name) for candle in candles[start:to_index]]
 
-    return readings
+    return [reading for reading in values if isinstance(reading, (float, int))]
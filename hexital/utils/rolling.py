@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from hexital.core.candle import Candle
+from hexital.utils.candles import get_readings_period, reading_by_index
+
+
+class RollingExtreme:
+    """Rolling highest or lowest reading of `name` over the latest `period` Candles.
+
+    Keeps a monotonic deque of (position, reading), so each consecutive index is amortized O(1).
+    Ties resolve to the most recent Candle. Positions are the index plus the amount of Candles
+    `trimmed` from the front, so trimming doesn't move the window. If the index isn't the next
+    consecutive one, E.G re-calculating the latest Candle or after a prepend/insert, the window
+    is rebuilt."""
+
+    __slots__ = ("name", "period", "highest", "_window", "_candles", "_index")
+
+    name: str
+    period: int
+    highest: bool
+    _window: Deque[Tuple[int, float]]
+    _candles: Optional[List[Candle]]
+    _index: int
+
+    def __init__(self, name: str, period: int, highest: bool = True):
+        self.name = name
+        self.period = period
+        self.highest = highest
+        self._window = deque()
+        self.reset()
+
+    def reset(self):
+        self._window.clear()
+        self._candles = None
+        self._index = -1
+
+    def _push(self, index: int, reading: float | None):
+        if isinstance(reading, (float, int)):
+            window = self._window
+            if self.highest:
+                while window and window[-1][1] <= reading:
+                    window.pop()
+            else:
+                while window and window[-1][1] >= reading:
+                    window.pop()
+            window.append((index, reading))
+
+        while self._window and self._window[0][0] <= index - self.period:
+            self._window.popleft()
+        self._index = index
+
+    def update(self, candles: List[Candle], index: int, trimmed: int = 0):
+        """Moves the window to end at index, rebuilding if not the next consecutive index.
+        `trimmed` is the amount of Candles removed from the front of the Candles so far"""
+        if candles is not self._candles or index + trimmed != self._index + 1:
+            self.reset()
+            self._candles = candles
+            for index_ in range(max(0, index - self.period + 1), index):
+                self._push(index_ + trimmed, reading_by_index(candles, self.name, index_))
+
+        while self._window and self._window[0][0] < trimmed:
+            self._window.popleft()
+        self._push(index + trimmed, reading_by_index(candles, self.name, index))
+
+    @property
+    def reading(self) -> float | None:
+        """Highest/Lowest reading within the window, None if no readings"""
+        return self._window[0][1] if self._window else None
+
+    @property
+    def offset(self) -> int:
+        """Distance from the latest index back to the highest/lowest reading"""
+        return self._index - self._window[0][0] if self._window else 0
+
+
+class RollingSum:
+    """Rolling sum and count of the numeric readings of `name` over the latest `length` Candles.
+
+    The window ends before `end`, moving it forward by one is O(1), including after Candles are
+    `trimmed` from the front. If the end isn't the next consecutive one, the window is re-summed
+    in full. It's also re-summed every `length` moves,
+    so float drift from adding and removing readings can't accumulate. A window of only zero
+    readings always sums to exactly zero."""
+
+    __slots__ = (
+        "name",
+        "length",
+        "total",
+        "count",
+        "_nonzero",
+        "_candles",
+        "_end",
+        "_trimmed",
+        "_moves",
+    )
+
+    name: str
+    length: int
+    total: float
+    count: int
+    _nonzero: int
+    _candles: Optional[List[Candle]]
+    _end: int
+    _trimmed: int
+    _moves: int
+
+    def __init__(self, name: str, length: int):
+        self.name = name
+        self.length = length
+        self.reset()
+
+    def reset(self):
+        self.total = 0
+        self.count = 0
+        self._nonzero = 0
+        self._candles = None
+        self._end = -1
+        self._trimmed = 0
+        self._moves = 0
+
+    def _add(self, reading: float | None, sign: int):
+        if isinstance(reading, (float, int)):
+            self.total += sign * reading
+            self.count += sign
+            if reading:
+                self._nonzero += sign
+
+    def update(self, candles: List[Candle], end: int, trimmed: int = 0):
+        """Moves the window to cover `end - length` up to, but excluding, end. `trimmed` is the
+        amount of Candles removed from the front of the Candles so far"""
+        if (
+            candles is not self._candles
+            or end + trimmed != self._end + self._trimmed + 1
+            or self._moves >= self.length
+            or end - 1 - self.length < 0 <= end - 1 - self.length + trimmed
+        ):
+            self.reset()
+            self._candles = candles
+            if end > 0:
+                for reading in get_readings_period(candles, self.name, self.length, end - 1, True):
+                    self._add(reading, 1)
+        else:
+            self._add(reading_by_index(candles, self.name, end - 1), 1)
+            if end - 1 - self.length >= 0:
+                self._add(reading_by_index(candles, self.name, end - 1 - self.length), -1)
+                if not self._nonzero:
+                    self.total = 0
+            self._moves += 1
+
+        self._end = end
+        self._trimmed = trimmed
+
+    @property
+    def average(self) -> float:
+        """Average of the readings within the window, 0 if no readings"""
+        return self.total / self.count if self.count else 0
@@ -141,6 +141,18 @@ def round_down_timestamp(timestamp: datetime, timeframe: timedelta) -> datetime:
         return timestamp.replace(day=0, hour=0, minute=0, second=0)
 
 
+def timeframe_end(timestamp: datetime, timeframe: timedelta) -> datetime:
+    """Find the end timestamp of the timeframe period the timestamp falls within.
+    E.G T5: 09:00:01 -> 9:05:00
+    E.G T5: 09:05:00 -> 9:05:00
+    Note: This method also calls trim_timestamp, removing microseconds
+    """
+    timestamp = trim_timestamp(timestamp)
+    if on_timeframe(timestamp, timeframe):
+        return timestamp
+    return round_down_timestamp(timestamp, timeframe) + timeframe
+
+
 def within_timeframe(timestamp: datetime, within: datetime, timeframe: timedelta | None) -> bool:
     """Checks if timestamp is within other timestamp and timeframe period"""
     if not timeframe:
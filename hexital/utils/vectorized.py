@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+from math import sqrt
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, TypeAlias
+
+from hexital.core import Reading
+from hexital.core.candle import Candle
+from hexital.core.candle_store import CandleStore
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:  # pragma: no cover
+    np = None
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+
+    BulkReadings: TypeAlias = ndarray | Dict[str, ndarray]
+else:
+    BulkReadings: TypeAlias = Any
+
+# Minimum amount of missing readings for an Indicator to be calculated in bulk with NumPy,
+# instead of Candle by Candle. Only used when NumPy is importable, None disables bulk calculation
+BULK_THRESHOLD: Optional[int] = 1000
+
+CANDLE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def available() -> bool:
+    """Whether NumPy is importable and bulk calculations can be used"""
+    return np is not None
+
+
+def candle_values(candles: Sequence[Candle], field: str) -> ndarray:
+    """Returns a float array of the given Candle field, for all Candles"""
+    if isinstance(candles, CandleStore):
+        return np.array(candles.column(field), dtype=float)
+    return np.fromiter(map(attrgetter(field), candles), dtype=float, count=len(candles))
+
+
+def to_readings(values: ndarray, rounding: Optional[int] = None) -> List[Reading]:
+    """Converts an array into a list of readings, NaN being None"""
+    if rounding is None:
+        return [None if value != value else value for value in values.tolist()]
+    return [None if value != value else round(value, rounding) for value in values.tolist()]
+
+
+def to_dict_readings(
+    values: Dict[str, ndarray], rounding: Optional[int] = None
+) -> List[Dict[str, Reading]]:
+    """Converts named arrays into a list of dict readings, NaN being None"""
+    columns = {key: to_readings(value, rounding) for key, value in values.items()}
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+def concat(readings: List[Reading], values: ndarray) -> ndarray:
+    """Joins a list of float readings in front of the values, None being NaN"""
+    prior = np.array([np.nan if value is None else value for value in readings], dtype=float)
+    return np.concatenate((prior, values))
+
+
+def valid_where(values: ndarray, other: ndarray) -> ndarray:
+    """Values, with NaN wherever the other is NaN"""
+    return np.where(np.isnan(other), np.nan, values)
+
+
+def first_valid(values: ndarray) -> int:
+    """Index of the first non NaN value, length of values if none"""
+    valid = np.flatnonzero(~np.isnan(values))
+    return int(valid[0]) if len(valid) else len(values)
+
+
+def recurse(
+    values: ndarray,
+    seed: float,
+    step: Callable[[float, float], float],
+    rounding: Optional[int] = None,
+) -> ndarray:
+    """Recursion `step(prev, value)` over the values starting from the seed, one value at a
+    time exactly as calculated Candle by Candle. Each reading is rounded by rounding before
+    the next step, as readings are rounded when stored"""
+    readings = []
+    prev = seed
+    for value in values.tolist():
+        prev = step(prev, value)
+        if rounding is not None:
+            prev = round(prev, rounding)
+        readings.append(prev)
+    return np.array(readings, dtype=float)
+
+
+def rolling_mean(values: ndarray, period: int) -> ndarray:
+    """Mean of each full window of period, returns `len(values) - period + 1` values"""
+    totals = np.cumsum(np.concatenate(([0.0], values)))
+    return (totals[period:] - totals[:-period]) / period
+
+
+def smoothed(
+    values: ndarray,
+    start: int,
+    period: int,
+    step: Callable[[float, float], float],
+    prev: Optional[float] = None,
+    rounding: Optional[int] = None,
+) -> ndarray:
+    """Recursive smoothing from start, seeded from the prev reading or the average of the
+    first period, E.G `candles_average`"""
+    readings = np.full(len(values) - start, np.nan)
+
+    first = start
+    if prev is None:
+        first = max(start, first_valid(values) + period - 1)
+        if first >= len(values):
+            return readings
+        prev = sum(values[first - period + 1 : first + 1].tolist()) / period
+        if rounding is not None:
+            prev = round(prev, rounding)
+        readings[first - start] = prev
+        first += 1
+
+    if first < len(values):
+        readings[first - start :] = recurse(values[first:], prev, step, rounding)
+    return readings
+
+
+def ema(
+    values: ndarray,
+    start: int,
+    period: int,
+    alpha: float,
+    prev: Optional[float] = None,
+    rounding: Optional[int] = None,
+) -> ndarray:
+    """EMA `alpha * value + prev * (1 - alpha)` from start"""
+    decay = 1.0 - alpha
+    return smoothed(
+        values, start, period, lambda prev, value: alpha * value + prev * decay, prev, rounding
+    )
+
+
+def wilder(
+    values: ndarray,
+    start: int,
+    period: int,
+    prev: Optional[float] = None,
+    rounding: Optional[int] = None,
+) -> ndarray:
+    """Wilder's smoothing `(prev * (period - 1) + value) / period` from start, E.G ATR"""
+    return smoothed(
+        values,
+        start,
+        period,
+        lambda prev, value: (prev * (period - 1) + value) / period,
+        prev,
+        rounding,
+    )
+
+
+def sma(values: ndarray, start: int, period: int) -> ndarray:
+    readings = np.full(len(values) - start, np.nan)
+    first = max(start, first_valid(values) + period - 1)
+    if first < len(values):
+        readings[first - start :] = rolling_mean(values[first - period + 1 :], period)
+    return readings
+
+
+def wma(values: ndarray, start: int, period: int) -> ndarray:
+    readings = np.full(len(values) - start, np.nan)
+    first = max(start, first_valid(values) + period - 1)
+    if first < len(values):
+        windows = sliding_window_view(values[first - period + 1 :], period)
+        weights = np.arange(1, period + 1, dtype=float)
+        readings[first - start :] = windows @ weights / ((period * (period + 1)) / 2)
+    return readings
+
+
+def rma(
+    values: ndarray,
+    start: int,
+    period: int,
+    alpha: float,
+    prev: Optional[float] = None,
+    rounding: Optional[int] = None,
+) -> ndarray:
+    """RMA from start, seeded from the prev reading or numpy's ewm adjusted first period"""
+    readings = np.full(len(values) - start, np.nan)
+    decay = 1 - alpha
+
+    first = start
+    if prev is None:
+        first = max(start, first_valid(values) + period - 1)
+        if first >= len(values):
+            return readings
+        window = range(first, first - period, -1)
+        weighted = sum((decay**power) * float(values[i]) for power, i in enumerate(window))
+        prev = weighted / sum(decay**i for i in window)
+        if rounding is not None:
+            prev = round(prev, rounding)
+        readings[first - start] = prev
+        first += 1
+
+    if first < len(values):
+        readings[first - start :] = recurse(
+            values[first:],
+            prev,
+            lambda prev, value: (alpha * value) + ((1.0 - alpha) * prev),
+            rounding,
+        )
+    return readings
+
+
+def roc(values: ndarray, start: int, period: int) -> ndarray:
+    readings = np.full(len(values) - start, np.nan)
+    first = max(start, period)
+    if first < len(values):
+        back = values[first - period : len(values) - period]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = (values[first:] - back) / back * 100
+        readings[first - start :] = np.where(back == 0, -100.0, change)
+    return readings
+
+
+def rsi(
+    values: ndarray,
+    start: int,
+    period: int,
+    gain: Optional[float] = None,
+    loss: Optional[float] = None,
+) -> tuple:
+    """RSI from start, along with the average gains and losses"""
+    changes = np.diff(values, prepend=np.nan)
+    gains = wilder(np.where(changes < 0, 0.0, changes), start, period, gain)
+    losses = wilder(np.where(changes > 0, 0.0, -changes), start, period, loss)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        readings = 100.0 - (100.0 / (1.0 + (gains / losses)))
+    return readings, gains, losses
+
+
+def true_range(high: ndarray, low: ndarray, close: ndarray) -> ndarray:
+    """True Range for every Candle, NaN for the first"""
+    readings = np.full(len(close), np.nan)
+    prev_close = close[:-1]
+    readings[1:] = np.maximum.reduce(
+        [high[1:] - low[1:], np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)]
+    )
+    return readings
+
+
+def obv(close: ndarray, volume: ndarray, start: int, prev: Optional[float] = None) -> ndarray:
+    if start == 0 or prev is None:
+        readings = np.empty(len(close) - start)
+        readings[0] = volume[start]
+        readings[1:] = volume[start] + np.cumsum(
+            np.sign(np.diff(close[start:])) * volume[start + 1 :]
+        )
+        return readings
+    return prev + np.cumsum(np.sign(close[start:] - close[start - 1 : -1]) * volume[start:])
+
+
+def stdev(
+    values: ndarray, start: int, period: int, mean: float = 0.0, variance: float = 0.0
+) -> tuple:
+    """Rolling STDEV from start, along with the rolling mean and population variance. Each
+    Candle updates the mean and variance of the prior Candle, starting from the given mean and
+    variance, exactly as calculated Candle by Candle"""
+    length = len(values)
+    readings = np.full(length - start, np.nan)
+    means = np.full(length - start, np.nan)
+    variances = np.full(length - start, np.nan)
+    values_ = values.tolist()
+
+    for index in range(start, length):
+        reading = values_[index]
+        popped = values_[index - period] if index >= period else 0
+
+        old_mean = mean
+        mean = old_mean + (reading - popped) / period
+        variance += (reading - popped) * (reading - mean + popped - old_mean) / period
+
+        means[index - start] = mean
+        variances[index - start] = variance
+        if index >= period - 1:
+            readings[index - start] = sqrt(variance) if variance > 0 else 0
+
+    return readings, means, variances
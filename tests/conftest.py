@@ -6,4 +6,6 @@ CANDLE_DATA = [
 ]
 
 
-pytest_plugins = [*CANDLE_DATA]
+INDICATOR_DATA = ["tests.data.fixtures_indicators"]
+
+pytest_plugins = [*CANDLE_DATA, *INDICATOR_DATA]
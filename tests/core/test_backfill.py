@@ -0,0 +1,80 @@
+from typing import List
+
+import pytest
+from hexital import Candle, Hexital
+from hexital.core.backfill import chunk_ranges, group_warmup
+from hexital.core.indicator import convergence
+from hexital.indicators import AROON, EMA, HMA, OBV, ROC, SMA, STOCH, VWMA, WMA
+
+
+def copy_candles(candles: List[Candle]) -> List[Candle]:
+    return [candle.clean_copy() for candle in candles]
+
+
+def assert_readings(result: Hexital, expected: Hexital):
+    for name in expected.indicators:
+        for reading, expected_reading in zip(
+            result.reading_as_list(name), expected.reading_as_list(name)
+        ):
+            assert reading == pytest.approx(expected_reading, abs=1e-4), name
+
+
+def test_convergence():
+    assert convergence(0.5) == 34
+    assert convergence(1.0) == 0
+    assert convergence(0.0) == 0
+
+
+def test_group_warmup():
+    assert group_warmup([SMA(period=20), WMA(period=30)]) == 30
+    assert group_warmup([SMA(period=20), SMA(period=30, source="SMA_20")]) == 50
+    assert group_warmup([EMA()]) == 10 + convergence(1 - 2 / 11)
+    assert group_warmup([ROC(), VWMA(), AROON()]) == 15
+    assert group_warmup([STOCH(), HMA()]) == 18
+    assert group_warmup([SMA(), OBV()]) is None
+
+
+def test_chunk_ranges():
+    assert chunk_ranges(0, 10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert chunk_ranges(5, 5, 4) == []
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.usefixtures("candles")
+def test_backfill(candles, build_indicators, workers, columnar):
+    expected = Hexital(
+        "Test Stratergy", copy_candles(candles), build_indicators(), columnar=columnar
+    )
+    expected.calculate()
+
+    strat = Hexital("Test Stratergy", copy_candles(candles), build_indicators(), columnar=columnar)
+    strat.backfill(workers=workers, chunk_size=40)
+    assert_readings(strat, expected)
+
+
+@pytest.mark.usefixtures("candles")
+def test_backfill_unbounded(candles):
+    expected = Hexital("Test Stratergy", copy_candles(candles), [SMA(), OBV()])
+    expected.calculate()
+
+    strat = Hexital("Test Stratergy", copy_candles(candles), [SMA(), OBV()])
+    strat.backfill(workers=0, chunk_size=40)
+    assert_readings(strat, expected)
+
+
+@pytest.mark.usefixtures("candles")
+def test_backfill_append(candles):
+    indicators = [SMA(), EMA(period=3, source="SMA_10", name="EMA_SMA")]
+    expected = Hexital("Test Stratergy", copy_candles(candles[:300]), indicators)
+    expected.calculate()
+
+    indicators = [SMA(), EMA(period=3, source="SMA_10", name="EMA_SMA")]
+    strat = Hexital("Test Stratergy", copy_candles(candles[:300]), indicators)
+    strat.backfill(workers=0, chunk_size=50)
+
+    for candle in candles[300:]:
+        expected.append(candle.clean_copy())
+        strat.append(candle.clean_copy())
+
+    assert_readings(strat, expected)
@@ -578,6 +578,15 @@ class TestCandleMerge:
         assert main_candle._start_timestamp == datetime(2023, 10, 3, 9, 0, 30)
         assert main_candle._end_timestamp == datetime(2023, 10, 3, 9, 1)
 
+    def test_candle_merge_within(self):
+        main_candle = Candle(1, 5, 1, 2, 10, timestamp=datetime(2023, 10, 3, 9, 1))
+        main_candle.set_resampled_timestamp(datetime(2023, 10, 3, 9, 5))
+        main_candle.merge(Candle(2, 3, 2, 3, 10, timestamp=datetime(2023, 10, 3, 9, 4)))
+        main_candle.merge(Candle(4, 4, 4, 4, 10, timestamp=datetime(2023, 10, 3, 9, 2)))
+
+        assert main_candle.open == 1 and main_candle.close == 3
+        assert main_candle.volume == 30
+
     def test_candle_merge_out_of_timeframe_over(self, merge_candles):
         main_candle = merge_candles[0]
         second_candle = merge_candles[1]
@@ -601,3 +610,22 @@ class TestCandleMerge:
             main_candle.timestamp == datetime(2023, 10, 3, 9, 0, 30)
             and main_candle.close == 12536.019
         )
+
+
+class TestCandleSlots:
+    def test_candle_no_dict(self, simple_candle):
+        assert not hasattr(simple_candle, "__dict__")
+
+    def test_candle_lazy_readings(self, simple_candle):
+        assert simple_candle._indicators is None
+        assert simple_candle._sub_indicators is None
+        assert simple_candle._refs is None
+
+        assert simple_candle.indicators == {}
+        simple_candle.indicators["EMA"] = 5.0
+        assert simple_candle._indicators == {"EMA": 5.0}
+
+    def test_candle_from_list_unchanged(self, candle_list_readings):
+        candle_list = list(candle_list_readings[0])
+        Candle.from_list(candle_list)
+        assert candle_list == candle_list_readings[0]
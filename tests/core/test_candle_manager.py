@@ -4,6 +4,7 @@ from typing import List
 import pytest
 from hexital import Candle
 from hexital.core.candle_manager import CandleManager
+from hexital.exceptions import InvalidCandleOrder, InvalidConfiguration
 from hexital.utils.common import CalcMode
 from test_candlestick import FakeType
 
@@ -428,6 +429,161 @@ class TestCandlePrepend:
         ]
 
 
+class TestCandleTrim:
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_max_candles(self, candles, columnar):
+        manager = CandleManager([], max_candles=50, columnar=columnar)
+
+        for candle in candles[:120]:
+            manager.append(candle)
+
+        assert len(manager.candles) == 50
+        assert manager.candles == candles[70:120]
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_candle_life_and_max_candles(self, candles, columnar):
+        manager = CandleManager(
+            [], candle_life=timedelta(minutes=10), max_candles=50, columnar=columnar
+        )
+        manager.append(candles[:120])
+
+        oldest = candles[119].timestamp - timedelta(minutes=10)
+        assert manager.candles == [c for c in candles[:120] if c.timestamp >= oldest]
+
+        manager.candle_life = None
+        manager.max_candles = 5
+        manager.append(candles[120])
+        assert manager.candles == candles[116:121]
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_prepend_and_trim(self, candles, columnar):
+        manager = CandleManager([], max_candles=100, columnar=columnar)
+        manager.append(candles[200:260])
+
+        for candle in reversed(candles[150:200]):
+            manager.prepend(candle)
+        assert manager.candles == candles[160:260]
+
+        manager.append(candles[260:300])
+        assert manager.candles == candles[200:300]
+
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_trim_bounds(self, columnar):
+        start = datetime(2024, 1, 1)
+        candles = [
+            Candle(1, 2, 0.5, 1.5, 10, timestamp=start + timedelta(minutes=i)) for i in range(3000)
+        ]
+        life = CandleManager([], candle_life=timedelta(minutes=1500), columnar=columnar)
+        count = CandleManager([], max_candles=2000, columnar=columnar)
+
+        for index, candle in enumerate(candles, 1):
+            life.append(candle)
+            count.append(candle)
+            assert life.candles[0].timestamp >= candle.timestamp - life.candle_life
+            assert len(count.candles) == min(index, count.max_candles)
+            assert life._trimmed + len(life.candles) == index
+
+        assert count.candles == candles[1000:]
+
+
+class TestCandleTrades:
+    def test_append_trade(self):
+        manager = CandleManager(timeframe=timedelta(minutes=5))
+
+        assert not manager.append_trade(datetime(2023, 10, 3, 9, 0, 30), 10, 1)
+        assert not manager.append_trade(datetime(2023, 10, 3, 9, 2), 12, 2)
+        assert not manager.append_trade(datetime(2023, 10, 3, 9, 4), 8, 3)
+        assert not manager.append_trade(datetime(2023, 10, 3, 9, 5), 9, 4)
+        assert manager.candles == []
+
+        assert manager.append_trade(datetime(2023, 10, 3, 9, 5, 1), 11, 5)
+        expected = Candle(10, 12, 8, 9, 10, timestamp=datetime(2023, 10, 3, 9, 5), timeframe="T5")
+        expected.aggregation_factor = 4
+        assert manager.candles == [expected]
+        assert manager.candles[0]._start_timestamp == datetime(2023, 10, 3, 9, 0, 30)
+        assert manager.candles[0]._end_timestamp == datetime(2023, 10, 3, 9, 5)
+
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_append_trade_refresh(self, columnar):
+        manager = CandleManager(
+            timeframe=timedelta(minutes=5), columnar=columnar, trade_refresh=timedelta(minutes=1)
+        )
+
+        assert manager.append_trade(datetime(2023, 10, 3, 9, 0, 30), 10, 1)
+        assert manager.candles[-1].close == 10
+
+        assert not manager.append_trade(datetime(2023, 10, 3, 9, 1), 12, 1)
+        assert manager.candles[-1].close == 10
+
+        manager.candles[-1].indicators["EMA"] = 1.0
+        assert manager.append_trade(datetime(2023, 10, 3, 9, 1, 30), 11, 1)
+        assert len(manager.candles) == 1
+        assert manager.candles[-1].high == 12 and manager.candles[-1].close == 11
+        assert manager.candles[-1].volume == 3
+        assert not manager.candles[-1].indicators
+
+        assert not manager.append_trade(datetime(2023, 10, 3, 9, 2), 13, 1)
+        assert manager.append_trade(datetime(2023, 10, 3, 9, 6), 14, 1)
+        assert len(manager.candles) == 2
+        assert manager.candles[0].close == 13 and manager.candles[0].volume == 4
+        assert manager.candles[1].close == 14
+
+    def test_append_trade_no_timeframe(self):
+        manager = CandleManager()
+
+        with pytest.raises(InvalidConfiguration):
+            manager.append_trade(datetime(2023, 10, 3, 9, 0, 30), 10, 1)
+        assert manager.candles == []
+
+    def test_append_trade_invalid_order(self):
+        manager = CandleManager(timeframe=timedelta(minutes=5))
+        manager.append_trade(datetime(2023, 10, 3, 9, 6), 10, 1)
+
+        with pytest.raises(InvalidCandleOrder):
+            manager.append_trade(datetime(2023, 10, 3, 9, 4), 10, 1)
+
+
+class TestCandleDerive:
+    def test_derivable_from(self):
+        base = CandleManager()
+        minute = CandleManager(timeframe=timedelta(minutes=1))
+        five = CandleManager(timeframe=timedelta(minutes=5))
+        seven = CandleManager(timeframe=timedelta(minutes=7))
+
+        assert five.derivable_from(base) and five.derivable_from(minute)
+        assert not five.derivable_from(five) and not minute.derivable_from(five)
+        assert not seven.derivable_from(five)
+        assert not base.derivable_from(minute)
+        assert not CandleManager(timeframe=timedelta(days=1)).derivable_from(base)
+        assert not CandleManager(
+            timeframe=timedelta(minutes=5), timeframe_fill=True
+        ).derivable_from(base)
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_derive_from(self, candles, columnar):
+        base = CandleManager([candle.clean_copy() for candle in candles[:50]], columnar=columnar)
+        minute = CandleManager(timeframe=timedelta(minutes=1), columnar=columnar)
+        five = CandleManager(timeframe=timedelta(minutes=5), columnar=columnar, max_candles=20)
+        minute.derive_from(base)
+        five.derive_from(minute)
+
+        for candle in candles[50:]:
+            base.append(candle)
+            minute.sync()
+            five.sync()
+
+        expected = CandleManager(
+            [candle.clean_copy() for candle in candles], timeframe=timedelta(minutes=5)
+        )
+        assert [candle.as_list() for candle in five.candles] == [
+            candle.as_list() for candle in expected.candles[-20:]
+        ]
+
+
 class TestCandleTimeframePrepend:
     def test_default(self):
         manager = CandleManager()
@@ -630,6 +786,35 @@ class TestCandleInsert:
         manager.insert(split_two)
         assert manager.candles == candles
 
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_insert_changed(self, candles, columnar):
+        manager = CandleManager(
+            [candle.clean_copy() for candle in candles[:200] + candles[201:300]],
+            columnar=columnar,
+        )
+
+        assert manager.insert([candles[300], candles[200]]) == (200, 300)
+        assert manager.candles == candles[:301]
+        assert manager.insert([]) is None
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_insert_timeframed(self, candles, columnar):
+        expected = CandleManager(
+            [candle.clean_copy() for candle in candles], timeframe=timedelta(minutes=5)
+        )
+
+        late = (7, 123, 124, 499)
+        manager = CandleManager(
+            [candle.clean_copy() for i, candle in enumerate(candles) if i not in late],
+            timeframe=timedelta(minutes=5),
+            columnar=columnar,
+        )
+
+        assert manager.insert([candles[i].clean_copy() for i in late]) == (1, 100)
+        assert manager.candles == expected.candles
+
 
 class TestCandleSort:
     def test_sort_candles(self):
@@ -0,0 +1,240 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from hexital import Candle, Hexital
+from hexital.core.candle_manager import CandleManager
+from hexital.core.candle_store import CandleStore, CandleView
+from hexital.indicators import EMA, SMA, Supertrend
+
+
+@pytest.fixture(name="store_candles")
+def fixture_store_candles():
+    return [
+        Candle(17213, 2395, 7813, 3615, 19661, timestamp=datetime(2023, 10, 3, 9, 0)),
+        Candle(1301, 3007, 11626, 19048, 28909, timestamp=datetime(2023, 10, 3, 9, 1)),
+        Candle(12261, 11267, 10409, 18522, 23451, timestamp=datetime(2023, 10, 3, 9, 2)),
+    ]
+
+
+class TestCandleStore:
+    def test_store_equal(self, store_candles):
+        store = CandleStore(store_candles)
+        assert store == store_candles
+
+    def test_store_view(self, store_candles):
+        store = CandleStore(store_candles)
+        assert isinstance(store[-1], CandleView)
+        assert store[-1].close == 18522
+        assert store[-1].timestamp == datetime(2023, 10, 3, 9, 2)
+
+    def test_store_view_write(self, store_candles):
+        store = CandleStore(store_candles)
+        store[0].close = 100
+        store[0].indicators["EMA"] = 5.0
+
+        assert store[0].close == 100
+        assert store[0].indicators == {"EMA": 5.0}
+        assert store[1].indicators == {}
+
+    def test_store_lazy_readings(self, store_candles):
+        store = CandleStore(store_candles)
+        assert store[0].indicators.get("EMA") is None
+        assert "EMA" not in store[0].indicators
+        assert store._indicators == {}
+
+    def test_store_insert_pop(self, store_candles):
+        store = CandleStore(store_candles[1:])
+        store.insert(0, store_candles[0])
+
+        assert store == store_candles
+
+        candle = store.pop(0)
+        assert not isinstance(candle, CandleView)
+        assert candle == store_candles[0]
+        assert store == store_candles[1:]
+
+    def test_store_slice_assignment(self, store_candles):
+        store = CandleStore(store_candles)
+        candles = [store.pop(1), store.pop(1)]
+        store[1:1] = candles
+
+        assert store == store_candles
+
+    def test_store_sort(self, store_candles):
+        store = CandleStore(reversed(store_candles))
+        store.sort(key=lambda candle: candle.timestamp)
+
+        assert store == store_candles
+
+    def test_store_timeframe(self, store_candles):
+        store_candles[0].timeframe = timedelta(minutes=5)
+        store_candles[0].aggregation_factor = 5
+        store = CandleStore(store_candles)
+
+        assert store[0].timeframe == timedelta(minutes=5)
+        assert store[0].aggregation_factor == 5
+        assert store[1].timeframe is None
+
+    def test_store_timezone(self):
+        timestamp = datetime(2023, 10, 3, 9, 0, tzinfo=timezone(timedelta(hours=2)))
+        store = CandleStore([Candle(1, 2, 0, 1, 10, timestamp=timestamp)])
+
+        assert store[0].timestamp == timestamp
+        assert store[0].timestamp.utcoffset() == timedelta(hours=2)
+
+    def test_store_no_timestamp(self):
+        store = CandleStore([Candle(1, 2, 0, 1, 10)])
+        assert store[0].timestamp is None
+
+    def test_store_purge(self, store_candles):
+        store = CandleStore(store_candles)
+        store[0].indicators["EMA"] = 5.0
+        store[1].sub_indicators["EMA"] = 5.0
+        store.purge({"EMA"})
+
+        assert store._indicators == {}
+        assert store._sub_indicators == {}
+
+    def test_store_series(self, store_candles):
+        store_candles[1].indicators["EMA"] = 5.0
+        store = CandleStore(store_candles)
+        store.insert(0, Candle(1, 2, 0, 1, 10))
+
+        assert store.readings("EMA") == [None, None, 5.0, None]
+        assert store.reading("EMA", 2) == 5.0
+        assert store.reading("close", 2) == 19048
+        assert not store.has_reading("EMA", 1)
+        assert store[2].indicators == {"EMA": 5.0}
+        assert store.pop(2).indicators == {"EMA": 5.0}
+        assert store.readings("EMA") == [None, None, None]
+
+    def test_store_alias(self, store_candles):
+        store = CandleStore(store_candles)
+        assert not store.alias("follower", "EMA")
+
+        store[0].sub_indicators["EMA"] = 5.0
+        assert store.alias("follower", "EMA")
+        assert store.series("follower") is store.series("EMA")
+
+        store[1].sub_indicators["EMA"] = 6.0
+        store.insert(0, Candle(1, 2, 0, 1, 10))
+        assert store.readings("follower") == [None, 5.0, 6.0, None]
+
+        store.unalias("follower")
+        assert store.series("follower") is not store.series("EMA")
+        store[3].sub_indicators["EMA"] = 7.0
+        assert store.readings("follower") == [None, 5.0, 6.0, None]
+
+    def test_store_nested_reading(self, store_candles):
+        store = CandleStore(store_candles)
+        store[0].indicators["MACD"] = {"MACD": 1.0, "signal": 2.0}
+
+        assert store.reading("MACD.signal", 0) == 2.0
+        assert store.readings("MACD.signal") == [2.0, None, None]
+
+    def test_store_append_ohlcv(self, store_candles):
+        store = CandleStore(store_candles[:2])
+        store[0].indicators["EMA"] = 5.0
+        store.append_ohlcv(*store_candles[2].as_list())
+
+        assert store[2] == store_candles[2]
+        assert store.readings("EMA") == [5.0, None, None]
+
+    def test_store_double_ended(self, candles):
+        store = CandleStore(candles[100:110])
+        store[5].indicators["EMA"] = 5.0
+
+        for candle in reversed(candles[:100]):
+            store.insert(0, candle)
+        assert [c.timestamp for c in store] == [c.timestamp for c in candles[:110]]
+        assert store.reading("EMA", 105) == 5.0
+        assert store.readings("close", 0, 2) == [candles[0].close, candles[1].close]
+
+        del store[:90]
+        assert [c.timestamp for c in store] == [c.timestamp for c in candles[90:110]]
+        assert store.pop(0).timestamp == candles[90].timestamp
+        assert store.reading("EMA", 14) == 5.0
+        assert store.has_reading("EMA", 14)
+        assert store.series("EMA").last_index() == 14
+
+    def test_store_valid_count(self, store_candles):
+        store = CandleStore(store_candles)
+        store[1].indicators["EMA"] = 5.0
+        store[2].indicators["EMA"] = 6.0
+
+        assert store.valid_count("EMA", 2) == 2
+        assert store.valid_count("EMA", 0) == 0
+        assert store.valid_count("close", 2) == 3
+        assert store.valid_count("MACD.signal", 2) is None
+
+        store.insert(0, Candle(1, 2, 0, 1, 10))
+        assert store.valid_count("EMA", 3) == 2
+        del store[2]
+        assert store.valid_count("EMA", 2) == 1
+
+    def test_store_accessor(self, store_candles):
+        store = CandleStore(store_candles)
+        close = store.accessor("close")
+        ema = store.accessor("EMA")
+        signal = store.accessor("MACD.signal")
+
+        assert ema(0) is None
+        store[0].indicators["EMA"] = 5.0
+        store[0].indicators["MACD"] = {"MACD": 1.0, "signal": 2.0}
+        assert close(1) == 19048
+        assert ema(0) == 5.0
+        assert signal(0) == 2.0
+        assert store.accessor("timestamp")(0) == datetime(2023, 10, 3, 9, 0)
+
+        store.clear()
+        store.append(Candle(1, 2, 0, 7, 10))
+        assert close(0) == 7
+        assert ema(0) is None
+
+
+class TestColumnarManager:
+    def test_manager_columnar(self, store_candles):
+        manager = CandleManager(store_candles, columnar=True)
+        assert isinstance(manager.candles, CandleStore)
+        assert manager.candles == store_candles
+
+    def test_manager_columnar_timeframe(self, candles, candles_T5):
+        manager = CandleManager(timeframe=timedelta(minutes=5), columnar=True)
+        manager.append(candles)
+
+        assert manager.candles == candles_T5
+
+
+class TestColumnarHexital:
+    @pytest.mark.usefixtures("candles", "expected_ema")
+    def test_columnar_ema(self, candles, expected_ema):
+        strat = Hexital("Test Stratergy", candles, [EMA()], columnar=True)
+        strat.calculate()
+
+        assert pytest.approx(strat.reading_as_list("EMA_10")) == expected_ema
+
+    def test_columnar_matches_list(self, candles):
+        indicators = [{"indicator": "SMA"}, {"indicator": "Supertrend"}, {"indicator": "MACD"}]
+        strat = Hexital("Test Stratergy", [], indicators)
+        strat_columnar = Hexital("Test Stratergy", [], indicators, columnar=True)
+
+        for candle in candles:
+            strat.append(candle)
+            strat_columnar.append(candle)
+
+        assert strat.readings() == strat_columnar.readings()
+
+    def test_columnar_timeframe(self, candles):
+        strat = Hexital("Test Stratergy", [], [SMA(timeframe="T5"), Supertrend()])
+        strat_columnar = Hexital(
+            "Test Stratergy", [], [SMA(timeframe="T5"), Supertrend()], columnar=True
+        )
+
+        strat.append(candles)
+        strat_columnar.append(candles)
+
+        assert strat.readings() == strat_columnar.readings()
+
+    def test_columnar_settings(self):
+        strat = Hexital("Test Stratergy", [], [], columnar=True)
+        assert strat.settings["columnar"] is True
@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import List
@@ -6,15 +7,34 @@ import pytest
 from hexital import Candle, Hexital, TimeFrame
 from hexital.analysis.patterns import doji
 from hexital.candlesticks.heikinashi import HeikinAshi
+from hexital.core.candle_manager import RETENTION_MARGIN
 from hexital.core.hexital import HexitalCol
 from hexital.core.indicator import Indicator
 from hexital.core.indicator_collection import IndicatorCollection
 from hexital.exceptions import (
     InvalidAnalysis,
     InvalidCandlestickType,
+    InvalidConfiguration,
     InvalidIndicator,
 )
-from hexital.indicators import EMA, RMA, SMA, Amorph
+from hexital.indicators import (
+    ADX,
+    ATR,
+    EMA,
+    HL,
+    JMA,
+    KC,
+    MACD,
+    OBV,
+    RMA,
+    RSI,
+    SMA,
+    STOCH,
+    TSI,
+    VWAP,
+    Amorph,
+    Supertrend,
+)
 from hexital.utils.candles import reading_by_candle
 from tests.core.test_indicator import FakeIndicator
 
@@ -115,6 +135,84 @@ class TestAppend:
         strat.append(candles[-1], "default")
         assert len(strat.candles("default")) == 2 and len(strat.candles("T5")) == 2
 
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_append_ohlcv(self, candles, columnar):
+        expected = Hexital("Test Stratergy", [], [EMA(), EMA(timeframe="T5")], columnar=columnar)
+        strat = Hexital("Test Stratergy", [], [EMA(), EMA(timeframe="T5")], columnar=columnar)
+
+        for candle in candles:
+            expected.append(candle)
+            strat.append_ohlcv(*candle.as_list())
+
+        assert strat.candles() == expected.candles()
+        assert strat.candles("T5") == expected.candles("T5")
+        assert strat.readings() == expected.readings()
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    @pytest.mark.parametrize("trade_refresh", [None, timedelta(0)])
+    def test_append_trade(self, candles, columnar, trade_refresh):
+        expected = Hexital("Test Stratergy", [], [EMA()], timeframe="T5", columnar=columnar)
+        strat = Hexital(
+            "Test Stratergy",
+            [],
+            [EMA()],
+            timeframe="T5",
+            columnar=columnar,
+            trade_refresh=trade_refresh,
+        )
+
+        for candle in candles:
+            for price, offset in [(candle.open, 50), (candle.high, 40), (candle.close, 30)]:
+                timestamp = candle.timestamp - timedelta(seconds=offset)
+                expected.append(Candle(price, price, price, price, 1, timestamp=timestamp))
+                strat.append_trade(timestamp, price, 1)
+
+        assert strat.reading("EMA_10") is not None
+        if trade_refresh is None:
+            assert strat.candles() == expected.candles()[:-1]
+            assert strat.reading_as_list("EMA_10") == expected.reading_as_list("EMA_10")[:-1]
+        else:
+            assert strat.candles() == expected.candles()
+            assert strat.reading_as_list("EMA_10") == expected.reading_as_list("EMA_10")
+
+    def test_append_trade_no_timeframe(self):
+        strat = Hexital("Test Stratergy", [], [EMA()])
+        with pytest.raises(InvalidConfiguration):
+            strat.append_trade(datetime(2023, 10, 3, 9, 0, 30), 10, 1)
+
+        strat.add_indicator(EMA(timeframe="T5"))
+        strat.append_trade(datetime(2023, 10, 3, 9, 0, 30), 10, 1)
+        strat.append_trade(datetime(2023, 10, 3, 9, 5, 30), 11, 1)
+
+        assert strat.candles() == []
+        assert [candle.as_list() for candle in strat.candles("T5")] == [
+            [datetime(2023, 10, 3, 9, 5), 10, 10, 10, 10, 1, timedelta(minutes=5)]
+        ]
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_append_ohlcv_str_timestamp(self, candles, columnar):
+        expected = Hexital("Test Stratergy", [], [EMA()], columnar=columnar)
+        strat = Hexital("Test Stratergy", [], [EMA()], columnar=columnar)
+
+        for candle in candles[:50]:
+            expected.append(candle)
+            timestamp, *values = candle.as_list()
+            strat.append_ohlcv(timestamp.isoformat(), *values)
+
+        assert strat.candles() == expected.candles()
+        assert strat.readings() == expected.readings()
+
+    @pytest.mark.usefixtures("candles")
+    def test_append_ohlcv_timeframe(self, candles):
+        strat = Hexital("Test Stratergy", [])
+        strat.add_indicator([EMA(), EMA(timeframe="T5")])
+        strat.append_ohlcv(*candles[0].as_list())
+        strat.append_ohlcv(*candles[-1].as_list(), timeframe="T5")
+        assert len(strat.candles("default")) == 1 and len(strat.candles("T5")) == 2
+
 
 class TestGetCandles:
     @pytest.mark.usefixtures("candles")
@@ -272,6 +370,23 @@ class TestParseTimeframe:
         assert strat._parse_timeframe(timedelta(minutes=15)) == "T15"
 
 
+@pytest.mark.usefixtures("candles")
+@pytest.mark.parametrize("columnar", [False, True])
+def test_hextial_max_candles(candles, columnar):
+    full = Hexital("Test Stratergy", [], [EMA(), SMA()], columnar=columnar)
+    strat = Hexital("Test Stratergy", [], [EMA(), SMA()], columnar=columnar, max_candles=100)
+
+    for candle in candles:
+        full.append(candle)
+        strat.append(candle)
+
+    assert len(strat.candles()) == 100
+    assert strat.max_candles == 100
+    assert strat.indicator("EMA_10").max_candles == 100
+    assert strat.reading("EMA_10") == full.reading("EMA_10")
+    assert strat.indicator("SMA_10").readings() == full.indicator("SMA_10").readings()[-100:]
+
+
 @pytest.mark.usefixtures("minimal_candles")
 def test_hextial_timerange(minimal_candles):
     strat = Hexital("Test Stratergy", [], candle_life=timedelta(minutes=1))
@@ -369,6 +484,437 @@ class TestHexitalCandleManagerInheritance:
         assert strat.indicator("EMA_10_T10").timeframe == "T10"
 
 
+class TestSharedSubIndicators:
+    @staticmethod
+    def build_indicators():
+        return [Supertrend(period=7), ADX(period=7), KC(period=7), ATR(period=7)]
+
+    def test_shared_followers(self):
+        strat = Hexital("Test Stratergy", [], self.build_indicators())
+
+        assert strat.indicator("ADX_7_7").sub_atr._leader is strat.indicator("Supertrend_7").sub_atr
+        assert (
+            strat.indicator("KC_7_2-0").sub_atr._leader is strat.indicator("Supertrend_7").sub_atr
+        )
+        assert strat.indicator("Supertrend_7").sub_atr._leader is None
+        # Solo readings are rounded, unlike the sub indicators, only it's TR is shared
+        assert strat.indicator("ATR_7")._leader is None
+        assert strat.indicator("ATR_7").sub_tr._leader is not None
+        assert "sub_atr" not in strat.indicator("KC_7_2-0").settings
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_shared_readings(self, candles, columnar):
+        strat = Hexital("Test Stratergy", [], self.build_indicators(), columnar=columnar)
+        for candle in candles:
+            strat.append(candle.clean_copy())
+
+        for indicator in self.build_indicators():
+            indicator.append([candle.clean_copy() for candle in candles])
+            assert strat.reading_as_list(indicator.name) == indicator.readings()
+
+        candle = strat.candles()[-1]
+        assert candle.sub_indicators["ADX_7_7-ATR_7"] == candle.sub_indicators["Supertrend_7-ATR_7"]
+        assert candle.sub_indicators["KC_7_2-0-ATR_7-TR"] is not None
+        if columnar:
+            series = strat.candles().series
+            assert series("ADX_7_7-ATR_7") is series("Supertrend_7-ATR_7")
+            assert series("KC_7_2-0-ATR_7-TR") is series("Supertrend_7-ATR_7-TR")
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_shared_remove_leader(self, candles, columnar):
+        strat = Hexital("Test Stratergy", [], self.build_indicators(), columnar=columnar)
+        strat.append([candle.clean_copy() for candle in candles[:200]])
+        strat.remove_indicator("Supertrend_7")
+
+        assert strat.indicator("ADX_7_7").sub_atr._leader is None
+        assert strat.indicator("KC_7_2-0").sub_atr._leader is strat.indicator("ADX_7_7").sub_atr
+        if columnar:
+            assert strat.candles().series("Supertrend_7-ATR_7") is None
+            assert strat.candles().series("ADX_7_7-ATR_7").last_index() == 199
+
+        strat.append([candle.clean_copy() for candle in candles[200:]])
+        expected = KC(period=7, candles=[candle.clean_copy() for candle in candles])
+        expected.calculate()
+        assert strat.reading_as_list("KC_7_2-0") == expected.readings()
+
+
+class TestWarmStart:
+    @staticmethod
+    def build_indicators():
+        return [
+            EMA(),
+            RMA(),
+            RSI(),
+            TSI(),
+            JMA(),
+            OBV(),
+            VWAP(),
+            Supertrend(),
+            SMA(),
+            EMA(name="EMA_T5", timeframe="T5"),
+        ]
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_warm_start(self, candles, columnar):
+        expected = Hexital(
+            "Test Stratergy",
+            [candle.clean_copy() for candle in candles],
+            self.build_indicators(),
+            columnar=columnar,
+        )
+        expected.calculate()
+
+        strat = Hexital(
+            "Test Stratergy",
+            [candle.clean_copy() for candle in candles[:300]],
+            self.build_indicators(),
+            columnar=columnar,
+        )
+        strat.calculate()
+        states = strat.export_state()
+        assert "SMA_10" not in states
+        assert len(states["EMA_10"]["timestamps"]) == 2
+        assert len(states["JMA_7_0-0"]["timestamps"]) == 65
+
+        warm = Hexital(
+            "Test Stratergy",
+            [candle.clean_copy() for candle in candles[230:300]],
+            self.build_indicators(),
+            columnar=columnar,
+        )
+        warm.seed_state(states)
+        assert warm.reading("EMA_10") == strat.reading("EMA_10")
+        assert warm.reading_as_list("EMA_10")[0] is None
+
+        for candle in candles[300:]:
+            warm.append(candle.clean_copy())
+
+        for name in states:
+            count = len(expected.candles(name)) - len(strat.candles(name)) + 1
+            assert warm.reading_as_list(name)[-count:] == expected.reading_as_list(name)[-count:]
+
+    @pytest.mark.usefixtures("candles")
+    def test_warm_start_invalid(self, candles):
+        strat = Hexital("Test Stratergy", [c.clean_copy() for c in candles[:300]], [EMA()])
+        strat.calculate()
+        states = strat.export_state()
+
+        warm = Hexital("Test Stratergy", [c.clean_copy() for c in candles[300:]], [EMA()])
+        with pytest.raises(InvalidConfiguration):
+            warm.seed_state(states)
+        with pytest.raises(InvalidIndicator):
+            warm.seed_state({"EMA_20": states["EMA_10"]})
+
+
+class TestAutoRetention:
+    @staticmethod
+    def build_indicators():
+        return [
+            EMA(),
+            MACD(),
+            STOCH(),
+            JMA(),
+            HL(period=50),
+            Supertrend(),
+            SMA(timeframe="T5"),
+        ]
+
+    def test_lookback(self):
+        assert STOCH(period=14, smoothing_k=3, slow_period=3).lookback() == 20
+        assert HL(period=100).lookback() == 100
+        assert SMA(period=10).lookback() == 11
+        assert FakeIndicator().lookback() is None
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_auto_retention(self, candles, columnar):
+        expected = Hexital("Test Stratergy", [], self.build_indicators(), columnar=columnar)
+        strat = Hexital(
+            "Test Stratergy",
+            [],
+            self.build_indicators(),
+            columnar=columnar,
+            auto_retention=True,
+        )
+        assert strat.settings["auto_retention"] is True
+        assert "auto_retention" not in expected.settings
+
+        for candle in candles:
+            expected.append(candle.clean_copy())
+            strat.append(candle.clean_copy())
+            for name in expected.indicators:
+                assert strat.reading(name) == expected.reading(name), name
+
+        assert len(strat.candles()) == 75 + RETENTION_MARGIN
+        assert len(strat.candles("T5")) == 11 + RETENTION_MARGIN
+        assert len(expected.candles()) == len(candles)
+
+    @pytest.mark.usefixtures("candles")
+    def test_auto_retention_unknown(self, candles):
+        strat = Hexital("Test Stratergy", [], [EMA(), FakeIndicator()], auto_retention=True)
+        strat.append([candle.clean_copy() for candle in candles])
+        assert len(strat.candles()) == len(candles)
+
+        strat.remove_indicator("Fake_10")
+        strat.append(candles[-1].clean_copy())
+        assert len(strat.candles()) == 11 + RETENTION_MARGIN
+
+
+class TestInsert:
+    @staticmethod
+    def build_indicators():
+        return [
+            EMA(),
+            MACD(),
+            Supertrend(),
+            HL(period=50),
+            EMA(name="EMA_SMA", source="SMA_10_T5"),
+            SMA(timeframe="T5"),
+        ]
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_insert(self, candles, columnar):
+        expected = Hexital("Test Stratergy", [], self.build_indicators())
+        expected.append([candle.clean_copy() for candle in candles])
+
+        late = (3, 150, 151, 320, 498)
+        strat = Hexital(
+            "Test Stratergy",
+            [candle.clean_copy() for i, candle in enumerate(candles) if i not in late],
+            self.build_indicators(),
+            columnar=columnar,
+        )
+        strat.calculate()
+        strat.insert([candles[i].clean_copy() for i in reversed(late)])
+
+        assert strat.candles() == expected.candles()
+        assert strat.candles("T5") == expected.candles("T5")
+        for name in expected.indicators:
+            assert strat.reading_as_list(name) == expected.reading_as_list(name), name
+
+    @pytest.mark.usefixtures("candles")
+    def test_insert_bounded(self, candles, monkeypatch):
+        expected = Hexital("Test Stratergy", [c.clean_copy() for c in candles], [EMA(), SMA()])
+        expected.calculate()
+
+        strat = Hexital(
+            "Test Stratergy",
+            [candle.clean_copy() for i, candle in enumerate(candles) if i != 250],
+            [EMA(), SMA()],
+        )
+        strat.calculate()
+
+        calculated = {}
+        calculate_index = Indicator.calculate_index
+
+        def counted_calculate_index(self, start_index, end_index=None):
+            calculated[self.name] = (start_index, end_index)
+            calculate_index(self, start_index, end_index)
+
+        monkeypatch.setattr(Indicator, "calculate_index", counted_calculate_index)
+        strat.insert(candles[250].clean_copy())
+
+        assert calculated["SMA_10"] == (250, 260)
+        assert calculated["EMA_10"] == (250, 250 + EMA().horizon())
+        assert strat.reading_as_list("EMA_10") == expected.reading_as_list("EMA_10")
+        assert strat.reading_as_list("SMA_10") == expected.reading_as_list("SMA_10")
+
+
+class TestAsync:
+    @staticmethod
+    def build_indicators():
+        return [EMA(), RSI(), Supertrend(), SMA(timeframe="T5")]
+
+    @pytest.mark.usefixtures("candles")
+    def test_aappend(self, candles):
+        expected = Hexital("Test Stratergy", [], self.build_indicators())
+        expected.append([candle.clean_copy() for candle in candles])
+
+        strat = Hexital("Test Stratergy", [], self.build_indicators())
+        asyncio.run(strat.aappend([c.clean_copy() for c in candles[:-1]], chunk_size=50))
+        asyncio.run(strat.aappend(candles[-1].clean_copy()))
+
+        for name in expected.indicators:
+            assert strat.reading_as_list(name) == expected.reading_as_list(name)
+
+    @pytest.mark.usefixtures("candles")
+    def test_ainsert(self, candles):
+        expected = Hexital("Test Stratergy", [c.clean_copy() for c in candles[:300]], [EMA()])
+        expected.insert([candle.clean_copy() for candle in candles[300:]])
+
+        strat = Hexital("Test Stratergy", [c.clean_copy() for c in candles[:300]], [EMA()])
+        asyncio.run(strat.ainsert([candle.clean_copy() for candle in candles[300:]], chunk_size=70))
+
+        assert strat.reading_as_list("EMA_10") == expected.reading_as_list("EMA_10")
+
+    @pytest.mark.usefixtures("candles")
+    def test_astream(self, candles):
+        pulled = []
+
+        async def source():
+            for candle in candles[:20]:
+                pulled.append(candle)
+                yield candle.clean_copy()
+
+        async def consume(strat: Hexital):
+            readings = []
+            async for reading in strat.astream(source()):
+                # Source is only read as the readings are consumed
+                assert len(pulled) == len(readings) + 1
+                readings.append(reading)
+            return readings
+
+        strat = Hexital("Test Stratergy", [], [EMA()])
+        readings = asyncio.run(consume(strat))
+
+        assert len(readings) == 20
+        assert readings[-1] == {"EMA_10": strat.reading("EMA_10")}
+        assert readings[-1]["EMA_10"] is not None
+
+
+class TestStream:
+    @staticmethod
+    def build_indicators():
+        return [EMA(), MACD(), Supertrend(), SMA(timeframe="T5")]
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_stream(self, candles, columnar):
+        expected = Hexital("Test Stratergy", [], self.build_indicators(), columnar=columnar)
+        strat = Hexital("Test Stratergy", [], self.build_indicators(), columnar=columnar)
+
+        streamed = strat.stream(candle.clean_copy() for candle in candles)
+        for candle, (latest, readings) in zip(candles, streamed):
+            expected.append(candle.clean_copy())
+            assert latest.timestamp == candle.timestamp
+            assert latest.indicators["EMA_10"] == readings["EMA_10"]
+            assert readings == {name: expected.reading(name) for name in expected.indicators}
+            assert len(strat.candles()) <= 35 + RETENTION_MARGIN
+
+        streamed.close()
+        assert strat._candle_map["default"].retention is None
+
+    @pytest.mark.usefixtures("candles")
+    def test_stream_batch(self, candles):
+        expected = Hexital("Test Stratergy", [], self.build_indicators())
+        expected.append([candle.clean_copy() for candle in candles])
+
+        strat = Hexital("Test Stratergy", [], self.build_indicators())
+        streamed = list(strat.stream((c.clean_copy() for c in candles), batch_size=60))
+
+        assert len(streamed) == 9
+        assert streamed[-1][0].timestamp == candles[-1].timestamp
+        assert streamed[-1][1] == {name: expected.reading(name) for name in expected.indicators}
+
+
+class TestLazy:
+    @staticmethod
+    def build_indicators():
+        return [
+            EMA(),
+            MACD(),
+            KC(),
+            Supertrend(),
+            SMA(timeframe="T5"),
+            SMA(),
+            EMA(period=3, source="SMA_10", name="EMA_SMA"),
+        ]
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_lazy(self, candles, columnar):
+        expected = Hexital("Test Stratergy", [], self.build_indicators(), columnar=columnar)
+        strat = Hexital("Test Stratergy", [], self.build_indicators(), columnar=columnar, lazy=True)
+        assert strat.settings["lazy"] is True
+        assert "lazy" not in expected.settings
+
+        for index, candle in enumerate(candles):
+            expected.append(candle.clean_copy())
+            strat.append(candle.clean_copy())
+            assert all(indicator._stale for indicator in strat.indicators.values())
+
+            if index % 40 == 0:
+                assert strat.reading("EMA_SMA") == expected.reading("EMA_SMA")
+                assert not strat.indicator("SMA_10")._stale
+                assert strat.indicator("EMA_10")._stale
+
+        assert strat.reading("MACD_12_26_9.MACD") == expected.reading("MACD_12_26_9.MACD")
+        assert strat.indicator("KC_20_2-0").reading() == expected.indicator("KC_20_2-0").reading()
+        assert strat.window("Supertrend_7", 5)[-1] == expected.reading("Supertrend_7")
+        assert strat.readings() == expected.readings()
+
+    @pytest.mark.usefixtures("candles")
+    def test_lazy_analysis(self, candles):
+        def build_indicators():
+            return [
+                EMA(period=5),
+                {"analysis": "rising", "args": {"indicator": "EMA_5", "length": 2}, "name": "R"},
+            ]
+
+        expected = Hexital("Test Stratergy", [], build_indicators())
+        strat = Hexital("Test Stratergy", [], build_indicators(), lazy=True)
+        assert strat.indicator("R")._dependencies == [strat.indicator("EMA_5")]
+
+        for candle in candles[:60]:
+            expected.append(candle.clean_copy())
+            strat.append(candle.clean_copy())
+
+        assert strat.reading("R") == expected.reading("R")
+        assert strat.readings() == expected.readings()
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_lazy_prepend(self, candles, columnar):
+        expected = Hexital("Test Stratergy", [], [EMA(), ATR()], columnar=columnar)
+        expected.append([candle.clean_copy() for candle in candles[96:210]])
+
+        strat = Hexital("Test Stratergy", [], [EMA(), ATR()], columnar=columnar, lazy=True)
+        strat.append([candle.clean_copy() for candle in candles[100:200]])
+        strat.calculate()
+        strat.append([candle.clean_copy() for candle in candles[200:210]])
+        strat.prepend([candle.clean_copy() for candle in candles[96:100]])
+
+        assert strat.readings() == expected.readings()
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    @pytest.mark.parametrize("chunked", [False, True])
+    def test_lazy_insert(self, candles, columnar, chunked):
+        expected = Hexital("Test Stratergy", [], [EMA(), ATR()], columnar=columnar)
+        expected.append([candle.clean_copy() for candle in candles[:300]])
+
+        missing = [candle for index, candle in enumerate(candles[:300]) if index != 120]
+        strat = Hexital("Test Stratergy", [], [EMA(), ATR()], columnar=columnar, lazy=True)
+        strat.append([candle.clean_copy() for candle in missing[:279]])
+        strat.calculate()
+        strat.append([candle.clean_copy() for candle in missing[279:]])
+        if chunked:
+            asyncio.run(strat.ainsert(candles[120].clean_copy(), chunk_size=20))
+        else:
+            strat.insert(candles[120].clean_copy())
+
+        assert strat.readings() == expected.readings()
+
+    @pytest.mark.usefixtures("candles")
+    def test_lazy_retention(self, candles):
+        strat = Hexital("Test Stratergy", [], [EMA(), SMA()], lazy=True, auto_retention=True)
+        for candle in candles[:100]:
+            strat.append(candle.clean_copy())
+        assert len(strat.candles()) == 100
+
+        strat.reading("EMA_10")
+        strat.append(candles[100].clean_copy())
+        assert len(strat.candles()) == 101
+
+        strat.calculate()
+        strat.append(candles[101].clean_copy())
+        assert len(strat.candles()) == 11 + RETENTION_MARGIN
+
+
 class TestChain:
     @pytest.mark.usefixtures("candles")
     def test_hextial_movement(self, candles):
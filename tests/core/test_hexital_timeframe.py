@@ -2,9 +2,10 @@ from datetime import timedelta
 
 import pytest
 from hexital.candlesticks.heikinashi import HeikinAshi
-from hexital.core.candle_manager import DEFAULT_CANDLES
+from hexital.core.candle_manager import DEFAULT_CANDLES, CandleManager
 from hexital.core.hexital import Hexital
 from hexital.indicators import EMA, OBV, SMA
+from hexital.utils.timeframe import convert_timeframe_to_timedelta
 
 
 @pytest.mark.usefixtures("candles", "expected_ema", "expected_sma_t10")
@@ -108,3 +109,37 @@ def test_hextial_multi_timeframes_candlesticks(candles):
         isinstance(strat.indicators["EMA_10_T5_HA"].candlestick, HeikinAshi)
         and strat.indicators["EMA_10_T5_HA"].candles[-1].tag == "HA"
     )
+
+
+@pytest.mark.usefixtures("candles")
+def test_hextial_timeframes_derived(candles):
+    strat = Hexital("Test Strategy", candles, [EMA(timeframe="T10"), EMA(timeframe="T5")])
+    strat.add_indicator([SMA(timeframe="H1"), SMA(timeframe="T15")])
+
+    assert strat._candle_map["T10"].source is strat._candle_map[DEFAULT_CANDLES]
+    assert strat._candle_map["T5"].source is strat._candle_map[DEFAULT_CANDLES]
+    assert strat._candle_map["H1"].source is strat._candle_map["T10"]
+    assert strat._candle_map["T15"].source is strat._candle_map["T5"]
+
+
+@pytest.mark.usefixtures("candles")
+@pytest.mark.parametrize("columnar", [False, True])
+def test_hextial_timeframes_derived_append(candles, columnar):
+    indicators = [EMA(timeframe="T5"), EMA(timeframe="T15"), SMA(timeframe="H1")]
+    strat = Hexital("Test Strategy", candles[:100], indicators, columnar=columnar)
+
+    for candle in candles[100:]:
+        strat.append(candle)
+
+    for timeframe in ["T5", "T15", "H1"]:
+        expected = CandleManager(
+            [candle.clean_copy() for candle in candles],
+            timeframe=convert_timeframe_to_timedelta(timeframe),
+        )
+        assert [candle.as_list() for candle in strat.candles(timeframe)] == [
+            candle.as_list() for candle in expected.candles
+        ]
+
+    expected = Hexital("Test Strategy", candles, [SMA(timeframe="H1")])
+    expected.calculate()
+    assert strat.reading_as_list("SMA_10_H1") == expected.reading_as_list("SMA_10_H1")
@@ -3,11 +3,12 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 
 import pytest
-from hexital import Candle
+from hexital import Candle, Hexital
 from hexital.analysis.patterns import doji
 from hexital.candlesticks.heikinashi import HeikinAshi
-from hexital.core.indicator import Indicator
+from hexital.core.indicator import Indicator, Managed, NestedSource
 from hexital.exceptions import InvalidCandlestickType
+from hexital.indicators import EMA, MACD, RSI, SMA
 from hexital.indicators.amorph import Amorph
 
 
@@ -254,6 +255,31 @@ def test_reading_as_list_no_indicator(minimal_candles: List[Candle]):
     assert test_indicator.readings("FUCK") == [None] * 20
 
 
+def test_nested_source_reused():
+    test_indicator = FakeIndicator(candles=[])
+    data = test_indicator.add_managed_indicator(Managed())
+    source = NestedSource(data, "gain")
+
+    assert NestedSource(data, "gain") is source
+    assert NestedSource(data, "loss") is not source
+    assert NestedSource(test_indicator, "gain") is not source
+    assert source.name == "Fake_10_data.gain"
+
+    data.name = "renamed"
+    assert source.name == "renamed.gain"
+
+
+@pytest.mark.usefixtures("minimal_candles")
+def test_nested_source_reading(minimal_candles: List[Candle]):
+    test_indicator = FakeIndicator(candles=minimal_candles)
+    data = test_indicator.add_managed_indicator(Managed())
+    data.set_reading({"gain": 1.5}, index=3)
+
+    assert test_indicator.reading(NestedSource(data, "gain"), index=3) == 1.5
+    assert test_indicator.reading(NestedSource(data, "gain"), index=4) is None
+    assert test_indicator.reading(NestedSource(data, "loss"), index=3) is None
+
+
 class TestCandlestickType:
     def test_indicator_candlestick_type(self):
         test_indicator = FakeIndicator(candles=[], candlestick=HeikinAshi())
@@ -266,3 +292,52 @@ class TestCandlestickType:
     def test_indicator_candlestick_type_error(self):
         with pytest.raises(InvalidCandlestickType):
             test_indicator = FakeIndicator(candles=[], candlestick="FUCK")
+
+
+class TestPrependConvergence:
+    def test_horizon(self):
+        assert EMA().horizon() == EMA().warmup()
+        assert SMA(period=20).horizon() == 20
+        assert EMA(source="SMA_10").horizon() is None
+        assert FakeIndicator().horizon() is None
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_prepend_bounded(self, candles, columnar, monkeypatch):
+        indicators = [EMA(rounding=None), SMA(rounding=None), RSI(rounding=None)]
+        expected = Hexital("Test", [c.clean_copy() for c in candles], indicators)
+        expected.calculate()
+
+        indicators = [EMA(rounding=None), SMA(rounding=None), RSI(rounding=None)]
+        strat = Hexital(
+            "Test", [c.clean_copy() for c in candles[10:]], indicators, columnar=columnar
+        )
+        strat.calculate()
+
+        calculated = {}
+        set_reading = Indicator._set_reading
+
+        def counted_set_reading(self, reading, index=None):
+            calculated[self.name] = calculated.get(self.name, 0) + 1
+            set_reading(self, reading, index)
+
+        monkeypatch.setattr(Indicator, "_set_reading", counted_set_reading)
+        strat.prepend([candle.clean_copy() for candle in candles[:10]])
+
+        for name, indicator in strat.indicators.items():
+            assert calculated[name] <= 10 + indicator.horizon()
+            for reading, expected_reading in zip(
+                strat.reading_as_list(name), expected.reading_as_list(name)
+            ):
+                assert reading == pytest.approx(expected_reading, rel=1e-9), name
+
+    @pytest.mark.usefixtures("candles")
+    def test_prepend_dict_readings(self, candles):
+        expected = MACD(candles=[c.clean_copy() for c in candles])
+        expected.calculate()
+
+        test = MACD(candles=[c.clean_copy() for c in candles[10:]])
+        test.calculate()
+        test.prepend([candle.clean_copy() for candle in candles[:10]])
+
+        assert test.readings()[:100] == expected.readings()[:100]
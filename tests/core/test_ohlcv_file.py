@@ -0,0 +1,119 @@
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+from hexital import Candle, Hexital
+from hexital.core.ohlcv_file import (
+    _HEADER,
+    OHLCV_MAGIC,
+    OHLCV_VERSION,
+    read_csv,
+    read_ohlcv,
+    write_ohlcv,
+)
+from hexital.exceptions import InvalidOHLCVFile
+
+
+def copy_candles(candles: List[Candle]) -> List[Candle]:
+    return [candle.clean_copy() for candle in candles]
+
+
+def assert_readings(result: Hexital, expected: Hexital):
+    for name in expected.indicators:
+        assert result.reading_as_list(name) == expected.reading_as_list(name), name
+
+
+def write_csv(path, candles: List[Candle], header: bool = True):
+    with open(path, "w") as file:
+        if header:
+            file.write("Date,Open,High,Low,Close,Volume\n")
+        for candle in candles:
+            file.write(
+                f"{candle.timestamp.isoformat()},{candle.open},{candle.high},"
+                f"{candle.low},{candle.close},{candle.volume}\n"
+            )
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.usefixtures("candles")
+def test_ohlcv_file(candles, build_indicators, columnar, tmp_path):
+    expected = Hexital("Test Stratergy", copy_candles(candles), build_indicators())
+    expected.calculate()
+
+    write_ohlcv(tmp_path / "candles.bin", candles[:200])
+    write_ohlcv(tmp_path / "candles.bin", candles[200:], append=True)
+
+    strat = Hexital("Test Stratergy", [], build_indicators(), columnar=columnar)
+    for columns in read_ohlcv(tmp_path / "candles.bin", chunk_size=64):
+        strat.extend_ohlcv(columns)
+
+    assert_readings(strat, expected)
+    assert [candle.as_list() for candle in strat.candles()] == [
+        candle.as_list() for candle in expected.candles()
+    ]
+
+
+@pytest.mark.usefixtures("candles")
+def test_ohlcv_file_timezone(candles, tmp_path):
+    aware = copy_candles(candles[:10])
+    for candle in aware:
+        candle.timestamp = candle.timestamp.replace(tzinfo=timezone.utc)
+
+    write_ohlcv(tmp_path / "candles.bin", aware)
+    columns = next(read_ohlcv(tmp_path / "candles.bin"))
+    assert columns.tz == timezone.utc
+    assert [candle.timestamp for candle in columns.candles()] == [
+        candle.timestamp for candle in aware
+    ]
+
+    with pytest.raises(InvalidOHLCVFile):
+        write_ohlcv(tmp_path / "candles.bin", candles[10:20], append=True)
+
+
+def test_ohlcv_file_invalid(tmp_path):
+    path = tmp_path / "candles.bin"
+
+    path.write_bytes(b"HEX")
+    with pytest.raises(InvalidOHLCVFile):
+        next(read_ohlcv(path))
+
+    path.write_bytes(_HEADER.pack(b"NOTHEXIT", OHLCV_VERSION, 0))
+    with pytest.raises(InvalidOHLCVFile):
+        next(read_ohlcv(path))
+
+    path.write_bytes(_HEADER.pack(OHLCV_MAGIC, OHLCV_VERSION, 0) + bytes(20))
+    with pytest.raises(InvalidOHLCVFile):
+        next(read_ohlcv(path))
+
+    path.write_bytes(_HEADER.pack(OHLCV_MAGIC, OHLCV_VERSION, 0))
+    assert list(read_ohlcv(path)) == []
+
+
+@pytest.mark.parametrize("header", [True, False])
+@pytest.mark.usefixtures("candles")
+def test_read_csv(candles, build_indicators, header, tmp_path):
+    expected = Hexital("Test Stratergy", copy_candles(candles), build_indicators())
+    expected.calculate()
+
+    write_csv(tmp_path / "candles.csv", candles, header)
+    strat = Hexital("Test Stratergy", [], build_indicators(), columnar=True)
+    for columns in read_csv(tmp_path / "candles.csv", chunk_size=100):
+        strat.extend_ohlcv(columns)
+
+    assert_readings(strat, expected)
+
+
+def test_read_csv_formats(tmp_path):
+    path = tmp_path / "candles.csv"
+    path.write_text('open,close,high,low,volume,time\n1,2,3,0.5,"10",60\n\n2,3,4,1.5,20,120\n')
+
+    columns = list(read_csv(path))
+    assert len(columns) == 1
+    assert columns[0].candles() == [
+        Candle(1, 3, 0.5, 2, 10, datetime(1970, 1, 1, 0, 1, tzinfo=timezone.utc)),
+        Candle(2, 4, 1.5, 3, 20, datetime(1970, 1, 1, 0, 2, tzinfo=timezone.utc)),
+    ]
+
+    path.write_text("open,high,low,volume\n1,2,3,4\n")
+    with pytest.raises(InvalidOHLCVFile):
+        next(read_csv(path))
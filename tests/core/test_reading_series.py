@@ -0,0 +1,146 @@
+from hexital.core.reading_series import Coverage, ReadingSeries
+
+
+class TestReadingSeries:
+    def test_series_empty(self):
+        series = ReadingSeries(3)
+        assert len(series) == 3
+        assert series.as_list() == [None, None, None]
+        assert not series.has(0)
+        assert series.last_index() == -1
+
+    def test_series_set(self):
+        series = ReadingSeries(3)
+        series.set(1, None)
+        series.set(2, 5.5)
+
+        assert series.as_list() == [None, None, 5.5]
+        assert not series.has(0)
+        assert series.has(1)
+        assert series.first_index() == 1
+        assert series.last_index() == 2
+
+    def test_series_objects(self):
+        series = ReadingSeries(2)
+        series.set(0, 5.5)
+        series.set(1, {"MACD": 1.0})
+
+        assert series._objects
+        assert series.as_list() == [5.5, {"MACD": 1.0}]
+
+    def test_series_insert_delete(self):
+        series = ReadingSeries(2)
+        series.set(0, 1.0)
+        series.set(1, 2.0)
+        series.insert(1)
+        series.append()
+
+        assert series.as_list() == [1.0, None, 2.0, None]
+        assert not series.has(1)
+
+        del series[0:2]
+        assert series.as_list() == [2.0, None]
+
+    def test_series_extend(self):
+        series = ReadingSeries(1)
+        series.set(0, 1.0)
+        series.extend(2)
+        assert series.as_list() == [1.0, None, None]
+
+        series.set(1, {"MACD": 1.0})
+        series.extend(1)
+        assert series.as_list() == [1.0, {"MACD": 1.0}, None, None]
+        assert not series.has(3)
+
+    def test_series_buffer(self):
+        series = ReadingSeries(3)
+        series.set(1, 2.0)
+        series.insert(0)
+
+        with series.buffer(1) as view:
+            assert view.obj is series._values
+            values = view.tolist()
+        assert len(values) == 3
+        assert values[1] == 2.0
+        assert values[0] != values[0]
+
+        series.set(0, {"MACD": 1.0})
+        assert series.buffer() is None
+
+    def test_series_discard(self):
+        series = ReadingSeries(1)
+        series.set(0, 1.0)
+        series.discard(0)
+
+        assert not series.has(0)
+        assert series.get(0) is None
+
+    def test_series_coverage(self):
+        series = ReadingSeries(6)
+        for row, reading in enumerate([None, 1.0, 2.0, None, 3.0, 4.0]):
+            series.set(row, reading)
+
+        assert series.coverage.ranges() == [(1, 3), (4, 6)]
+        assert series.coverage.first() == 1
+        assert series.coverage.count(5) == 2
+        assert series.coverage.count(3) == 0
+        assert series.last_index() == 5
+
+    def test_series_coverage_shifts(self):
+        series = ReadingSeries(4)
+        for row in range(4):
+            series.set(row, float(row))
+
+        series.insert(2)
+        assert series.coverage.ranges() == [(0, 2), (3, 5)]
+        assert series.last_index() == 4
+
+        del series[0]
+        assert series.coverage.ranges() == [(0, 1), (2, 4)]
+
+        del series[1]
+        assert series.coverage.ranges() == [(0, 3)]
+
+        series.discard(2)
+        assert series.coverage.ranges() == [(0, 2)]
+        assert series.last_index() == 1
+
+
+class TestCoverage:
+    def test_coverage_add(self):
+        coverage = Coverage()
+        for row in [0, 1, 2, 5, 4, 7]:
+            coverage.add(row)
+
+        assert coverage.ranges() == [(0, 3), (4, 6), (7, 8)]
+        coverage.add(3)
+        assert coverage.ranges() == [(0, 6), (7, 8)]
+        assert coverage.count(5) == 6
+        assert coverage.valid(7)
+        assert not coverage.valid(6)
+
+    def test_coverage_remove(self):
+        coverage = Coverage()
+        for row in range(6):
+            coverage.add(row)
+
+        coverage.remove(2)
+        coverage.remove(0)
+        coverage.remove(5)
+        assert coverage.ranges() == [(1, 2), (3, 5)]
+        assert coverage.first() == 1
+
+    def test_coverage_insert_delete(self):
+        coverage = Coverage()
+        for row in range(5):
+            coverage.add(row)
+
+        coverage.insert(0)
+        assert coverage.ranges() == [(1, 6)]
+        coverage.insert(3)
+        assert coverage.ranges() == [(1, 3), (4, 7)]
+        coverage.delete(2, 5)
+        assert coverage.ranges() == [(1, 4)]
+        coverage.delete(0, 10)
+        assert coverage.ranges() == []
+        assert coverage.first() == -1
@@ -0,0 +1,96 @@
+from typing import List
+
+import pytest
+from hexital import Candle, Hexital
+from hexital.exceptions import BufferHeld
+from hexital.indicators import EMA, MACD
+from hexital.utils import vectorized
+
+
+def copy_candles(candles: List[Candle]) -> List[Candle]:
+    return [candle.clean_copy() for candle in candles]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.usefixtures("candles")
+def test_window(candles, columnar):
+    strat = Hexital(
+        "Test Stratergy", copy_candles(candles[:100]), [EMA(), MACD()], columnar=columnar
+    )
+    strat.calculate()
+
+    ema = strat.window("EMA_10", 5)
+    macd = strat.window("MACD_12_26_9.MACD", 3)
+    close = strat.window("close", 4)
+
+    assert list(ema) == strat.reading_as_list("EMA_10")[-5:]
+    assert list(macd) == strat.reading_as_list("MACD_12_26_9.MACD")[-3:]
+    assert list(close) == [candle.close for candle in candles[96:100]]
+
+    for candle in candles[100:120]:
+        strat.append(candle.clean_copy())
+
+    assert len(ema) == 5
+    assert list(ema) == strat.reading_as_list("EMA_10")[-5:]
+    assert ema[-1] == strat.reading("EMA_10")
+    assert ema[1:3] == strat.reading_as_list("EMA_10")[-4:-2]
+    assert len(strat.window("EMA_10")) == 120
+    assert len(strat.window("EMA_10", 500)) == 120
+
+    with pytest.raises(IndexError):
+        ema[5]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.usefixtures("candles")
+def test_window_buffer(candles, columnar):
+    strat = Hexital("Test Stratergy", copy_candles(candles[:50]), [EMA()], columnar=columnar)
+    strat.calculate()
+
+    with strat.window("EMA_10").buffer() as view:
+        values = view.tolist()
+        if columnar:
+            assert view.obj is strat.candles().series("EMA_10")._values
+    assert values[-1] == strat.reading("EMA_10")
+    assert values[0] != values[0]
+
+    with strat.window("close", 10).buffer() as view:
+        assert view.tolist() == [candle.close for candle in candles[40:50]]
+
+    strat.append(candles[50].clean_copy())
+    assert strat.window("EMA_10", 1)[0] == strat.reading("EMA_10")
+
+
+@pytest.mark.parametrize("name", ["EMA_10", "close"])
+@pytest.mark.usefixtures("candles")
+def test_window_buffer_held(candles, name):
+    strat = Hexital("Test Stratergy", copy_candles(candles[:50]), [EMA()], columnar=True)
+    strat.calculate()
+
+    view = strat.window(name).buffer()
+    with pytest.raises(BufferHeld):
+        strat.append(candles[50].clean_copy())
+    with pytest.raises(BufferHeld):
+        strat.calculate()
+    assert len(strat.candles()) == 50
+
+    view.release()
+    strat.append(candles[50].clean_copy())
+    assert len(strat.candles()) == 51
+    assert strat.reading("EMA_10") == strat.window("EMA_10", 1)[0]
+
+
+@pytest.mark.skipif(not vectorized.available(), reason="NumPy is not installed")
+@pytest.mark.usefixtures("candles")
+def test_window_numpy(candles):
+    strat = Hexital("Test Stratergy", copy_candles(candles[:50]), [EMA()], columnar=True)
+    strat.calculate()
+
+    values = strat.indicators["EMA_10"].window(10).numpy()
+    assert values.tolist() == strat.reading_as_list("EMA_10")[-10:]
+    with pytest.raises(BufferHeld):
+        strat.append(candles[50].clean_copy())
+    del values
+
+    strat.append(candles[50].clean_copy())
+    assert strat.reading("EMA_10") is not None
@@ -0,0 +1,67 @@
+from typing import List
+
+import pytest
+from hexital import Candle, Hexital
+from hexital.candlesticks import HeikinAshi
+from hexital.core.snapshot import SNAPSHOT_MAGIC, SNAPSHOT_VERSION, _PREFIX
+from hexital.exceptions import InvalidSnapshot
+from hexital.indicators import EMA, MACD, RSI, SMA
+
+
+def copy_candles(candles: List[Candle]) -> List[Candle]:
+    return [candle.clean_copy() for candle in candles]
+
+
+def assert_readings(result: Hexital, expected: Hexital):
+    for name in expected.indicators:
+        assert result.reading_as_list(name) == expected.reading_as_list(name), name
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.usefixtures("candles")
+def test_snapshot_round_trip(candles, build_indicators, columnar, tmp_path):
+    indicators = [*build_indicators(), EMA(name="EMA_HA", candlestick=HeikinAshi())]
+    strat = Hexital("Test Stratergy", copy_candles(candles), indicators, columnar=columnar)
+    strat.calculate()
+    strat.save_snapshot(tmp_path / "strat.hex")
+
+    result = Hexital.load_snapshot(tmp_path / "strat.hex")
+    assert result.settings == strat.settings
+    assert result.columnar == columnar
+    assert_readings(result, strat)
+    assert result.candles("T5")[-1].as_list() == strat.candles("T5")[-1].as_list()
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.usefixtures("candles")
+def test_snapshot_append(candles, columnar, tmp_path):
+    indicators = [EMA(), RSI(), MACD(), SMA(timeframe="T5")]
+    expected = Hexital("Test Stratergy", copy_candles(candles), indicators, columnar=columnar)
+    expected.calculate()
+
+    indicators = [EMA(), RSI(), MACD(), SMA(timeframe="T5")]
+    strat = Hexital("Test Stratergy", copy_candles(candles[:300]), indicators, columnar=columnar)
+    strat.calculate()
+    strat.save_snapshot(tmp_path / "strat.hex")
+
+    result = Hexital.load_snapshot(tmp_path / "strat.hex")
+    for candle in candles[300:]:
+        result.append(candle.clean_copy())
+
+    assert_readings(result, expected)
+
+
+def test_snapshot_invalid(tmp_path):
+    path = tmp_path / "strat.hex"
+
+    path.write_bytes(b"HEX")
+    with pytest.raises(InvalidSnapshot):
+        Hexital.load_snapshot(path)
+
+    path.write_bytes(_PREFIX.pack(b"NOTHEXIT", SNAPSHOT_VERSION, 0))
+    with pytest.raises(InvalidSnapshot):
+        Hexital.load_snapshot(path)
+
+    path.write_bytes(_PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION + 1, 0))
+    with pytest.raises(InvalidSnapshot):
+        Hexital.load_snapshot(path)
@@ -0,0 +1,78 @@
+import pytest
+from hexital import Hexital, HexitalUniverse
+from hexital.exceptions import InvalidIndicator
+from hexital.indicators import EMA, MACD, SMA
+
+
+@pytest.fixture(name="universe", params=[0, 2])
+def fixture_universe(request):
+    universe = HexitalUniverse("Test Universe", [EMA(), MACD()], workers=request.param)
+    yield universe
+    universe.close()
+
+
+@pytest.mark.usefixtures("candles")
+def test_universe_append(universe, candles):
+    expected = Hexital("Test Universe", [], [EMA(), MACD()])
+    expected.append(candles[:100])
+
+    readings = universe.append({"AAA": candles[:100], "BBB": candles[:50]})
+    assert readings["AAA"] == {
+        "EMA_10": expected.reading("EMA_10"),
+        "MACD_12_26_9": expected.reading("MACD_12_26_9"),
+    }
+
+    for candle in candles[100:110]:
+        expected.append(candle)
+        readings = universe.append({"AAA": candle})
+        assert list(readings) == ["AAA"]
+        assert readings["AAA"]["EMA_10"] == expected.reading("EMA_10")
+
+    assert sorted(universe.symbols) == ["AAA", "BBB"]
+    assert universe.reading("AAA", "EMA_10") == expected.reading("EMA_10")
+
+
+@pytest.mark.usefixtures("candles")
+def test_universe_readings(universe, candles):
+    universe.append({symbol: candles[:30] for symbol in ["AAA", "BBB", "CCC"]})
+
+    assert sorted(universe.readings()) == ["AAA", "BBB", "CCC"]
+    assert list(universe.readings(["BBB", "ZZZ"])) == ["BBB"]
+
+    universe.remove("BBB")
+    assert sorted(universe.symbols) == ["AAA", "CCC"]
+    assert universe.reading("BBB", "EMA_10") is None
+
+
+@pytest.mark.usefixtures("candles")
+def test_universe_settings(candles):
+    with HexitalUniverse("Test Universe", [SMA()], timeframe="T5") as universe:
+        universe.append({"AAA": candles})
+        assert universe.settings["timeframe"] == "T5"
+        assert universe.reading("AAA", "SMA_10") is not None
+
+
+def test_universe_error():
+    with HexitalUniverse("Test Universe", [EMA()], workers=1) as universe:
+        with pytest.raises(TypeError):
+            universe.append({"AAA": ["invalid"]})
+
+
+@pytest.mark.usefixtures("candles")
+def test_universe_shard_error(candles):
+    with HexitalUniverse("Test Universe", [EMA()], workers=2) as universe:
+        symbols = ["AAA", "BBB", "CCC", "DDD"]
+        valid = next(symbol for symbol in symbols if universe.shard(symbol) == 1)
+        invalid = next(symbol for symbol in symbols if universe.shard(symbol) == 0)
+
+        with pytest.raises(TypeError):
+            universe.append({valid: candles[:30], invalid: ["invalid"]})
+
+        assert valid in universe.symbols
+        assert universe.readings([valid]) == {valid: {"EMA_10": universe.reading(valid, "EMA_10")}}
+        assert universe.reading(valid, "EMA_10") is not None
+
+
+def test_universe_invalid_indicator():
+    with pytest.raises(InvalidIndicator):
+        HexitalUniverse("Test Universe", [{"indicator": "Fake"}])
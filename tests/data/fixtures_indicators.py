@@ -0,0 +1,57 @@
+from typing import Callable, List
+
+import pytest
+from hexital.core.indicator import Indicator
+from hexital.indicators import (
+    ADX,
+    AROON,
+    ATR,
+    BBANDS,
+    CMO,
+    EMA,
+    HL,
+    HMA,
+    KC,
+    MACD,
+    ROC,
+    RSI,
+    SMA,
+    STDEV,
+    STOCH,
+    VWMA,
+    WMA,
+    Donchian,
+    Supertrend,
+)
+
+
+@pytest.fixture(name="build_indicators")
+def fixture_build_indicators() -> Callable[[], List[Indicator]]:
+    """Builds a fresh set of Indicators, covering sub and managed Indicators, recursive and
+    windowed warmups and timeframes"""
+
+    def build_indicators() -> List[Indicator]:
+        return [
+            EMA(period=5),
+            SMA(),
+            WMA(),
+            HL(period=20),
+            Donchian(),
+            STDEV(),
+            BBANDS(),
+            RSI(period=5),
+            ATR(period=5),
+            MACD(fast_period=3, slow_period=6, signal_period=4),
+            ROC(),
+            ADX(period=5),
+            STOCH(),
+            CMO(period=5),
+            AROON(),
+            KC(period=5),
+            HMA(),
+            VWMA(),
+            Supertrend(),
+            SMA(timeframe="T5"),
+        ]
+
+    return build_indicators
@@ -0,0 +1,84 @@
+import random
+import time
+from datetime import datetime, timedelta
+
+from hexital import Candle, Hexital
+
+COUNT = 20000
+REPEATS = 3
+
+
+def generate_random_candles(count: int) -> list:
+    data = []
+    start = datetime(2032, 1, 1)
+
+    for i in range(count):
+        data.append(
+            [
+                start + timedelta(minutes=i),
+                random.randint(0, 9000000),
+                random.randint(0, 9000000),
+                random.randint(0, 9000000),
+                random.randint(0, 9000000),
+                random.randint(0, 10000),
+            ],
+        )
+
+    return data
+
+
+def build_strategy(columnar: bool) -> Hexital:
+    return Hexital(
+        "Test Stratergy",
+        [],
+        [{"indicator": "EMA"}, {"indicator": "EMA", "timeframe": "T5"}],
+        columnar=columnar,
+    )
+
+
+def append_dict(data: list, columnar: bool) -> float:
+    candles = [Candle.from_list(candle).as_dict() for candle in data]
+    hexitl = build_strategy(columnar)
+    start_time = time.perf_counter()
+    for candle in candles:
+        hexitl.append(candle)
+    return time.perf_counter() - start_time
+
+
+def append_list(data: list, columnar: bool) -> float:
+    hexitl = build_strategy(columnar)
+    start_time = time.perf_counter()
+    for candle in data:
+        hexitl.append(candle)
+    return time.perf_counter() - start_time
+
+
+def append_candle(data: list, columnar: bool) -> float:
+    candles = Candle.from_lists(data)
+    hexitl = build_strategy(columnar)
+    start_time = time.perf_counter()
+    for candle in candles:
+        hexitl.append(candle)
+    return time.perf_counter() - start_time
+
+
+def append_ohlcv(data: list, columnar: bool) -> float:
+    hexitl = build_strategy(columnar)
+    start_time = time.perf_counter()
+    for candle in data:
+        hexitl.append_ohlcv(*candle)
+    return time.perf_counter() - start_time
+
+
+def run_tests():
+    data = generate_random_candles(COUNT)
+
+    for columnar in [False, True]:
+        print(f"Columnar: {columnar}, appending {COUNT} Candles, per append latency:")
+        for method in [append_dict, append_list, append_candle, append_ohlcv]:
+            best = min(method(data, columnar) for _ in range(REPEATS))
+            print(f"    {method.__name__:<14} {best / COUNT * 1_000_000:8.2f} µs")
+
+
+if __name__ == "__main__":
+    run_tests()
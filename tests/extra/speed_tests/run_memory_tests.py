@@ -0,0 +1,92 @@
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from hexital import Candle
+from hexital.utils.timeframe import convert_timeframe_to_timedelta
+
+CANDLE_COUNT = 1_000_000
+
+
+class DictCandle:
+    """Candle layout prior to `__slots__`, kept to benchmark against"""
+
+    def __init__(
+        self,
+        open,
+        high,
+        low,
+        close,
+        volume,
+        timestamp=None,
+        timeframe=None,
+        indicators=None,
+        sub_indicators=None,
+    ):
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.timeframe = convert_timeframe_to_timedelta(timeframe) if timeframe else None
+
+        self.tag = None
+        self.aggregation_factor = 1
+
+        if isinstance(timestamp, datetime):
+            self.timestamp = timestamp
+        elif isinstance(timestamp, str):
+            self.timestamp = datetime.fromisoformat(timestamp)
+        else:
+            self.timestamp = None
+
+        self.refs = {}
+        self.indicators = indicators if indicators else {}
+        self.sub_indicators = sub_indicators if sub_indicators else {}
+
+
+def generate_candles(count: int) -> list:
+    start = datetime(2032, 1, 1)
+    return [
+        [start + timedelta(minutes=i), 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 100]
+        for i in range(count)
+    ]
+
+
+def measure(name: str, build, raw: list):
+    gc.collect()
+    start_time = time.perf_counter()
+    candles = build(raw)
+    elapsed = time.perf_counter() - start_time
+    del candles
+
+    gc.collect()
+    tracemalloc.start()
+    candles = build(raw)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del candles
+
+    print(
+        f"{name:<24} {elapsed:>7.2f}s  {memory / 1024 / 1024:>8.1f}MB  "
+        f"{memory / len(raw):>6.0f} bytes/candle"
+    )
+
+
+def run_tests():
+    raw = generate_candles(CANDLE_COUNT)
+    raw_dicts = [
+        {"timestamp": t, "open": o, "high": h, "low": lo, "close": c, "volume": v}
+        for t, o, h, lo, c, v in raw
+    ]
+
+    print(f"Candles: {CANDLE_COUNT}")
+    measure("Before (dict Candle)", lambda r: [DictCandle(*c[1:], c[0]) for c in r], raw)
+    measure("After (slotted Candle)", lambda r: [Candle(*c[1:], c[0]) for c in r], raw)
+    measure("Candle.from_lists", Candle.from_lists, raw)
+    measure("Candle.from_dicts", Candle.from_dicts, raw_dicts)
+
+
+if __name__ == "__main__":
+    run_tests()
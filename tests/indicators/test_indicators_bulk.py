@@ -0,0 +1,105 @@
+import pytest
+from hexital import Hexital, indicators
+from hexital.utils import vectorized
+
+from .indicator_testbase import IndicatorTestBase
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture(name="bulk", autouse=True)
+def fixture_bulk(monkeypatch):
+    monkeypatch.setattr(vectorized, "BULK_THRESHOLD", 1)
+
+
+def calculate_incremental(monkeypatch, indicator):
+    monkeypatch.setattr(vectorized, "BULK_THRESHOLD", None)
+    indicator.calculate()
+    monkeypatch.setattr(vectorized, "BULK_THRESHOLD", 1)
+
+
+class TestIndicatorsBulk(IndicatorTestBase):
+    @pytest.mark.parametrize(
+        "name, expected, amount",
+        [
+            ("ATR", "expected_atr", 0),
+            ("BBANDS", "expected_bbands", 0),
+            ("EMA", "expected_ema", 0),
+            ("MACD", "expected_macd", 400),
+            ("OBV", "expected_obv", 0),
+            ("RMA", "expected_rma", 0),
+            ("ROC", "expected_roc", 0),
+            ("RSI", "expected_rsi", 0),
+            ("SMA", "expected_sma", 0),
+            ("STDEV", "expected_stdev", 0),
+            ("TR", "expected_tr", 0),
+            ("WMA", "expected_wma", 0),
+        ],
+    )
+    def test_bulk(self, request, candles, name, expected, amount):
+        test = getattr(indicators, name)(candles=candles)
+        test.calculate()
+        assert self.verify(test.readings(), request.getfixturevalue(expected), amount=amount)
+
+    @pytest.mark.parametrize(
+        "name", ["EMA", "RMA", "RSI", "MACD", "BBANDS", "STDEV", "ATR", "OBV", "SMA", "WMA"]
+    )
+    def test_bulk_matches_incremental(self, monkeypatch, candles, name):
+        expected = getattr(indicators, name)(candles=candles)
+        calculate_incremental(monkeypatch, expected)
+
+        test = getattr(indicators, name)(candles=[])
+        test.append(candles)
+
+        assert test.readings() == expected.readings()
+        for sub in test.sub_indicators.values():
+            assert self.verify(sub.readings(), expected.sub_indicators[sub.name].readings())
+
+    @pytest.mark.parametrize("name", ["EMA", "RMA", "RSI", "MACD", "STDEV", "ATR", "OBV"])
+    def test_bulk_resume(self, monkeypatch, candles, name):
+        expected = getattr(indicators, name)(candles=candles)
+        calculate_incremental(monkeypatch, expected)
+
+        test = getattr(indicators, name)(candles=candles[:5])
+        calculate_incremental(monkeypatch, test)
+        test.append(candles[5:300])
+        test.append(candles[300:-1])
+        monkeypatch.setattr(vectorized, "BULK_THRESHOLD", 1000)
+        test.append(candles[-1])
+
+        assert test.readings() == expected.readings()
+
+    def test_bulk_threshold(self, monkeypatch, candles):
+        monkeypatch.undo()
+        assert vectorized.BULK_THRESHOLD == 1000
+        test = indicators.EMA(candles=candles)
+        assert not test._bulk_calculable(0)
+
+        monkeypatch.setattr(vectorized, "BULK_THRESHOLD", None)
+        test = indicators.EMA(candles=candles)
+        assert not test._bulk_calculable(0)
+
+        monkeypatch.setattr(vectorized, "BULK_THRESHOLD", 100)
+        assert test._bulk_calculable(0)
+
+    def test_bulk_unsupported_source(self, candles, expected_ema):
+        strat = Hexital(
+            "Test Stratergy", candles, [indicators.SMA(period=1), indicators.EMA(source="SMA_1")]
+        )
+        strat.calculate()
+        assert self.verify(strat.reading_as_list("EMA_10"), expected_ema)
+
+    def test_bulk_no_numpy(self, monkeypatch, candles, expected_ema):
+        monkeypatch.setattr(vectorized, "np", None)
+        test = indicators.EMA(candles=candles)
+        test.calculate()
+        assert self.verify(test.readings(), expected_ema)
+
+    def test_bulk_hexital_columnar(self, candles, expected_ema, expected_rsi):
+        strat = Hexital(
+            "Test Stratergy", candles, [indicators.EMA(), indicators.RSI()], columnar=True
+        )
+        strat.calculate()
+
+        assert self.verify(strat.reading_as_list("EMA_10"), expected_ema)
+        assert self.verify(strat.reading_as_list("RSI_14"), expected_rsi)
@@ -2,9 +2,11 @@ from typing import List
 
 import pytest
 from hexital.core.candle import Candle
+from hexital.core.candle_store import CandleStore
 from hexital.utils.candles import (
     candles_sum,
     get_readings_period,
+    reading_accessor,
     reading_by_index,
     reading_count,
     reading_period,
@@ -76,6 +78,18 @@ class TestReadByIndex:
         assert reading_by_index(minimal_candles, "SSATR.nested", index=5) == 611
 
 
+@pytest.mark.usefixtures("minimal_candles")
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize(
+    "name", ["high", "timestamp", "ATR", "NATR", "NATR.nested", "SATR", "SSATR.nested", "FAKE"]
+)
+def test_reading_accessor(minimal_candles: List[Candle], name: str, columnar: bool):
+    candles = CandleStore(minimal_candles) if columnar else minimal_candles
+    accessor = reading_accessor(candles, name)
+    for index in [0, 5, -1]:
+        assert accessor(index) == reading_by_index(candles, name, index)
+
+
 @pytest.mark.usefixtures("minimal_candles")
 def test_reading_count(minimal_candles: List[Candle]):
     assert reading_count(minimal_candles, "open") == 20
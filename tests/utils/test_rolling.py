@@ -0,0 +1,169 @@
+from datetime import timedelta
+from typing import List
+
+import pytest
+from hexital.analysis.movement import highestbar, lowestbar
+from hexital.analysis.utils import highest, lowest
+from hexital.core.candle import Candle
+from hexital.indicators import HL, VWMA
+from hexital.utils.candles import candles_average, candles_sum
+from hexital.utils.rolling import RollingExtreme, RollingSum
+
+
+class TestRollingExtreme:
+    @pytest.mark.usefixtures("candles")
+    def test_rolling_highest(self, candles: List[Candle]):
+        rolling = RollingExtreme("high", 10)
+        for index in range(len(candles)):
+            rolling.update(candles, index)
+            assert rolling.reading == highest(candles, "high", 10, index)
+
+    @pytest.mark.usefixtures("candles")
+    def test_rolling_lowest(self, candles: List[Candle]):
+        rolling = RollingExtreme("low", 10, highest=False)
+        for index in range(len(candles)):
+            rolling.update(candles, index)
+            assert rolling.reading == lowest(candles, "low", 10, index)
+
+    @pytest.mark.usefixtures("candles")
+    def test_rolling_offset(self, candles: List[Candle]):
+        highs = RollingExtreme("high", 15)
+        lows = RollingExtreme("low", 15, highest=False)
+        for index in range(15, len(candles)):
+            highs.update(candles, index)
+            lows.update(candles, index)
+            assert highs.offset == highestbar(candles, "high", 15, index)
+            assert lows.offset == lowestbar(candles, "low", 15, index)
+
+    def test_rolling_tie_latest(self):
+        candles = [Candle(1, 5, 1, 1, 1), Candle(1, 3, 1, 1, 1), Candle(1, 5, 1, 1, 1)]
+        rolling = RollingExtreme("high", 3)
+        for index in range(len(candles)):
+            rolling.update(candles, index)
+
+        assert rolling.reading == 5
+        assert rolling.offset == 0
+
+    @pytest.mark.usefixtures("candles")
+    def test_rolling_rebuild(self, candles: List[Candle]):
+        rolling = RollingExtreme("high", 10)
+        for index in range(50):
+            rolling.update(candles, index)
+
+        candles[49].high = 999999
+        rolling.update(candles, 49)
+        assert rolling.reading == 999999
+
+        rolling.update(candles, 20)
+        assert rolling.reading == highest(candles, "high", 10, 20)
+
+        rolling.update(candles[5:], 21)
+        assert rolling.reading == highest(candles[5:], "high", 10, 21)
+
+    @pytest.mark.usefixtures("candles")
+    def test_rolling_trimmed(self, candles: List[Candle]):
+        rolling = RollingExtreme("high", 10)
+        trimmed = []
+        for index in range(len(candles)):
+            trimmed.append(candles[index])
+            if len(trimmed) > 12:
+                del trimmed[:1]
+            offset = index + 1 - len(trimmed)
+            rolling.update(trimmed, index - offset, offset)
+            assert rolling.reading == highest(candles, "high", 10, index)
+            assert rolling.offset == highestbar(candles, "high", 10, index)
+
+    @pytest.mark.usefixtures("candles")
+    def test_rolling_candle_life(self, monkeypatch, candles: List[Candle]):
+        resets = []
+        reset = RollingExtreme.reset
+        monkeypatch.setattr(RollingExtreme, "reset", lambda self: resets.append(reset(self)))
+
+        expected = HL(candles=[c.clean_copy() for c in candles], period=10)
+        expected.calculate()
+        resets.clear()
+        test = HL(candles=[], period=10, candle_life=timedelta(minutes=30))
+        for candle in candles:
+            test.append(candle.clean_copy())
+
+        assert len(test.candles) < len(candles)
+        assert len(resets) == 4
+        assert test.readings() == expected.readings()[-len(test.candles) :]
+
+    def test_rolling_empty(self):
+        rolling = RollingExtreme("high", 10)
+        assert rolling.reading is None
+        assert rolling.offset == 0
+
+
+class TestRollingSum:
+    @pytest.mark.usefixtures("candles")
+    def test_rolling_sum(self, candles: List[Candle]):
+        rolling = RollingSum("volume", 10)
+        for index in range(len(candles)):
+            rolling.update(candles, index + 1)
+            assert rolling.total == pytest.approx(candles_sum(candles, "volume", 10, index))
+            assert rolling.average == pytest.approx(candles_average(candles, "volume", 10, index))
+
+    @pytest.mark.usefixtures("candles")
+    def test_rolling_sum_exclude_latest(self, candles: List[Candle]):
+        rolling = RollingSum("close", 5)
+        for index in range(len(candles)):
+            rolling.update(candles, index)
+            assert rolling.total == pytest.approx(candles_sum(candles, "close", 5, index, False))
+
+    def test_rolling_sum_zeros(self):
+        candles = [Candle(1, 1, 1, 1, volume) for volume in [0.1, 0.2, 0.3, 0, 0, 0]]
+        rolling = RollingSum("volume", 3)
+        for index in range(len(candles)):
+            rolling.update(candles, index + 1)
+
+        assert rolling.total == 0
+        assert rolling.average == 0
+
+    @pytest.mark.usefixtures("candles")
+    def test_rolling_sum_rebuild(self, candles: List[Candle]):
+        rolling = RollingSum("volume", 10)
+        for index in range(50):
+            rolling.update(candles, index + 1)
+
+        candles[49].volume = 999999
+        rolling.update(candles, 50)
+        assert rolling.total == pytest.approx(candles_sum(candles, "volume", 10, 49))
+
+        rolling.update(candles, 21)
+        assert rolling.total == pytest.approx(candles_sum(candles, "volume", 10, 20))
+
+        rolling.update(candles[5:], 22)
+        assert rolling.total == pytest.approx(candles_sum(candles[5:], "volume", 10, 21))
+
+    @pytest.mark.usefixtures("candles")
+    def test_rolling_sum_trimmed(self, candles: List[Candle]):
+        rolling = RollingSum("volume", 10)
+        trimmed = []
+        for index in range(len(candles)):
+            trimmed.append(candles[index])
+            if len(trimmed) > 12:
+                del trimmed[:1]
+            offset = index + 1 - len(trimmed)
+            rolling.update(trimmed, index - offset + 1, offset)
+            assert rolling.total == pytest.approx(candles_sum(candles, "volume", 10, index))
+
+    @pytest.mark.usefixtures("candles")
+    def test_rolling_sum_candle_life(self, monkeypatch, candles: List[Candle]):
+        resets = []
+        reset = RollingSum.reset
+        monkeypatch.setattr(RollingSum, "reset", lambda self: resets.append(reset(self)))
+
+        test = VWMA(candles=[], candle_life=timedelta(minutes=30))
+        for candle in candles:
+            test.append(candle.clean_copy())
+
+        assert len(test.candles) < len(candles)
+        assert len(resets) <= 2 + len(candles) // test.period
+
+    def test_rolling_sum_empty(self):
+        rolling = RollingSum("volume", 10)
+        rolling.update([], 0)
+        assert rolling.total == 0
+        assert rolling.average == 0
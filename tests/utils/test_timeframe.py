@@ -6,6 +6,7 @@ from hexital.exceptions import InvalidTimeFrame
 from hexital.utils.timeframe import (
     round_down_timestamp,
     timedelta_to_str,
+    timeframe_end,
     timeframe_to_timedelta,
     within_timeframe,
 )
@@ -123,3 +124,20 @@ class TestWithinTimeframe:
         assert within_timeframe(
             datetime(2024, 6, 9, 9, 5, 0), datetime(2024, 6, 9, 9, 5, 0), timedelta(minutes=5)
         )
+
+
+class TestTimeframeEnd:
+    def test_end_basic(self):
+        assert timeframe_end(datetime(2024, 6, 9, 9, 0, 1), timedelta(minutes=5)) == datetime(
+            2024, 6, 9, 9, 5, 0
+        )
+
+    def test_end_on(self):
+        assert timeframe_end(datetime(2024, 6, 9, 9, 5, 0), timedelta(minutes=5)) == datetime(
+            2024, 6, 9, 9, 5, 0
+        )
+
+    def test_end_remove_mili(self):
+        assert timeframe_end(datetime(2024, 6, 9, 9, 5, 0, 3857), timedelta(minutes=5)) == datetime(
+            2024, 6, 9, 9, 5, 0
+        )